@@ -0,0 +1,303 @@
+import sys
+from pathlib import Path
+
+current_file_path = Path(__file__).resolve()
+parent_directory = current_file_path.parent.parent
+sys.path.append(str(parent_directory))
+
+import random
+import importlib.util
+import networkx as nx
+
+from abc import ABC, abstractmethod
+from types import ModuleType
+from typing import Callable, Dict, List, Optional, Tuple
+from networkx.algorithms import bipartite
+from structs.random_graph_generator import GenerateRandomGraph
+from structs.random_digraph_generator import GenerateRandomDigraph
+from structs.matroids import GraphMatroid, PartitionMatroid, UnweightedGraphMatroid
+
+# Benchmark-Fälle für alle Algorithmen des Projekts. Jeder Fall erzeugt für eine Größe n und eine Dichte
+# (Kantenwahrscheinlichkeit in Prozent wie bei GenerateRandomGraph) mit festem Seed eine Instanz und gibt die
+# zu messende Funktion zurück. Der Aufbau der Instanz wird nicht mitgemessen.
+
+# Lädt ein Skript aus combinatorics/ oder gurobi/ unter eindeutigem Namen, da mehrere Skripte gleich heißen
+# (z.B. weighted_intersection.py). Das Verzeichnis des Skripts wird für Importe von Nachbarmodulen eingetragen.
+_modules: Dict[str, ModuleType] = {}
+
+def load_module(relative_path: str) -> ModuleType:
+    if relative_path not in _modules:
+        path: Path = parent_directory / relative_path
+        if str(path.parent) not in sys.path:
+            sys.path.append(str(path.parent))
+        name: str = "benchmark_" + relative_path.replace("/", "_").removesuffix(".py")
+        spec = importlib.util.spec_from_file_location(name, path)
+        module: ModuleType = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[relative_path] = module
+    return _modules[relative_path]
+
+class Benchmark(ABC):
+    name: str = ""
+    sizes: Tuple[int, ...] = ()
+    densities: Tuple[int, ...] = ()
+    # Optionales Modul, ohne das der Fall übersprungen wird (z.B. gurobipy).
+    requires: Optional[str] = None
+
+    def __init__(self) -> None:
+        # Instanz des zuletzt vorbereiteten Algorithmus, deren Zähler nach dem Lauf ausgelesen werden.
+        self.algorithm = None
+
+    def available(self) -> bool:
+        return self.requires is None or importlib.util.find_spec(self.requires) is not None
+
+    # Erzeugt die Instanz und gibt (zu messende Funktion, Anzahl Knoten, Anzahl Kanten) zurück.
+    @abstractmethod
+    def prepare(self, n: int, density: int, seed: int) -> Tuple[Callable[[], object], int, int]:
+        pass
+
+    # Aktiviert die Zähler (structs/instrumentation.py) des zuletzt vorbereiteten Algorithmus, falls vorhanden.
+    def enable_stats(self) -> None:
+        if hasattr(self.algorithm, 'enable_stats'):
+            self.algorithm.enable_stats()
+
+    # Operationszähler des letzten Laufs, sofern der Algorithmus welche erfasst.
+    def operations(self) -> Dict[str, float]:
+        stats = getattr(self.algorithm, 'stats', None)
+        return stats.as_dict() if stats is not None else {}
+
+def random_graph(n: int, density: int, seed: int) -> nx.Graph:
+    return GenerateRandomGraph(n, density, seed=seed).generate_fast()
+
+def random_bipartite_graph(n: int, density: int, seed: int) -> nx.Graph:
+    graph: nx.Graph = bipartite.random_graph(n, n, density / 100, seed=seed)
+    rng = random.Random(seed)
+    for u, v in graph.edges():
+        graph[u][v]['weight'] = rng.randint(1, 15)
+    return graph
+
+class PrimBenchmark(Benchmark):
+    name = "mst.prim"
+    sizes = (250, 500, 1000, 2000)
+    densities = (5, 25)
+
+    def prepare(self, n: int, density: int, seed: int):
+        graph: nx.Graph = random_graph(n, density, seed)
+        self.algorithm = load_module("combinatorics/spantrees/mst.py").PrimAlgorithm(graph)
+        return self.algorithm.run_arrays, n, graph.number_of_edges()
+
+class KruskalBenchmark(Benchmark):
+    name = "mst.kruskal"
+    sizes = (250, 500, 1000, 2000)
+    densities = (5, 25)
+
+    def prepare(self, n: int, density: int, seed: int):
+        graph: nx.Graph = random_graph(n, density, seed)
+        self.algorithm = load_module("combinatorics/spantrees/mst.py").KruskalAlgorithm(graph)
+        return self.algorithm.run_arrays, n, graph.number_of_edges()
+
+class BoruvkaBenchmark(Benchmark):
+    name = "mst.boruvka"
+    sizes = (250, 500, 1000, 2000)
+    densities = (5, 25)
+
+    def prepare(self, n: int, density: int, seed: int):
+        graph: nx.Graph = random_graph(n, density, seed)
+        self.algorithm = load_module("combinatorics/spantrees/mst.py").BoruvkaAlgorithm(graph)
+        return self.algorithm.run_arrays, n, graph.number_of_edges()
+
+class NetworkxMSTBenchmark(Benchmark):
+    # Referenz für die eigenen MST-Implementierungen.
+    name = "mst.networkx"
+    sizes = (250, 500, 1000, 2000)
+    densities = (5, 25)
+
+    def prepare(self, n: int, density: int, seed: int):
+        graph: nx.Graph = random_graph(n, density, seed)
+        return lambda: nx.minimum_spanning_tree(graph), n, graph.number_of_edges()
+
+class FordFulkersonBenchmark(Benchmark):
+    name = "maxflow.ford_fulkerson"
+    sizes = (20, 40, 80, 160, 320)
+    densities = (10, 30)
+
+    def prepare(self, n: int, density: int, seed: int):
+        graph: nx.DiGraph = GenerateRandomDigraph(n, density, seed=seed).generate_fast()
+        self.algorithm = load_module("combinatorics/networkflows/ford_fulkerson.py").Algorithm(graph)
+        return lambda: self.algorithm.run(0, n - 1), n, graph.number_of_edges()
+
+class DinicBenchmark(Benchmark):
+    name = "maxflow.dinic"
+    sizes = (20, 40, 80, 160, 320)
+    densities = (10, 30)
+
+    def prepare(self, n: int, density: int, seed: int):
+        graph: nx.DiGraph = GenerateRandomDigraph(n, density, seed=seed).generate_fast()
+        self.algorithm = load_module("combinatorics/networkflows/dinic.py").Algorithm(graph)
+        return lambda: self.algorithm.run_value(0, n - 1), n, graph.number_of_edges()
+
+class PushRelabelBenchmark(Benchmark):
+    # Beide Phasen, damit wie bei den anderen Fällen eine vollständige Flusszuordnung entsteht.
+    name = "maxflow.push_relabel"
+    sizes = (20, 40, 80, 160, 320)
+    densities = (10, 30)
+
+    def prepare(self, n: int, density: int, seed: int):
+        graph: nx.DiGraph = GenerateRandomDigraph(n, density, seed=seed).generate_fast()
+        self.algorithm = load_module("combinatorics/networkflows/push_relabel.py").Algorithm(graph)
+        return lambda: self.algorithm.run(0, n - 1), n, graph.number_of_edges()
+
+class NetworkxMaxFlowBenchmark(Benchmark):
+    name = "maxflow.networkx"
+    sizes = (20, 40, 80, 160, 320)
+    densities = (10, 30)
+
+    def prepare(self, n: int, density: int, seed: int):
+        graph: nx.DiGraph = GenerateRandomDigraph(n, density, seed=seed).generate_fast()
+        return lambda: nx.maximum_flow_value(graph, 0, n - 1), n, graph.number_of_edges()
+
+class MinCostFlowBenchmark(Benchmark):
+    # density ist hier die mittlere Anzahl ausgehender Kanten, n // 20 Anbieter und Nachfrager mit je 30 Einheiten.
+    name = "mincostflow.cost_scaling"
+    sizes = (250, 500, 1000, 2000, 4000, 10000)
+    densities = (5, 10)
+    scaling = True
+
+    def prepare(self, n: int, density: int, seed: int):
+        module: ModuleType = load_module("combinatorics/networkflows/min_cost_flow.py")
+        graph: nx.DiGraph = module.random_instance(n, n * density, max(1, n // 20), 30, seed=seed)
+        self.algorithm = module.Algorithm(graph)
+        return lambda: self.algorithm.run_cost(self.scaling), n, graph.number_of_edges()
+
+class MinCostFlowSSPBenchmark(MinCostFlowBenchmark):
+    # SSP ohne den Vorlauf mit Kostenskalierung.
+    name = "mincostflow.primal_dual"
+    scaling = False
+
+class NetworkxMinCostFlowBenchmark(Benchmark):
+    name = "mincostflow.networkx"
+    sizes = (250, 500, 1000, 2000, 4000, 10000)
+    densities = (5, 10)
+
+    def prepare(self, n: int, density: int, seed: int):
+        module: ModuleType = load_module("combinatorics/networkflows/min_cost_flow.py")
+        graph: nx.DiGraph = module.random_instance(n, n * density, max(1, n // 20), 30, seed=seed)
+        return lambda: nx.min_cost_flow_cost(graph), n, graph.number_of_edges()
+
+class HungarianBenchmark(Benchmark):
+    # Vollständig bipartit, da die Implementierung ein perfektes Matching voraussetzt.
+    name = "matching.hungarian"
+    sizes = (10, 20, 30)
+    densities = (100,)
+
+    def prepare(self, n: int, density: int, seed: int):
+        graph: nx.Graph = random_bipartite_graph(n, density, seed)
+        self.algorithm = load_module("combinatorics/matching/hungarian.py").Algorithm(graph)
+        return self.algorithm.run, 2 * n, graph.number_of_edges()
+
+class MatroidGreedyBenchmark(Benchmark):
+    name = "matroids.greedy"
+    sizes = (20, 40, 80)
+    densities = (10, 30)
+
+    def prepare(self, n: int, density: int, seed: int):
+        graph: nx.Graph = random_graph(n, density, seed)
+        self.algorithm = load_module("combinatorics/matroids/greedy.py").Algorithm(GraphMatroid(graph))
+        return self.algorithm.run, n, graph.number_of_edges()
+
+class MatroidIntersectionBenchmark(Benchmark):
+    # Regenbogenwald: Graphmatroid geschnitten mit einem Partitionsmatroid über n // 2 Farben.
+    name = "matroids.intersection"
+    sizes = (10, 20, 40)
+    densities = (20, 40)
+
+    def prepare(self, n: int, density: int, seed: int):
+        graph: nx.Graph = random_graph(n, density, seed)
+        rng = random.Random(seed)
+        colors: Dict[int, List] = {}
+        for edge in graph.edges():
+            colors.setdefault(rng.randint(1, max(1, n // 2)), []).append(edge)
+        module: ModuleType = load_module("combinatorics/matroids/intersection.py")
+        self.algorithm = module.Algorithm(UnweightedGraphMatroid(graph), PartitionMatroid([set(edges) for edges in colors.values()]))
+        return self.algorithm.run, n, graph.number_of_edges()
+
+class WeightedMatroidIntersectionBenchmark(Benchmark):
+    # Vollständig bipartit, damit bipartite.sets die Seiten eindeutig bestimmen kann.
+    name = "matroids.weighted_intersection"
+    sizes = (5, 10, 20)
+    densities = (100,)
+
+    def prepare(self, n: int, density: int, seed: int):
+        graph: nx.Graph = random_bipartite_graph(n, density, seed)
+        weights = nx.get_edge_attributes(graph, 'weight')
+        self.algorithm = load_module("combinatorics/matroids/weighted_intersection.py").Algorithm(graph, weights)
+        return self.algorithm.run, 2 * n, graph.number_of_edges()
+
+class GurobiMSTBenchmark(Benchmark):
+    name = "gurobi.mst"
+    sizes = (10, 20, 40)
+    densities = (100,)
+    requires = "gurobipy"
+
+    def prepare(self, n: int, density: int, seed: int):
+        module: ModuleType = load_module("gurobi/spantrees/mst.py")
+        random.seed(seed)
+        graph: nx.Graph = module.create_weighted_complete_graph(n)
+        return lambda: module.solve_mst_with_gurobi(graph), n, graph.number_of_edges()
+
+class GurobiTSPBenchmark(Benchmark):
+    name = "gurobi.tsp"
+    sizes = (10, 20, 40)
+    densities = (100,)
+    requires = "gurobipy"
+
+    def prepare(self, n: int, density: int, seed: int):
+        module: ModuleType = load_module("gurobi/spantrees/tsp.py")
+        random.seed(seed)
+        graph: nx.Graph = module.create_complete_graph(n)
+        return lambda: module.solve_tsp(graph), n, graph.number_of_edges()
+
+class GurobiMatchingBenchmark(Benchmark):
+    name = "gurobi.matching"
+    sizes = (20, 40, 80)
+    densities = (30, 60)
+    requires = "gurobipy"
+
+    def prepare(self, n: int, density: int, seed: int):
+        module: ModuleType = load_module("gurobi/matching/matching.py")
+        graph: nx.Graph = random_bipartite_graph(n, density, seed)
+        return lambda: module.solve_maximum_matching(graph), 2 * n, graph.number_of_edges()
+
+class GurobiWeightedIntersectionBenchmark(Benchmark):
+    name = "gurobi.weighted_intersection"
+    sizes = (5, 10, 20)
+    densities = (100,)
+    requires = "gurobipy"
+
+    def prepare(self, n: int, density: int, seed: int):
+        module: ModuleType = load_module("gurobi/matroids/weighted_intersection.py")
+        graph: nx.Graph = random_bipartite_graph(n, density, seed)
+        weights = nx.get_edge_attributes(graph, 'weight')
+        return lambda: module.weighted_matching(graph, weights), 2 * n, graph.number_of_edges()
+
+BENCHMARKS: List[Benchmark] = [
+    PrimBenchmark(),
+    KruskalBenchmark(),
+    BoruvkaBenchmark(),
+    NetworkxMSTBenchmark(),
+    FordFulkersonBenchmark(),
+    DinicBenchmark(),
+    PushRelabelBenchmark(),
+    NetworkxMaxFlowBenchmark(),
+    MinCostFlowBenchmark(),
+    MinCostFlowSSPBenchmark(),
+    NetworkxMinCostFlowBenchmark(),
+    HungarianBenchmark(),
+    MatroidGreedyBenchmark(),
+    MatroidIntersectionBenchmark(),
+    WeightedMatroidIntersectionBenchmark(),
+    GurobiMSTBenchmark(),
+    GurobiTSPBenchmark(),
+    GurobiMatchingBenchmark(),
+    GurobiWeightedIntersectionBenchmark(),
+]
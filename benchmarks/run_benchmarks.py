@@ -0,0 +1,185 @@
+import sys
+from pathlib import Path
+
+current_file_path = Path(__file__).resolve()
+sys.path.append(str(current_file_path.parent))
+
+import argparse
+import json
+import platform
+import signal
+import statistics
+import time
+import tracemalloc
+import numpy as np
+
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from cases import BENCHMARKS, Benchmark
+
+# Führt die Benchmark-Fälle aus cases.py über ein Raster aus Größen und Dichten aus und schreibt
+# Laufzeit, Spitzenspeicher und Operationszähler als JSON. Zwei Ergebnisdateien lassen sich vergleichen,
+# Verschlechterungen über einem Schwellwert werden gemeldet.
+#
+#   python benchmarks/run_benchmarks.py run --output results.json [--quick] [--only mst maxflow]
+#   python benchmarks/run_benchmarks.py compare old.json new.json [--threshold 0.1]
+
+# Maximale Laufzeit einer einzelnen Messung in Sekunden, danach wird der Fall als Timeout vermerkt.
+TIMEOUT: int = 60
+
+class BenchmarkTimeout(Exception):
+    pass
+
+def _on_timeout(signum, frame) -> None:
+    raise BenchmarkTimeout()
+
+# Führt eine Messung mit Zeitlimit aus, gibt die Laufzeit in Sekunden oder None bei Timeout zurück.
+def timed(run, timeout: int) -> Optional[float]:
+    signal.signal(signal.SIGALRM, _on_timeout)
+    signal.alarm(timeout)
+    try:
+        start: float = time.perf_counter()
+        run()
+        return time.perf_counter() - start
+    except BenchmarkTimeout:
+        return None
+    finally:
+        signal.alarm(0)
+
+def measure(benchmark: Benchmark, n: int, density: int, seed: int, repeat: int, timeout: int) -> Dict:
+    result: Dict = {"benchmark": benchmark.name, "n": n, "density": density, "seed": seed}
+    seconds: List[float] = []
+    for _ in range(repeat):
+        # Jede Wiederholung bekommt eine frische Instanz, da die Algorithmen ihren Zustand verändern.
+        run, nodes, edges = benchmark.prepare(n, density, seed)
+        elapsed: Optional[float] = timed(run, timeout)
+        if elapsed is None:
+            result.update(nodes=nodes, edges=edges, status="timeout")
+            return result
+        seconds.append(elapsed)
+
+    # Spitzenspeicher und Operationszähler werden in einem eigenen Lauf gemessen, da tracemalloc und die
+    # Zähler die Laufzeit verfälschen.
+    run, nodes, edges = benchmark.prepare(n, density, seed)
+    benchmark.enable_stats()
+    tracemalloc.start()
+    try:
+        timed(run, timeout)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    operations: Dict[str, float] = benchmark.operations()
+
+    result.update(nodes=nodes, edges=edges, status="ok", seconds=seconds, median=statistics.median(seconds),
+                  minimum=min(seconds), peak_bytes=peak, operations=operations)
+    return result
+
+# Passt log(Laufzeit) = a * log(n + m) + b an und gibt den empirischen Exponenten a je Benchmark zurück.
+def scaling_exponents(results: List[Dict]) -> Dict[str, float]:
+    points: Dict[str, List[Tuple[float, float]]] = {}
+    for result in results:
+        if result["status"] == "ok" and result["median"] > 0:
+            points.setdefault(result["benchmark"], []).append((result["nodes"] + result["edges"], result["median"]))
+    exponents: Dict[str, float] = {}
+    for name, values in points.items():
+        sizes = np.log([size for size, _ in values])
+        if len(values) >= 2 and np.ptp(sizes) > 0:
+            exponents[name] = float(np.polyfit(sizes, np.log([median for _, median in values]), 1)[0])
+    return exponents
+
+def run(output: str, only: Optional[List[str]], quick: bool, repeat: int, seed: int, timeout: int) -> None:
+    results: List[Dict] = []
+    for benchmark in BENCHMARKS:
+        if only and not any(benchmark.name.startswith(prefix) for prefix in only):
+            continue
+        if not benchmark.available():
+            print(f"{benchmark.name}: skipped, {benchmark.requires} is not installed")
+            results.append({"benchmark": benchmark.name, "status": "skipped"})
+            continue
+        # Im Schnelldurchlauf nur die beiden kleinsten Größen und die erste Dichte.
+        sizes = benchmark.sizes[:2] if quick else benchmark.sizes
+        densities = benchmark.densities[:1] if quick else benchmark.densities
+        for density in densities:
+            for n in sizes:
+                result: Dict = measure(benchmark, n, density, seed, repeat, timeout)
+                results.append(result)
+                if result["status"] == "ok":
+                    print(f"{benchmark.name} n={n} density={density}: {result['median']:.4f}s, "
+                          f"peak {result['peak_bytes'] / 2 ** 20:.1f} MiB")
+                else:
+                    print(f"{benchmark.name} n={n} density={density}: {result['status']}")
+
+    exponents: Dict[str, float] = scaling_exponents(results)
+    for name, exponent in exponents.items():
+        print(f"{name}: time ~ (n + m)^{exponent:.2f}")
+
+    document: Dict = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "seed": seed,
+            "quick": quick,
+        },
+        "results": results,
+        "scaling": exponents,
+    }
+    with open(output, "w") as file:
+        json.dump(document, file, indent=2)
+
+# Vergleicht zwei Ergebnisdateien und gibt die Anzahl der Verschlechterungen zurück. Verglichen werden der
+# Median der Laufzeit und der Spitzenspeicher von Fällen, die in beiden Dateien erfolgreich waren.
+def compare(old_path: str, new_path: str, threshold: float) -> int:
+    def load(path: str) -> Dict[Tuple, Dict]:
+        with open(path) as file:
+            results: List[Dict] = json.load(file)["results"]
+        return {(r["benchmark"], r.get("n"), r.get("density")): r for r in results}
+
+    old, new = load(old_path), load(new_path)
+    regressions: int = 0
+    for key in sorted(old.keys() & new.keys(), key=str):
+        before, after = old[key], new[key]
+        name: str = f"{key[0]} n={key[1]} density={key[2]}"
+        if before["status"] != "ok" or after["status"] != "ok":
+            if before["status"] == "ok" and after["status"] == "timeout":
+                print(f"REGRESSION {name}: timeout")
+                regressions += 1
+            continue
+        for metric in ("median", "peak_bytes"):
+            if before[metric] <= 0:
+                continue
+            ratio: float = after[metric] / before[metric]
+            marker: str = "REGRESSION" if ratio > 1 + threshold else ("improved" if ratio < 1 - threshold else "ok")
+            if marker != "ok":
+                print(f"{marker} {name} {metric}: {before[metric]:.4g} -> {after[metric]:.4g} ({ratio:.2f}x)")
+            if marker == "REGRESSION":
+                regressions += 1
+    print(f"{regressions} regression(s) beyond {threshold:.0%}")
+    return regressions
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark suite for all algorithms")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks and write a JSON result file")
+    run_parser.add_argument("--output", default="benchmark_results.json")
+    run_parser.add_argument("--only", nargs="*", help="benchmark name prefixes, e.g. mst maxflow")
+    run_parser.add_argument("--quick", action="store_true", help="only the smallest sizes and first density")
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--timeout", type=int, default=TIMEOUT)
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=0.1, help="relative slowdown that counts as regression")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run(args.output, args.only, args.quick, args.repeat, args.seed, args.timeout)
+    else:
+        sys.exit(1 if compare(args.old, args.new, args.threshold) else 0)
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,43 @@
+import sys
+from pathlib import Path
+
+current_file_path = Path(__file__).resolve()
+parent_directory = current_file_path.parent.parent.parent
+sys.path.append(str(parent_directory))
+
 import random
 import networkx as nx
 import matplotlib.pyplot as plt
 
 from networkx.algorithms import bipartite
-from typing import Tuple, List
+from typing import Tuple, List, Dict, Union
+from structs.csr_graph import CSRGraph
 
 class BlossomAlgorithm:
-    def __init__(self, graph: nx.Graph) -> None:
-        self.graph: nx.Graph = graph.copy()
-        self.starting_node: int = random.choice(list(self.graph.nodes))
+    def __init__(self, graph: Union[nx.Graph, CSRGraph]) -> None:
+        # Die Eingabe wird nicht kopiert, Label und Matching werden getrennt vom Graphen gespeichert.
+        self.graph: CSRGraph = graph if isinstance(graph, CSRGraph) else CSRGraph.from_networkx(graph)
+        n: int = self.graph.number_of_nodes()
+        self.starting_node: int = random.randrange(n)
+        # Label (inner/outer) jedes Knotens nach dichter Id, "" bedeutet ungelabelt.
+        self.node_labels: List[str] = [""] * n
         self.matching: nx.Graph = nx.Graph()
 
     def run(self) -> None:
         # Durchlaufen aller Nachbarn des Startknotens
-        for neighbor in self.graph.neighbors(self.starting_node):
+        for neighbor in self.graph.neighbors(self.starting_node).tolist():
             self.traverse_path(neighbor)
 
         self.create_matching()
 
     def traverse_path(self, node: int, label_index: int = 0) -> None:
         # Zuweisung eines Labels (inner/outer) zum aktuellen Knoten
-        self.graph.nodes[node]["label"], label_index = self.label_node(label_index)
+        self.node_labels[node], label_index = self.label_node(label_index)
 
         # Durchlaufen aller Nachbarn des aktuellen Knotens
-        for neighbor in self.graph.neighbors(node):
+        for neighbor in self.graph.neighbors(node).tolist():
             # Überspringen, wenn der Nachbar bereits gelabelt ist
-            if self.graph.nodes[neighbor]["label"] in ["inner", "outer"]:
+            if self.node_labels[neighbor] in ["inner", "outer"]:
                 continue
             # Rekursiver Aufruf für den Nachbarknoten
             self.traverse_path(neighbor, label_index)
@@ -41,16 +53,20 @@ class BlossomAlgorithm:
         return label, label_index
     
     def create_matching(self) -> None:
+        src, dst, _ = self.graph.edges()
         # Durchlaufen aller Kanten des Graphen
-        for u, v in self.graph.edges():
+        for u, v in zip(src.tolist(), dst.tolist()):
+            u_label, v_label = self.graph.label(u), self.graph.label(v)
             # Überprüfung der Label und ob die Knoten bereits im Matching sind
-            if (self.graph.nodes[u]["label"] == "inner" and
-                self.graph.nodes[v]["label"] == "outer" and
-                u not in self.matching and v not in self.matching):
+            if (self.node_labels[u] == "inner" and
+                self.node_labels[v] == "outer" and
+                u_label not in self.matching and v_label not in self.matching):
                 # Hinzufügen der Kante zum Matching
-                self.matching.add_edge(u, v)
-                # Markierung der Kante als Matching
-                self.graph[u][v]["matching"] = True
+                self.matching.add_edge(u_label, v_label)
+
+    # Gibt die Label mit den ursprünglichen Knotenbezeichnern zurück.
+    def labels(self) -> Dict:
+        return {self.graph.label(i): label for i, label in enumerate(self.node_labels)}
 
 def main() -> None:
     graph = bipartite.random_graph(4, 4, 0.8)
@@ -58,30 +74,28 @@ def main() -> None:
     for (u, v) in graph.edges():
         graph.edges[u, v]['weight'] = random.randint(1, 15)
 
-    nx.set_node_attributes(graph, "", "label")
-    nx.set_edge_attributes(graph, False, "matching")
-
     blossom_algorithm = BlossomAlgorithm(graph)
     blossom_algorithm.run()
+    labels: Dict = blossom_algorithm.labels()
 
     # Plotting
     edge_colors: List[str] = []
-    for edge in blossom_algorithm.graph.edges(data=True):
-        if edge[2].get('matching', False):
+    for u, v in graph.edges():
+        if blossom_algorithm.matching.has_edge(u, v):
             edge_colors.append('red')
         else:
             edge_colors.append('gray')
 
-    pos = nx.spring_layout(blossom_algorithm.graph)
+    pos = nx.spring_layout(graph)
     _, axes = plt.subplots(nrows=1, ncols=2, figsize=(12, 6))
 
-    nx.draw(blossom_algorithm.graph, pos, with_labels=True, 
-            labels=nx.get_node_attributes(blossom_algorithm.graph, "label"), 
+    nx.draw(graph, pos, with_labels=True, 
+            labels=labels, 
             edge_color=edge_colors, ax=axes[0])
     axes[0].set_title("Original Graph")
 
     nx.draw(blossom_algorithm.matching, pos, with_labels=True, 
-            labels=nx.get_node_attributes(blossom_algorithm.matching, "label"), 
+            labels={node: labels[node] for node in blossom_algorithm.matching}, 
             ax=axes[1])
     axes[1].set_title("Matching")
 
@@ -1,29 +1,59 @@
+import sys
+from pathlib import Path
+
+current_file_path = Path(__file__).resolve()
+parent_directory = current_file_path.parent.parent.parent
+sys.path.append(str(parent_directory))
+
 import random
 import math
 import networkx as nx
 import matplotlib.pyplot as plt
 
 from networkx import bipartite
-from typing import Set, Tuple, List, Dict
-
-class Algorithm:
-    def __init__(self, graph: nx.Graph) -> None:
-        self.graph: nx.Graph = graph.copy()
+from typing import Set, Tuple, List, Dict, Hashable, Optional, Union
+from structs.csr_graph import CSRGraph
+from structs.graph_readers import read_dimacs_assignment
+from structs.instrumentation import Instrumented
+
+class Algorithm(Instrumented):
+    def __init__(self, graph: Union[nx.Graph, CSRGraph], left: Optional[Set[Hashable]] = None) -> None:
+        # Die Eingabe wird nicht kopiert. Bei einem networkx-Graphen ergibt sich die linke Seite aus dem
+        # Knotenattribut 'bipartite', bei einem CSRGraph muss sie übergeben werden.
+        if not isinstance(graph, CSRGraph):
+            if left is None:
+                left = {n for n, d in graph.nodes(data=True) if d['bipartite'] == 0}
+            graph = CSRGraph.from_networkx(graph)
+        if left is None:
+            raise ValueError("left partition is required for CSRGraph input")
+        self.graph: CSRGraph = graph
+        self.left: Set[Hashable] = set(left)
+        self.nodes: List[Hashable] = graph.to_labels(range(graph.number_of_nodes()))
+
+        # Kantengewichte in beiden Richtungen als flaches Wörterbuch, ersetzt Zugriffe der Form graph[u][v]['weight'].
+        self.weights: Dict[Tuple[Hashable, Hashable], float] = {}
+        src, dst, weights = graph.edges()
+        for u, v, weight in zip(graph.to_labels(src.tolist()), graph.to_labels(dst.tolist()), weights.tolist()):
+            self.weights[u, v] = weight
+            self.weights[v, u] = weight
+
+    def neighbors(self, u: Hashable) -> List[Hashable]:
+        return self.graph.to_labels(self.graph.neighbors(self.graph.id(u)).tolist())
 
     def calculate_slack(self, u: int, v: int, y: Dict[int, float]) -> float:
         # Berechne den Slack-Wert für eine Kante (u, v): y_u + y_v - w(u,v).
         # Differenz zwischen den Summen der Dualvariablen y[u] und y[v] und dem Kantengewicht w(u, v).
-        return y[u] + y[v] - self.graph[u][v]['weight']
+        return y[u] + y[v] - self.weights[u, v]
 
     def run(self) -> Set[Tuple[int, int]] | None:
         # Bestimme die zwei Knotenmengen L (linke Seite) und R (rechte Seite) des bipartiten Graphen
-        L: Set[int] = set(n for n, d in self.graph.nodes(data=True) if d['bipartite'] == 0)
-        R: Set[int] = set(self.graph) - L
+        L: Set[int] = set(self.left)
+        R: Set[int] = set(self.nodes) - L
 
         # Initialisiere duale Variablen y für L mit 0 und für R mit maximalem Kantengewicht.
         # Repräsentieren eine Art "Potenzial" für jeden Knoten. Sie werden iterativ angepasst.
         y: Dict[int, float] = {v: 0 for v in L}
-        y.update({v: max((self.graph[u][v]['weight'] for u, v in self.graph.edges(v)), default=0) for v in R})
+        y.update({v: max(self.graph.neighbor_weights(self.graph.id(v)).tolist(), default=0) for v in R})
 
         # M ist die Menge der aktuellen Matching-Kanten (anfangs leer)
         M: Set[Tuple[int, int]] = set()
@@ -52,7 +82,7 @@ class Algorithm:
             # Berechnung der Slack-Werte für alle Kanten zwischen U und R
             for u in U & L:
                 for v in R - U:
-                    if self.graph.has_edge(u, v):
+                    if (u, v) in self.weights:
                         # Aktualisiere Slack-Werte
                         value: float = min(slack_value[v], self.calculate_slack(u, v, y))
                         slack_value[v] = value
@@ -70,6 +100,7 @@ class Algorithm:
                 if math.isnan(delta): delta = 0
 
                 # Anpassung der dualen Variablen um Delta
+                self.count('dual_updates')
                 for u in U:
                     y[u] -= delta
                 for v in R:
@@ -87,7 +118,7 @@ class Algorithm:
                         V.add(v)
                         for u in L:
                             # Überprüfen ob es eine Kante zwischen u und v gibt und ob diese Kante ebenfalls einen Slack-Wert von 0 hat.
-                            if self.graph.has_edge(u, v) and self.calculate_slack(u, v, y) == 0:
+                            if (u, v) in self.weights and self.calculate_slack(u, v, y) == 0:
                                 # Wenn der Knoten u bereits im alternierenden Baum U enthalten ist, bedeutet das, dass eine Kante gefunden wurde,
                                 # die zwei Knoten innerhalb des Baums verbindet. In diesem Fall wird der Vorgänger des Knotens v im Baum auf u gesetzt.
                                 if u in U:
@@ -119,6 +150,7 @@ class Algorithm:
                 # Wenn ein augmentierender Pfad (ein Pfad, der mit einem freien Knoten in L beginnt und mit einem freien Knoten in R endet,
                 # wobei sich Matching-Kanten und Nicht-Matching-Kanten abwechseln) gefunden wird, wird das Matching entlang dieses Pfades augmentiert,
                 # d.h., Matching-Kanten werden entfernt und Nicht-Matching-Kanten werden zum Matching hinzugefügt.
+                self.count('augmentations')
                 for u, v in augmenting_path:
                     if (u, v) in M:
                         M.remove((u, v))
@@ -128,7 +160,7 @@ class Algorithm:
                 # Überprüfung, ob die Nachbarn der nicht freien Knoten in U alle in U enthalten sind. Wenn dies der Fall ist,
                 # bedeutet das laut dem Satz von Hall, dass kein perfektes Matching existiert.
                 neighbors_set = set()
-                neighbors_set = (neighbors_set.union(self.graph.neighbors(u)) for u in U & L)
+                neighbors_set = (neighbors_set.union(self.neighbors(u)) for u in U & L)
                 if all(n in U for n in neighbors_set):
                     return None
                 break
@@ -174,7 +206,18 @@ def get_random_graph() -> Tuple[nx.Graph, Set[int]]:
 
     return graph, left_set
 
-def main(graph_type: str = "random") -> None:
+def main(graph_type: str = "random", path: Optional[str] = None) -> None:
+    # Eine DIMACS-Assignment-Instanz wird nur gelöst und ohne Zeichnung ausgegeben.
+    if path is not None:
+        graph, left_set = read_dimacs_assignment(path)
+        algorithm = Algorithm(graph, left_set)
+        matching = algorithm.run()
+        if matching is None:
+            print("No perfect matching exists.")
+            return
+        print(f"Matching with {len(matching)} edges and total weight {sum(algorithm.weights[e] for e in matching)}")
+        return
+
     graph, left_set = get_random_graph()
     if graph_type == "static":
         graph, left_set = get_static_graph()
@@ -210,4 +253,4 @@ def main(graph_type: str = "random") -> None:
     plt.show()
 
 if __name__ == "__main__":
-    main()
+    main(path=sys.argv[1] if len(sys.argv) > 1 else None)
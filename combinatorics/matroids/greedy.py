@@ -10,28 +10,34 @@ from typing import Set
 
 from structs.random_graph_generator import GenerateRandomGraph
 from structs.matroids import Matroid, GraphMatroid
+from structs.instrumentation import Instrumented
 
-class Algorithm:
+class Algorithm(Instrumented):
     def __init__(self, M: Matroid) -> None:
         self.M: Matroid = M
 
     def run(self):
-        # Initialisierung der Grundmenge E und der unabhängigen Menge I
-        E: Set = set(self.M.groundset)
-        I: Set = set()
-
-        # Solange E nicht leer ist
-        while E:
-            # Wähle ein Element x aus E mit minimalem Gewicht
-            x: Set = self.M.minarg(E)
-            # Wenn die Vereinigung von I und {x} unabhängig im Matroid ist, füge x zu I hinzu
-            if self.M.independent(I | {x}):
-                I.add(x)
-            # Entferne x aus E
-            E.remove(x)
-
-        # Rückgabe der unabhängigen Menge I als Basis des Matroids
-        return I
+        # Zählt die Orakelaufrufe, falls die Messung aktiv ist.
+        self.track(self.M, 'independent', 'minarg', prefix='oracle')
+        try:
+            # Initialisierung der Grundmenge E und der unabhängigen Menge I
+            E: Set = set(self.M.groundset)
+            I: Set = set()
+
+            # Solange E nicht leer ist
+            while E:
+                # Wähle ein Element x aus E mit minimalem Gewicht
+                x: Set = self.M.minarg(E)
+                # Wenn die Vereinigung von I und {x} unabhängig im Matroid ist, füge x zu I hinzu
+                if self.M.independent(I | {x}):
+                    I.add(x)
+                # Entferne x aus E
+                E.remove(x)
+
+            # Rückgabe der unabhängigen Menge I als Basis des Matroids
+            return I
+        finally:
+            self.untrack(self.M, 'independent', 'minarg')
 
 def main() -> None:
     random_graph = GenerateRandomGraph(6, 50)
@@ -11,8 +11,9 @@ import random
 
 from typing import Set, Dict, Optional
 from structs.matroids import PartitionMatroid, UnweightedGraphMatroid
+from structs.instrumentation import Instrumented
 
-class Algorithm:
+class Algorithm(Instrumented):
     def __init__(self, M1: UnweightedGraphMatroid, M2: PartitionMatroid) -> None:
         self.M1: UnweightedGraphMatroid = M1
         self.M2: PartitionMatroid = M2
@@ -21,53 +22,66 @@ class Algorithm:
     def run(self) -> Set:
         # Starte mit einer leeren unabhängigen Menge
         I = set()
-
-        while True:
-            # Erstelle einen Graphen basierend auf der aktuellen Menge I
-            self.build_graph(I)
-            # Füge Kanten hinzu, die mögliche "Verbesserungen" von I darstellen
-            self.intersect(I)
-
-            try:
-                # Versuche, einen kürzesten Pfad im Graphen von der Quelle ("S") zur Senke ("T") zu finden.
-                path = nx.shortest_path(self.G, "S", "T")
-            except (nx.NetworkXNoPath, nx.NodeNotFound):
-                # Wenn kein Pfad gefunden wird, ist die aktuelle Menge I maximal unabhängig und der Algorithmus bricht ab.
-                break
-
-            # Aktualisiere die unabhängige Menge I durch die symmetrische Differenz mit dem gefundenen Pfad.
-            I = I.symmetric_difference(path)
-
-        # Gib die maximale unabhängige Menge zurück
-        return I
+        # Zählt die Orakelaufrufe beider Matroide, falls die Messung aktiv ist.
+        self.track(self.M1, 'load', 'can_add', 'fundamental_circuit', prefix='M1')
+        self.track(self.M2, 'load', 'can_add', 'fundamental_circuit', prefix='M2')
+        try:
+            while True:
+                with self.phase('exchange_graph'):
+                    # Erstelle einen Graphen basierend auf der aktuellen Menge I
+                    self.build_graph(I)
+                    # Füge Kanten hinzu, die mögliche "Verbesserungen" von I darstellen
+                    self.intersect(I)
+
+                try:
+                    # Versuche, einen kürzesten Pfad im Graphen von der Quelle ("S") zur Senke ("T") zu finden.
+                    with self.phase('shortest_path'):
+                        path = nx.shortest_path(self.G, "S", "T")
+                except (nx.NetworkXNoPath, nx.NodeNotFound):
+                    # Wenn kein Pfad gefunden wird, ist die aktuelle Menge I maximal unabhängig und der Algorithmus bricht ab.
+                    break
+                self.count('augmentations')
+
+                # Aktualisiere die unabhängige Menge I durch die symmetrische Differenz mit dem gefundenen Pfad
+                # (ohne die Hilfsknoten "S" und "T").
+                I = I.symmetric_difference(path[1:-1])
+
+            # Gib die maximale unabhängige Menge zurück
+            return I
+        finally:
+            self.untrack(self.M1, 'load', 'can_add', 'fundamental_circuit')
+            self.untrack(self.M2, 'load', 'can_add', 'fundamental_circuit')
     
     def build_graph(self, I: Set) -> None:
         # Erstellt einen gerichteten Graphen G, der mögliche Erweiterungen der unabhängigen Menge I darstellt.
         self.G = nx.DiGraph()
+        # Lädt I einmal in die inkrementellen Orakel beider Matroide, alle folgenden Anfragen beziehen sich auf I.
+        self.M1.load(I)
+        self.M2.load(I)
 
         # Füge Kanten von der Quelle "S" zu Elementen hinzu, die zu I hinzugefügt werden können,
         # ohne die Unabhängigkeit in M1 zu verletzen.
         for e in self.M1.edges() - I:
-            if self.M1.independent(I | {e}):
+            if self.M1.can_add(e):
                 self.G.add_edge("S", e)
         # Füge Kanten von Elementen zur Senke "T" hinzu, die zu I hinzugefügt werden können,
         # ohne die Unabhängigkeit in M2 zu verletzen.
         for e in self.M2.edges() - I:
-            if self.M2.independent(I | {e}):
+            if self.M2.can_add(e):
                 self.G.add_edge(e, "T")
     
     def intersect(self, I: Set) -> None:
         # Fügt Kanten zu G hinzu, die mögliche "Austausch"-Operationen darstellen, um I zu verbessern.
-        for e1 in I:
-            for e2 in self.M1.edges() - I:
-                # Wenn das Entfernen von e1 und Hinzufügen von e2 in M1 nicht unabhängig ist,
-                # aber das Hinzufügen von e2 allein zu I in M1 unabhängig ist, füge eine Kante (e1, e2) hinzu.
-                if not self.M1.independent(I - {e1} | {e2}) and self.M1.independent(I | {e2}):
-                    self.G.add_edge(e1, e2)
-            for e2 in self.M2.edges() - I:
-                # Analog für M2, aber mit umgekehrter Kantenrichtung (e2, e1).
-                if not self.M2.independent(I - {e1} | {e2}) and self.M2.independent(I | {e2}):
-                    self.G.add_edge(e2, e1)
+        # Setzt voraus, dass build_graph die Menge I bereits in die Orakel geladen hat.
+        for e2 in self.M1.edges() - I:
+            # I - {e1} | {e2} ist in M1 genau dann unabhängig (während I | {e2} es nicht ist),
+            # wenn e1 im fundamentalen Kreis von e2 liegt. Dann wird eine Kante (e1, e2) hinzugefügt.
+            for e1 in self.M1.fundamental_circuit(e2) - {e2}:
+                self.G.add_edge(e1, e2)
+        for e2 in self.M2.edges() - I:
+            # Analog für M2, aber mit umgekehrter Kantenrichtung (e2, e1).
+            for e1 in self.M2.fundamental_circuit(e2) - {e2}:
+                self.G.add_edge(e2, e1)
     
 def generate_random_graph(n_nodes: int, p_edge: float) -> nx.Graph:
     graph: nx.Graph = nx.gnp_random_graph(n_nodes, p_edge)
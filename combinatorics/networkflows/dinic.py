@@ -0,0 +1,133 @@
+import sys
+from pathlib import Path
+
+current_file_path = Path(__file__).resolve()
+parent_directory = current_file_path.parent.parent.parent
+sys.path.append(str(parent_directory))
+
+import networkx as nx
+
+from typing import List, Dict, Hashable, Optional, Set, Tuple, Union
+from structs.random_digraph_generator import GenerateRandomDigraph
+from structs.csr_graph import CSRGraph
+from structs.residual_network import ResidualNetwork
+from structs.graph_readers import read_dimacs_maxflow
+from structs.instrumentation import Instrumented
+
+class Algorithm(Instrumented):
+    # Dinic: Pro Phase wird mit einer Breitensuche das Levelnetzwerk bestimmt und darin ein blockierender Fluss
+    # mit einer iterativen Tiefensuche gesendet. Zeiger auf den aktuellen Bogen jedes Knotens sorgen dafür, dass
+    # jeder Bogen pro Phase nur einmal verworfen wird. Allgemein O(V^2 * E), bei Einheitskapazitäten O(E * sqrt(V)).
+    def __init__(self, graph: Union[nx.DiGraph, CSRGraph]) -> None:
+        self.graph: CSRGraph = graph if isinstance(graph, CSRGraph) else CSRGraph.from_networkx_capacities(graph)
+        self.network: ResidualNetwork = ResidualNetwork(self.graph)
+
+    # Gibt den Wert des maximalen Flusses und den Fluss pro Kante wie bei nx.maximum_flow zurück.
+    def run(self, s: Hashable, t: Hashable) -> Tuple[int, Dict[Hashable, Dict[Hashable, int]]]:
+        return self.run_value(s, t), self.network.flow_dict()
+
+    # Nur der Wert des Flusses, ohne die Flusszuordnung in Bezeichnern aufzubauen. Jede Anfrage beginnt mit dem
+    # Fluss 0, auch wenn die Instanz schon für ein anderes Paar (s, t) verwendet wurde.
+    def run_value(self, s: Hashable, t: Hashable) -> int:
+        self.network.reset()
+        return self.augment(s, t)
+
+    # Augmentiert vom aktuellen Fluss im Residualnetzwerk aus und gibt den zusätzlich geschickten Wert zurück.
+    # Das Residualnetzwerk wird nicht zurückgesetzt (für DynamicMaxFlow).
+    def augment(self, s: Hashable, t: Hashable) -> int:
+        s, t = self.graph.id(s), self.graph.id(t)
+        max_flow: int = 0
+        if s == t:
+            return max_flow
+
+        while True:
+            # Levelnetzwerk: Abstand jedes Knotens von s im Residualnetzwerk
+            with self.phase('bfs'):
+                level: List[int] = self.network.levels(s)
+            # Ist t nicht mehr erreichbar, ist der Fluss maximal
+            if level[t] == -1:
+                return max_flow
+            self.count('phases')
+            with self.phase('blocking_flow'):
+                max_flow += self.blocking_flow(s, t, level)
+
+    # Partition der Knoten eines minimalen s-t-Schnitts nach run(), abgelesen aus dem Residualnetzwerk.
+    def min_cut(self, s: Hashable) -> Tuple[Set[Hashable], Set[Hashable]]:
+        return self.network.min_cut(self.graph.id(s))
+
+    # Sendet einen blockierenden Fluss im Levelnetzwerk und gibt seinen Wert zurück.
+    def blocking_flow(self, s: int, t: int, level: List[int]) -> int:
+        network: ResidualNetwork = self.network
+        first, arcs, head, residual = network.first, network.arcs, network.head, network.residual
+        # Aktueller Bogen jedes Knotens als Position in arcs
+        current: List[int] = first[:-1]
+        total: int = 0
+        # Bögen des Pfades von s zum aktuellen Knoten u
+        path: List[int] = []
+        u: int = s
+
+        while True:
+            if u == t:
+                # Augmentieren entlang des Pfades
+                delta: int = min(residual[a] for a in path)
+                for a in path:
+                    residual[a] -= delta
+                    residual[a ^ 1] += delta
+                total += delta
+                self.count('augmentations')
+                # Die Suche wird vor dem ersten gesättigten Bogen fortgesetzt statt wieder bei s
+                k: int = next(i for i, a in enumerate(path) if residual[a] == 0)
+                del path[k:]
+                u = head[path[-1]] if path else s
+                continue
+
+            # Vorrücken über den ersten zulässigen Bogen ab dem aktuellen Bogen
+            i: int = current[u]
+            end: int = first[u + 1]
+            next_level: int = level[u] + 1
+            while i < end:
+                a: int = arcs[i]
+                if residual[a] > 0 and level[head[a]] == next_level:
+                    break
+                i += 1
+            current[u] = i
+
+            if i < end:
+                path.append(arcs[i])
+                u = head[arcs[i]]
+            else:
+                # Sackgasse: u wird für diese Phase gesperrt, der Vorgänger verwirft den Bogen zu u
+                if u == s:
+                    return total
+                level[u] = -1
+                a = path.pop()
+                u = head[a ^ 1]
+                current[u] += 1
+
+def main(path: Optional[str] = None) -> None:
+    # Eine DIMACS-Max-Flow-Instanz wird nur gelöst, ohne Vergleich mit networkx.
+    if path is not None:
+        graph, source, target = read_dimacs_maxflow(path)
+        print(f"The maximum flow is {Algorithm(graph).run_value(s=source, t=target)}")
+        return
+
+    generate_random_digraph = GenerateRandomDigraph(n=10, p=60)
+    graph = generate_random_digraph.generate()
+
+    source: int = 0
+    target: int = graph.number_of_nodes() - 1
+
+    algorithm = Algorithm(graph)
+
+    calculated_flow, flow = algorithm.run(s=source, t=target)
+    expected_flow, _ = nx.maximum_flow(graph, _s=source, _t=target)
+
+    try:
+        assert(calculated_flow == expected_flow)
+        print("Success: The calculated maximum flow matches the expected value.")
+        print(f"The maximum flow is {calculated_flow}")
+    except AssertionError:
+        print(f"Error: calculated flow ({calculated_flow}) is different from expected flow ({expected_flow})")
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
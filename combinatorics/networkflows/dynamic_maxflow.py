@@ -0,0 +1,175 @@
+import sys
+from pathlib import Path
+
+current_file_path = Path(__file__).resolve()
+parent_directory = current_file_path.parent.parent.parent
+sys.path.append(str(parent_directory))
+
+from structs.csr_graph import CSRGraph
+from structs.residual_network import ResidualNetwork
+from structs.random_digraph_generator import GenerateRandomDigraph
+from structs.instrumentation import Instrumented
+from dinic import Algorithm
+
+from typing import Dict, Hashable, List, Set, Tuple, Union
+
+import random
+import time
+import networkx as nx
+
+class DynamicMaxFlow(Instrumented):
+    # Maximaler s-t-Fluss, der nach Kapazitätsänderungen vom bisherigen Fluss aus weiterberechnet wird.
+    # Das Residualnetzwerk bleibt zwischen den Aufrufen erhalten. Eine Erhöhung vergrößert nur die Restkapazität.
+    # Bei einer Verringerung unter den aktuellen Fluss wird der Fluss auf der Kante gekappt. Der entstehende
+    # Überschuss am Anfangsknoten und das Defizit am Endknoten werden lokal repariert: Zuerst wird der Überschuss
+    # im Residualnetzwerk zum Endknoten umgeleitet, der Rest wird zu s oder t zurückgeschickt bzw. von dort geholt.
+    # run() augmentiert danach mit Dinic vom reparierten Fluss aus.
+    def __init__(self, graph: Union[nx.DiGraph, CSRGraph], s: Hashable, t: Hashable) -> None:
+        self.solver: Algorithm = Algorithm(graph)
+        self.graph: CSRGraph = self.solver.graph
+        self.network: ResidualNetwork = self.solver.network
+        self.source: Hashable = s
+        self.target: Hashable = t
+        self.s: int = self.graph.id(s)
+        self.t: int = self.graph.id(t)
+        # Kanten-Id je Knotenpaar (dichte Ids), bei parallelen Kanten die erste.
+        self.edges: Dict[Tuple[int, int], int] = {}
+        src, dst, _ = self.graph.edges()
+        for edge, (u, v) in enumerate(zip(src.tolist(), dst.tolist())):
+            self.edges.setdefault((u, v), edge)
+            if not self.graph.is_directed():
+                self.edges.setdefault((v, u), edge)
+        self.value = 0
+
+    # Augmentiert vom aktuellen Fluss aus bis zum maximalen Fluss und gibt dessen Wert zurück.
+    def run(self):
+        if self.s != self.t:
+            with self.phase('augment'):
+                self.solver.augment(self.source, self.target)
+            self.value = self.network.value(self.t)
+        return self.value
+
+    def edge(self, u: Hashable, v: Hashable) -> int:
+        key: Tuple[int, int] = (self.graph.id(u), self.graph.id(v))
+        if key not in self.edges:
+            raise KeyError(f"edge ({u}, {v}) is not in the graph")
+        return self.edges[key]
+
+    def capacity(self, u: Hashable, v: Hashable):
+        return self.network.capacity[2 * self.edge(u, v)]
+
+    # Setzt die Kapazität der Kante (u, v). Der Fluss bleibt zulässig, ist aber erst nach run() wieder maximal.
+    def update_capacity(self, u: Hashable, v: Hashable, capacity) -> None:
+        if capacity < 0:
+            raise ValueError("capacity must be non-negative")
+        network: ResidualNetwork = self.network
+        edge: int = self.edge(u, v)
+        forward, backward = 2 * edge, 2 * edge + 1
+        flow = network.capacity[forward] - network.residual[forward]
+        # Bei ungerichteten Kanten ist ein negativer Fluss einer von v nach u.
+        lower = 0 if self.graph.is_directed() else -capacity
+        new_flow = min(max(flow, lower), capacity)
+
+        network.capacity[forward] = capacity
+        network.residual[forward] = capacity - new_flow
+        if self.graph.is_directed():
+            network.residual[backward] = new_flow
+        else:
+            network.capacity[backward] = capacity
+            network.residual[backward] = capacity + new_flow
+
+        tail, head = network.head[backward], network.head[forward]
+        if flow > new_flow:
+            self.repair(tail, head, flow - new_flow)
+        elif flow < new_flow:
+            self.repair(head, tail, new_flow - flow)
+        self.value = network.value(self.t)
+
+    def increase_capacity(self, u: Hashable, v: Hashable, amount) -> None:
+        self.update_capacity(u, v, self.capacity(u, v) + amount)
+
+    def decrease_capacity(self, u: Hashable, v: Hashable, amount) -> None:
+        self.update_capacity(u, v, max(self.capacity(u, v) - amount, 0))
+
+    # Gleicht einen Überschuss von amount an x und ein gleich großes Defizit an y aus.
+    def repair(self, x: int, y: int, amount) -> None:
+        if x == y:
+            return
+        self.count('repairs')
+        terminals: Set[int] = {self.s, self.t}
+        # Umleiten von x nach y, der Flusswert bleibt dabei gleich.
+        amount -= self.send(x, {y}, amount)
+        if amount > 0:
+            # Der Rest des Überschusses fließt zu s (oder t) zurück, das Defizit wird aus s (oder t) gedeckt.
+            if x not in terminals:
+                self.send(x, terminals, amount)
+            if y not in terminals:
+                self.send(y, terminals, amount, backward=True)
+
+    # Schickt bis zu amount Einheiten entlang kürzester Residualpfade von x zu einem Knoten aus targets, bzw. mit
+    # backward=True von einem Knoten aus targets zu x. Gibt die geschickte Menge zurück.
+    def send(self, x: int, targets: Set[int], amount, backward: bool = False):
+        network: ResidualNetwork = self.network
+        first, arcs, head, residual = network.first, network.arcs, network.head, network.residual
+        # Rückwärts wird über den Gegenbogen gesucht, der Pfad besteht dann aus den Gegenbögen.
+        flip: int = 1 if backward else 0
+        sent = 0
+        while sent < amount:
+            parent_arc: List[int] = [-1] * network.n
+            parent_arc[x] = -2
+            queue: List[int] = [x]
+            found: int = -1
+            for u in queue:
+                for i in range(first[u], first[u + 1]):
+                    a: int = arcs[i]
+                    v: int = head[a]
+                    if parent_arc[v] == -1 and residual[a ^ flip] > 0:
+                        parent_arc[v] = a
+                        if v in targets:
+                            found = v
+                            break
+                        queue.append(v)
+                if found != -1:
+                    break
+            if found == -1:
+                break
+
+            path: List[int] = []
+            v = found
+            while v != x:
+                a = parent_arc[v]
+                path.append(a ^ flip)
+                v = head[a ^ 1]
+            delta = min(amount - sent, min(residual[a] for a in path))
+            for a in path:
+                residual[a] -= delta
+                residual[a ^ 1] += delta
+            sent += delta
+        return sent
+
+    # Partition der Knoten eines minimalen s-t-Schnitts nach run().
+    def min_cut(self) -> Tuple[Set[Hashable], Set[Hashable]]:
+        return self.network.min_cut(self.s)
+
+    def flow_dict(self) -> Dict[Hashable, Dict[Hashable, int]]:
+        return self.network.flow_dict()
+
+if __name__ == "__main__":
+    graph: nx.DiGraph = GenerateRandomDigraph(400, 10).generate_fast()
+    source, target = 0, graph.number_of_nodes() - 1
+    dynamic_flow = DynamicMaxFlow(graph, source, target)
+    print(graph, dynamic_flow.run())
+
+    # Ändert zufällige Kapazitäten und vergleicht mit einer Neuberechnung von Null.
+    for _ in range(5):
+        for u, v in random.sample(list(graph.edges()), 5):
+            capacity: int = random.randint(0, 20)
+            graph[u][v]['capacity'] = capacity
+            dynamic_flow.update_capacity(u, v, capacity)
+        start: float = time.perf_counter()
+        value = dynamic_flow.run()
+        warm: float = time.perf_counter() - start
+        start = time.perf_counter()
+        expected = Algorithm(graph).run_value(source, target)
+        cold: float = time.perf_counter() - start
+        print(f"warm {value} in {warm:.4f}s, cold {expected} in {cold:.4f}s")
@@ -7,69 +7,99 @@ sys.path.append(str(parent_directory))
 
 import networkx as nx
 
-from typing import List, Tuple
+from typing import List, Dict, Hashable, Optional, Set, Tuple, Union
 from structs.random_digraph_generator import GenerateRandomDigraph
-
-class Algorithm:
-    def __init__(self, graph: nx.DiGraph) -> None:
-        self.graph: nx.DiGraph = graph.copy()
-
-    def run(self, s: int, t: int) -> int:
+from structs.csr_graph import CSRGraph
+from structs.residual_network import ResidualNetwork
+from structs.graph_readers import read_dimacs_maxflow
+from structs.instrumentation import Instrumented
+
+class Algorithm(Instrumented):
+    # Edmonds-Karp: Ford-Fulkerson mit kürzesten augmentierenden Pfaden aus einer Breitensuche, O(V * E^2).
+    # Jeder Aufruf von find_path ist eine Breitensuche im Residualnetzwerk.
+    TRACKED = ('find_path',)
+
+    def __init__(self, graph: Union[nx.DiGraph, CSRGraph]) -> None:
+        # Die Eingabe wird nicht kopiert, sondern einmal in die kompakte CSR-Darstellung überführt.
+        self.graph: CSRGraph = graph if isinstance(graph, CSRGraph) else CSRGraph.from_networkx_capacities(graph)
+        # Residualkapazitäten als gepaarte Vorwärts-/Rückwärtsbögen, die an Ort und Stelle aktualisiert werden.
+        self.network: ResidualNetwork = ResidualNetwork(self.graph)
+
+    # Jede Anfrage beginnt mit dem Fluss 0.
+    def run(self, s: Hashable, t: Hashable) -> int:
+        s, t = self.graph.id(s), self.graph.id(t)
+        network: ResidualNetwork = self.network
+        network.reset()
+        residual: List[int] = network.residual
         # Initialisieren des maximalen Flusses mit 0
         max_flow: int = 0
-        
+        if s == t:
+            return max_flow
+
         # Wiederholen, bis kein Pfad mehr gefunden wird
         while(True):
-            # Suchen eines Pfades von s nach t
-            path: List[Tuple[int, int]] = self.find_path(s, t)
+            # Suchen eines kürzesten Pfades von s nach t als Liste von Bögen
+            path: List[int] = self.find_path(s, t)
 
             # Wenn kein Pfad gefunden wurde, Rückgabe des maximalen Flusses
             if not path:
                 return max_flow
 
-            # Finden der minimalen Kapazität im gefundenen Pfad
-            min_capacity: int = min(capacity for _, capacity in path if capacity > 0)
+            # Finden der minimalen Restkapazität im gefundenen Pfad
+            min_capacity: int = min(residual[a] for a in path)
             # Aktualisieren des maximalen Flusses
             max_flow += min_capacity
+            self.count('augmentations')
+            self.count('residual_updates', 2 * len(path))
+
+            # Aktualisieren der Residualkapazitäten entlang des Pfades, der Gegenbogen erhält die Kapazität zurück
+            for a in path:
+                residual[a] -= min_capacity
+                residual[a ^ 1] += min_capacity
+
+    # Breitensuche von s nach t über Bögen mit positiver Restkapazität. Gibt die Bögen eines kürzesten Pfades
+    # zurück oder eine leere Liste, falls t nicht erreichbar ist.
+    def find_path(self, s: int, t: int) -> List[int]:
+        network: ResidualNetwork = self.network
+        first, arcs, head, residual = network.first, network.arcs, network.head, network.residual
+        # Bogen, über den jeder Knoten erreicht wurde, -1 für noch nicht besuchte Knoten
+        parent_arc: List[int] = [-1] * network.n
+        parent_arc[s] = -2
+        queue: List[int] = [s]
+        for u in queue:
+            for i in range(first[u], first[u + 1]):
+                a: int = arcs[i]
+                v: int = head[a]
+                if parent_arc[v] == -1 and residual[a] > 0:
+                    parent_arc[v] = a
+                    if v == t:
+                        # Rückverfolgung des Pfades von t nach s
+                        path: List[int] = []
+                        while v != s:
+                            a = parent_arc[v]
+                            path.append(a)
+                            v = head[a ^ 1]
+                        path.reverse()
+                        return path
+                    queue.append(v)
+        # Rückgabe eines leeren Pfades, falls kein Pfad gefunden wurde
+        return []
 
-            # Aktualisieren der Kapazitäten im Graphen entlang des Pfades
-            for (node1, _), (node2, _) in zip(path[:-1], path[1:]):
-                # Hinzufügen der Rückkante
-                self.graph.add_edge(node2, node1, capacity=min_capacity)
-
-                capacity: int = self.graph[node1][node2]['capacity']
-                dif_capacity: int = capacity - min_capacity
-
-                # Entfernen der ursprünglichen Kante
-                self.graph.remove_edge(node1, node2)
-                # Aktualisieren der Kante, falls noch Kapazität übrig ist
-                if dif_capacity > 0:
-                    self.graph.add_edge(node1, node2, capacity=dif_capacity)
+    # Partition der Knoten eines minimalen s-t-Schnitts nach run(), abgelesen aus dem Residualnetzwerk.
+    def min_cut(self, s: Hashable) -> Tuple[Set[Hashable], Set[Hashable]]:
+        return self.network.min_cut(self.graph.id(s))
 
-    def find_path(self, s: int, t: int, path: List[Tuple[int, int]] = None) -> List[Tuple[int, int]]:
-        # Initialisieren des Pfades
-        if path is None:
-            path = [(s, 0)]
+    # Fluss pro Kante nach run() als Dictionary von Dictionaries wie bei nx.maximum_flow.
+    def flow_dict(self) -> Dict[Hashable, Dict[Hashable, int]]:
+        return self.network.flow_dict()
 
-        # Wenn Start- und Zielknoten gleich sind, Rückgabe des Pfades
-        if s == t:
-            return path
-
-        # Durchlaufen aller Nachbarn des aktuellen Knotens
-        for neighbor in self.graph.neighbors(s):
-            capacity: int = self.graph[s][neighbor]['capacity']
-            # Zyklen werden vermieden, indem überprüft wird, ob ein Nachbar bereits im Pfad enthalten ist,
-            # bevor er hinzugefügt wird. Dies stellt sicher, dass kein Knoten mehr als einmal besucht wird,
-            # wodurch die Bildung von Zyklen im Pfad verhindert wird.
-            if not any(node == neighbor for node, _ in path):
-                result_path: List[Tuple[int, int]] = self.find_path(neighbor, t, path + [(neighbor, capacity)])
-                if result_path:
-                    # Rückgabe des Pfades, wenn einer gefunden wurde
-                    return result_path
-        # Rückgabe eines leeren Pfades, falls kein Pfad gefunden wurde
-        return []
+def main(path: Optional[str] = None) -> None:
+    # Eine DIMACS-Max-Flow-Instanz wird nur gelöst, ohne Vergleich mit networkx.
+    if path is not None:
+        graph, source, target = read_dimacs_maxflow(path)
+        print(f"The maximum flow is {Algorithm(graph).run(s=source, t=target)}")
+        return
 
-def main() -> None:
     generate_random_digraph = GenerateRandomDigraph(n=10, p=60)
     graph = generate_random_digraph.generate()
 
@@ -89,4 +119,4 @@ def main() -> None:
         print(f"Error: calculated flow ({calculated_flow}) is different from expected flow ({expected_flow})")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
\ No newline at end of file
@@ -0,0 +1,153 @@
+import sys
+from pathlib import Path
+
+current_file_path = Path(__file__).resolve()
+parent_directory = current_file_path.parent.parent.parent
+sys.path.append(str(parent_directory))
+
+import os
+import time
+import numpy as np
+import networkx as nx
+
+from multiprocessing import Pool
+from typing import Dict, Hashable, List, Optional, Tuple, Union
+from structs.csr_graph import CSRGraph
+from structs.bottleneck_index import BottleneckIndex
+from structs.random_graph_generator import GenerateRandomGraph
+from structs.shared_arrays import SharedArrays, Spec, attach
+from structs.instrumentation import Instrumented
+from dinic import Algorithm
+
+# Mindestanzahl an Kanten, ab der sich Worker-Prozesse für die Flussberechnungen lohnen.
+GOMORY_HU_MIN_EDGES: int = 1 << 12
+
+# Minimaler Schnitt zwischen s und t mit Dinic auf dem Residualnetzwerk von solver, das run_value zurücksetzt.
+# Gibt den Wert und die s-Seite als boolesches Array zurück.
+def min_cut(solver: Algorithm, s: int, t: int) -> Tuple[int, np.ndarray]:
+    value = solver.run_value(s, t)
+    return value, solver.network.source_side(s)
+
+# Graph im Shared Memory und Dinic-Instanz der Worker-Prozesse, gesetzt durch _attach_shared.
+_shared: Dict[str, np.ndarray] = {}
+_blocks: List = []
+_solver: Optional[Algorithm] = None
+
+def _attach_shared(spec: Spec) -> None:
+    global _shared, _blocks, _solver
+    _shared, _blocks = attach(spec)
+    _solver = Algorithm(CSRGraph(_shared['offsets'], _shared['targets'], _shared['weights'], _shared['edge_ids']))
+
+def _min_cut_shared(pair: Tuple[int, int]) -> Tuple[int, np.ndarray]:
+    return min_cut(_solver, *pair)
+
+class GomoryHuTree(Instrumented):
+    # Gomory-Hu-Baum eines ungerichteten Graphen nach Gusfield: n - 1 Berechnungen eines maximalen Flusses im
+    # ursprünglichen Graphen, ohne Kontraktion. Der minimale Schnitt zwischen zwei beliebigen Knoten ist das
+    # kleinste Gewicht auf ihrem Pfad im Baum und wird mit einem BottleneckIndex über die negierten Gewichte
+    # in O(log n) beantwortet.
+    #
+    # Die Flussberechnungen werden in Stapeln zu je workers Stück parallel ausgeführt. Jede Berechnung hängt nur
+    # von ihrem Paar (s, parent[s]) ab. Ändert das Einarbeiten eines früheren Ergebnisses den Vorgänger eines
+    # späteren Knotens im Stapel, wird dessen Ergebnis verworfen und im nächsten Stapel neu berechnet. Der Baum ist
+    # daher derselbe wie bei sequentieller Ausführung.
+    #
+    # Die Kapazitäten werden wie bei nx.gomory_hu_tree aus dem Kantenattribut capacity gelesen und müssen an
+    # jeder Kante gesetzt sein.
+    def __init__(self, graph: Union[nx.Graph, CSRGraph], capacity: str = 'capacity') -> None:
+        self.graph: CSRGraph = graph if isinstance(graph, CSRGraph) else CSRGraph.from_networkx_capacities(graph, capacity)
+        if self.graph.is_directed():
+            raise ValueError("Gomory-Hu trees are only defined for undirected graphs")
+        self.parent: Optional[np.ndarray] = None
+        self.weights: Optional[np.ndarray] = None
+        self.index: Optional[BottleneckIndex] = None
+
+    # Gibt den Baum als nx.Graph mit den ursprünglichen Bezeichnern und dem Attribut 'weight' zurück,
+    # wie nx.gomory_hu_tree.
+    def run(self, workers: Optional[int] = None) -> nx.Graph:
+        parent, weights = self.run_arrays(workers)
+        tree = nx.Graph()
+        labels: List[Hashable] = self.graph.to_labels(range(self.graph.number_of_nodes()))
+        tree.add_nodes_from(labels)
+        tree.add_weighted_edges_from((labels[u], labels[parent[u]], weights[u]) for u in range(1, len(labels)))
+        return tree
+
+    # Gibt den Vorgänger jedes Knotens im Baum (Wurzel 0) und das Gewicht der Kante zum Vorgänger zurück.
+    def run_arrays(self, workers: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        graph: CSRGraph = self.graph
+        n: int = graph.number_of_nodes()
+        parent: np.ndarray = np.zeros(n, dtype=np.int64)
+        weights: np.ndarray = np.zeros(n, dtype=graph.weights.dtype)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if graph.number_of_edges() < GOMORY_HU_MIN_EDGES:
+            workers = 1
+
+        arrays: Dict[str, np.ndarray] = {'offsets': graph.offsets, 'targets': graph.targets,
+                                         'weights': graph.weights, 'edge_ids': graph.edge_ids}
+        if workers == 1:
+            solver = Algorithm(CSRGraph(*arrays.values()))
+            self.gusfield(parent, weights, 1, lambda pairs: [min_cut(solver, s, t) for s, t in pairs])
+        else:
+            with SharedArrays(arrays) as shared, Pool(workers, initializer=_attach_shared, initargs=(shared.spec(),)) as pool:
+                self.gusfield(parent, weights, workers, lambda pairs: pool.map(_min_cut_shared, pairs))
+
+        self.parent, self.weights = parent, weights
+        # Der Pfad-Minimum-Index entspricht einem Pfad-Maximum über die negierten Gewichte.
+        nodes: np.ndarray = np.arange(1, n)
+        self.index = BottleneckIndex(n, nodes, parent[1:], -weights[1:], graph=graph)
+        return parent, weights
+
+    # Gusfields Algorithmus. cuts berechnet für eine Liste von Paaren (s, t) die minimalen Schnitte.
+    def gusfield(self, parent: np.ndarray, weights: np.ndarray, batch: int, cuts) -> None:
+        n: int = len(parent)
+        s: int = 1
+        while s < n:
+            sources: List[int] = list(range(s, min(n, s + batch)))
+            pairs: List[Tuple[int, int]] = [(u, int(parent[u])) for u in sources]
+            with self.phase('flows'):
+                results: List[Tuple[int, np.ndarray]] = cuts(pairs)
+            self.count('flows', len(pairs))
+            for (u, t), (value, side) in zip(pairs, results):
+                if parent[u] != t:
+                    # Veraltet durch ein früheres Ergebnis dieses Stapels.
+                    self.count('discarded_flows')
+                    break
+                weights[u] = value
+                # Knoten auf der Seite von u, die bisher an t hingen, hängen nun an u.
+                moved: np.ndarray = side & (parent == t)
+                moved[u] = False
+                parent[moved] = u
+                # Liegt der Vorgänger von t auf der Seite von u, tauschen u und t ihre Plätze im Baum.
+                if side[parent[t]]:
+                    parent[u] = parent[t]
+                    parent[t] = u
+                    weights[u] = weights[t]
+                    weights[t] = value
+                s = u + 1
+
+    # Wert eines minimalen Schnitts zwischen u und v (Bezeichner des Graphen) nach run().
+    def min_cut_value(self, u: Hashable, v: Hashable):
+        if u == v:
+            raise ValueError("u and v must be different nodes")
+        return -self.index.query(u, v)
+
+    # Werte der minimalen Schnitte zwischen us[i] und vs[i] für Arrays dichter Ids.
+    def min_cut_values(self, us: np.ndarray, vs: np.ndarray) -> np.ndarray:
+        if np.any(np.asarray(us) == np.asarray(vs)):
+            raise ValueError("u and v must be different nodes")
+        return -self.index.query_many(us, vs)
+
+if __name__ == "__main__":
+    generate_random_graph = GenerateRandomGraph(40, 20)
+    graph: nx.Graph = generate_random_graph.generate()
+    gomory_hu = GomoryHuTree(graph, capacity='weight')
+    start: float = time.perf_counter()
+    tree: nx.Graph = gomory_hu.run()
+    print(f"{tree} in {time.perf_counter() - start:.4f}s")
+
+    # Vergleicht alle Paare mit nx.minimum_cut_value.
+    nodes: List[int] = list(graph.nodes())
+    mismatches: int = sum(gomory_hu.min_cut_value(u, v) != nx.minimum_cut_value(graph, u, v, capacity='weight')
+                          for i, u in enumerate(nodes) for v in nodes[i + 1:])
+    print(f"{mismatches} mismatches over {len(nodes) * (len(nodes) - 1) // 2} pairs")
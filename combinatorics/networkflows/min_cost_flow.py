@@ -0,0 +1,542 @@
+import sys
+from pathlib import Path
+
+current_file_path = Path(__file__).resolve()
+parent_directory = current_file_path.parent.parent.parent
+sys.path.append(str(parent_directory))
+
+import random
+import time
+import numpy as np
+import networkx as nx
+
+from numbers import Integral
+from typing import Dict, Hashable, List, Optional, Tuple
+from structs.csr_graph import CSRGraph
+from structs.residual_network import ResidualNetwork
+from structs.priority_queue import create_priority_queue
+from structs.instrumentation import Instrumented
+
+# Faktor, um den epsilon pro Phase der Kostenskalierung verkleinert wird.
+COST_SCALING_ALPHA: int = 16
+# Eine Preisaktualisierung wird nach PRICE_UPDATE_FREQUENCY * n Neumarkierungen ausgelöst.
+PRICE_UPDATE_FREQUENCY: float = 2.0
+
+class Algorithm(Instrumented):
+    # Flüsse mit minimalen Kosten über sukzessive kürzeste Wege (SSP) auf dem Residualnetzwerk aus
+    # structs/residual_network.py. Knotenpotentiale (Johnson) halten die reduzierten Kosten c(u, v) + pi(u) - pi(v)
+    # aller Residualbögen nicht-negativ, sodass jeder kürzeste Weg mit Dijkstra gefunden wird. Dijkstra sucht
+    # rückwärts von allen Knoten mit Defizit, bis alle Knoten mit Überschuss erreicht sind, danach wird entlang der
+    # Bögen mit reduzierten Kosten 0 augmentiert (primal-dual). Bögen mit negativen reduzierten Kosten werden zu
+    # Beginn gesättigt, ihre Gegenbögen haben dann positive reduzierte Kosten.
+    #
+    # Vorlauf mit Kostenskalierung (Goldberg-Tarjan): Push-Relabel mit Preisen berechnet für epsilon = C / 16,
+    # C / 256, ..., 1 jeweils einen epsilon-optimalen Fluss (reduzierte Kosten aller Residualbögen >= -epsilon).
+    # Wie bei cs2 von Goldberg wird Push mit Look-Ahead ausgeführt, und eine Dijkstra-Suche von den Knoten mit
+    # Defizit aktualisiert die Preise periodisch. Der 1-optimale Fluss ist bei ganzzahligen Kosten noch nicht
+    # optimal, nach dem Sättigen der wenigen Bögen mit negativen reduzierten Kosten braucht SSP aber nur noch
+    # wenige Runden. Auf random_instance mit 10^4 Knoten und 10^5 Bögen ist das etwa 2,5-mal schneller als
+    # nx.min_cost_flow (Netzwerk-Simplex). Bei Kosten bis 10^4 statt 100 sind beide etwa gleich schnell, SSP allein
+    # braucht dann ein Vielfaches, da die Zahl der Runden mit der Kostenspanne wächst.
+    #
+    # Kapazitäten und Nachfragen dürfen gebrochen sein, es zählen alle Bögen und Knoten mit Restkapazität bzw.
+    # Überschuss > 0. Die Kostenskalierung wird dann übersprungen.
+    #
+    # Die Eingabe entspricht nx.min_cost_flow: Knotenattribut demand (negativ für Angebote), Kantenattribute
+    # capacity (fehlend bedeutet unbeschränkt) und weight (Kosten pro Einheit). Die Kosten müssen ganzzahlig sein,
+    # da der zulässige Teilgraph über reduzierte Kosten exakt 0 bestimmt wird.
+    def __init__(self, graph: nx.DiGraph, demand: str = 'demand', capacity: str = 'capacity', weight: str = 'weight') -> None:
+        labels: List[Hashable] = list(graph.nodes())
+        index: Dict[Hashable, int] = {label: i for i, label in enumerate(labels)}
+        n: int = len(labels)
+        src: List[int] = []
+        dst: List[int] = []
+        capacities: List = []
+        costs: List = []
+        for u, v, data in graph.edges(data=True):
+            src.append(index[u])
+            dst.append(index[v])
+            capacities.append(data.get(capacity))
+            costs.append(data.get(weight, 0))
+        if not all(isinstance(value, Integral) for value in costs):
+            raise ValueError("min cost flow requires integral edge costs")
+
+        # Angebot jedes Knotens (positiv) bzw. Nachfrage (negativ).
+        self.supply: List = [-graph.nodes[label].get(demand, 0) for label in labels]
+        if sum(self.supply) != 0:
+            raise nx.NetworkXUnfeasible("total node demand is not zero")
+
+        # Unbeschränkte Kanten erhalten eine Kapazität, die kein optimaler Fluss überschreitet:
+        # das gesamte Angebot plus alle endlichen Kapazitäten (für Kreise mit negativen Kosten).
+        # Ein Kreis negativer Kosten aus unbeschränkten Kanten wird wie bei networkx erst nach der
+        # Zulässigkeitsprüfung gemeldet.
+        unbounded: List[int] = [k for k, value in enumerate(capacities) if value is None]
+        self.negative_cycle: bool = False
+        if unbounded:
+            cycle_check = nx.DiGraph()
+            cycle_check.add_weighted_edges_from((src[k], dst[k], costs[k]) for k in unbounded)
+            self.negative_cycle = nx.negative_edge_cycle(cycle_check)
+            bound = sum(value for value in self.supply if value > 0) + sum(value for value in capacities if value is not None)
+            for k in unbounded:
+                capacities[k] = bound
+
+        self.graph: CSRGraph = CSRGraph.from_edges(n, src, dst, np.array(capacities) if capacities else None,
+                                                   directed=True, labels=labels)
+        self.network: ResidualNetwork = ResidualNetwork(self.graph)
+        # Kosten je Bogen, der Gegenbogen hat die negierten Kosten.
+        self.cost: List = [0] * (2 * len(costs))
+        self.cost[0::2] = costs
+        self.cost[1::2] = [-value for value in costs]
+        self.potential: List = [0] * n
+        # Bögen in der Reihenfolge des Residualnetzwerks (nach Anfangsknoten gruppiert) mit Anfangs- und Endknoten
+        # und Kosten als Arrays, daraus werden pro Runde die benötigten Teilnetzwerke gefiltert.
+        network: ResidualNetwork = self.network
+        self.order: np.ndarray = np.array(network.arcs, dtype=np.int64)
+        self.order_tail: np.ndarray = np.repeat(np.arange(n), np.diff(network.first))
+        self.order_head: np.ndarray = np.array(network.head, dtype=np.int64)[self.order]
+        self.order_cost: np.ndarray = np.array(self.cost)[self.order]
+        self.residual_dtype: np.dtype = np.array(network.capacity).dtype
+        # Position des Gegenbogens jeder Position in self.order, für die Kostenskalierung.
+        position: np.ndarray = np.empty(len(self.order), dtype=np.int64)
+        position[self.order] = np.arange(len(self.order))
+        self.order_reverse: np.ndarray = position[self.order ^ 1]
+        # Push-Relabel mit Preisen setzt ganzzahlige Kapazitäten und Nachfragen voraus.
+        self.integral: bool = (np.issubdtype(self.residual_dtype, np.integer)
+                               and all(isinstance(value, Integral) for value in self.supply))
+
+    # Gibt die minimalen Kosten und den Fluss pro Kante wie nx.network_simplex zurück.
+    # Mit scaling=False wird SSP ohne den Vorlauf mit Kostenskalierung ausgeführt.
+    def run(self, scaling: bool = True) -> Tuple[int, Dict[Hashable, Dict[Hashable, int]]]:
+        return self.run_cost(scaling), self.network.flow_dict()
+
+    def run_cost(self, scaling: bool = True):
+        network: ResidualNetwork = self.network
+        network.reset()
+        n: int = network.n
+        cost = self.cost
+        excess: List = list(self.supply)
+        self.potential = [0] * n
+        if scaling and self.integral:
+            with self.phase('cost_scaling'):
+                self.cost_scaling(excess)
+
+        # Sättigen der Bögen mit negativen reduzierten Kosten, danach sind alle reduzierten Kosten nicht-negativ.
+        negative: np.ndarray = (self.reduced_costs() < 0) & (self.residuals() > 0)
+        for a in self.order[negative].tolist():
+            self.saturate(a, excess)
+
+        while True:
+            sources: List[int] = [v for v in range(n) if excess[v] > 0]
+            if not sources:
+                break
+            with self.phase('dijkstra'):
+                reachable: bool = self.shortest_paths(excess, reverse=True)
+            if not reachable:
+                break
+            with self.phase('admissible_flow'):
+                self.admissible_flow(sources, excess)
+
+        if any(excess):
+            raise nx.NetworkXUnfeasible("no flow satisfies all node demands")
+        if self.negative_cycle:
+            raise nx.NetworkXUnbounded("negative cycle with infinite capacity found")
+        return sum(cost[2 * edge] * flow for edge, flow in enumerate(network.flows().tolist()))
+
+    # Kostenskalierung: Ausgehend von den Preisen 0 wird epsilon von der größten Kostenspanne C in Schritten von
+    # COST_SCALING_ALPHA bis 1 verkleinert. Jede Phase sättigt zuerst alle Bögen mit negativen reduzierten Kosten
+    # und beseitigt danach mit refine allen Überschuss. Residuum, Überschuss und Potentiale werden übernommen.
+    # Erreicht ein Knoten mit Überschuss keinen Knoten mit Defizit oder sinken die Preise unbeschränkt, bricht der
+    # Vorlauf ab. SSP setzt dann beim erreichten Präfluss fort und meldet die Unzulässigkeit.
+    def cost_scaling(self, excess: List) -> None:
+        tail, head, reverse = self.order_tail, self.order_head, self.order_reverse
+        residual: np.ndarray = self.residuals()
+        balance: np.ndarray = np.array(excess, dtype=residual.dtype)
+        epsilon: int = int(np.abs(self.order_cost).max(initial=0))
+        feasible: bool = True
+        while feasible and epsilon > 1:
+            epsilon = max(1, epsilon // COST_SCALING_ALPHA)
+            self.count('refines')
+            negative: np.ndarray = (self.reduced_costs() < 0) & (residual > 0)
+            amount: np.ndarray = residual[negative]
+            residual[reverse[negative]] += amount
+            residual[negative] = 0
+            np.subtract.at(balance, tail[negative], amount)
+            np.add.at(balance, head[negative], amount)
+
+            residual_list: List = residual.tolist()
+            balance_list: List = balance.tolist()
+            with self.phase('refine'):
+                feasible = self.refine(epsilon, residual_list, balance_list)
+            residual = np.array(residual_list, dtype=residual.dtype)
+            balance = np.array(balance_list, dtype=residual.dtype)
+
+        values: np.ndarray = np.empty_like(residual)
+        values[self.order] = residual
+        self.network.residual[:] = values.tolist()
+        excess[:] = balance.tolist()
+
+    # Push-Relabel mit Preisen: Macht aus einem Präfluss, in dem alle Bögen mit Restkapazität reduzierte Kosten
+    # >= 0 haben, einen epsilon-optimalen Fluss. Zulässig sind Bögen mit reduzierten Kosten < 0. Aktive Knoten
+    # werden in FIFO-Reihenfolge abgearbeitet, eine Neumarkierung setzt den Preis auf max(p(w) - c(v, w)) - epsilon.
+    # Look-Ahead: Vor einem Push zu w wird geprüft, ob w selbst einen zulässigen Bogen hat, sonst wird w zuerst neu
+    # markiert und der Push entfällt. Alle Listen sind nach Positionen in self.order indiziert, excess und
+    # self.potential pro Knoten. Gibt False zurück, wenn die Instanz unzulässig ist bzw. refine deshalb abbricht.
+    def refine(self, epsilon: int, residual: List, excess: List) -> bool:
+        n: int = self.network.n
+        first: List[int] = self.network.first
+        head: List[int] = self.order_head.tolist()
+        reverse: List[int] = self.order_reverse.tolist()
+        cost: List = self.order_cost.tolist()
+        price: List = self.potential
+        threshold: int = int(PRICE_UPDATE_FREQUENCY * n)
+        relabels: int = 0
+        pushes: int = 0
+        # Stand des Zählers relabels bei der letzten Preisaktualisierung
+        updated: int = 0
+
+        if not self.price_update(epsilon, residual, excess):
+            return False
+        # In zulässigen Instanzen sinkt kein Preis während refine um mehr als O(COST_SCALING_ALPHA * n * epsilon).
+        # Wird die Schranke unterschritten, zirkuliert der Überschuss in einer unzulässigen Instanz.
+        lowest = min(price, default=0) - 2 * (COST_SCALING_ALPHA + 1) * n * epsilon
+        current: List[int] = first[:-1]
+        queue: List[int] = [v for v in range(n) if excess[v] > 0]
+        index: int = 0
+        while index < len(queue):
+            if relabels - updated > threshold:
+                updated = relabels
+                self.count('price_updates')
+                if not self.price_update(epsilon, residual, excess):
+                    return False
+                current = first[:-1]
+            v: int = queue[index]
+            index += 1
+            amount = excess[v]
+            if amount <= 0:
+                continue
+            price_v = price[v]
+            i: int = current[v]
+            end: int = first[v + 1]
+            while True:
+                if i == end:
+                    # Neumarkierung von v, danach ist der beste Bogen zulässig.
+                    best = None
+                    for j in range(first[v], end):
+                        if residual[j] > 0 and (best is None or price[head[j]] - cost[j] > best):
+                            best = price[head[j]] - cost[j]
+                            i = j
+                    if best is None or best - epsilon < lowest:
+                        excess[v] = amount
+                        return False
+                    price_v = price[v] = best - epsilon
+                    relabels += 1
+                    continue
+                capacity = residual[i]
+                if capacity > 0:
+                    w: int = head[i]
+                    if cost[i] + price_v - price[w] < 0:
+                        if excess[w] >= 0:
+                            # Look-Ahead: w braucht einen zulässigen Bogen, um den Fluss weiterzugeben.
+                            price_w = price[w]
+                            j: int = current[w]
+                            end_w: int = first[w + 1]
+                            while j < end_w and (residual[j] <= 0 or cost[j] + price_w - price[head[j]] >= 0):
+                                j += 1
+                            current[w] = j
+                            if j == end_w:
+                                best = None
+                                for k in range(first[w], end_w):
+                                    if residual[k] > 0 and (best is None or price[head[k]] - cost[k] > best):
+                                        best = price[head[k]] - cost[k]
+                                        current[w] = k
+                                # Ohne Restkapazität wird trotzdem gepusht, danach hat w den Gegenbogen.
+                                if best is not None:
+                                    if best - epsilon < lowest:
+                                        excess[v] = amount
+                                        return False
+                                    price[w] = best - epsilon
+                                    relabels += 1
+                                    continue
+                        delta = amount if amount < capacity else capacity
+                        residual[i] = capacity - delta
+                        residual[reverse[i]] += delta
+                        excess_w = excess[w]
+                        excess[w] = excess_w + delta
+                        pushes += 1
+                        if excess_w <= 0 < excess_w + delta:
+                            queue.append(w)
+                        amount -= delta
+                        if not amount:
+                            break
+                i += 1
+            current[v] = i
+            excess[v] = 0
+        self.count('relabels', relabels)
+        self.count('pushes', pushes)
+        return True
+
+    # Preisaktualisierung: Dijkstra rückwärts von den Knoten mit Defizit über Bögen mit Restkapazität, ein Bogen
+    # (v, w) hat dabei die Länge floor(rc(v, w) / epsilon) + 1 >= 0. Die Preise sinken um epsilon mal den Abstand,
+    # nicht erreichte Knoten um den größten Abstand. Die Suche endet, sobald alle Knoten mit Überschuss erreicht
+    # sind, danach hat jeder von ihnen einen zulässigen Weg zu einem Defizit. Gibt False zurück, wenn ein Knoten
+    # mit Überschuss nicht erreicht wird.
+    def price_update(self, epsilon: int, residual: List, excess: List) -> bool:
+        n: int = self.network.n
+        price: List = self.potential
+        potential: np.ndarray = np.fromiter(price, dtype=self.order_cost.dtype, count=n)
+        # Position j steht für den Bogen (w, v) mit w = order_tail[j], v = order_head[j]. Gesucht wird über seinen
+        # Gegenbogen (v, w) an Position reverse[j].
+        reverse: np.ndarray = self.order_reverse
+        live: np.ndarray = np.array(residual)[reverse] > 0
+        reduced: np.ndarray = self.order_cost[reverse] + potential[self.order_head] - potential[self.order_tail]
+        lengths: np.ndarray = reduced[live] // epsilon + 1
+        subnetwork_first, _, heads = self.subnetwork(live)
+        weights: List = lengths.tolist()
+        queue = self.track(create_priority_queue(lengths, monotone=True), 'push', 'pop', prefix='price_queue')
+        push, pop = queue.push, queue.pop
+
+        infinity = float('inf')
+        distance: List = [infinity] * n
+        done: bytearray = bytearray(n)
+        active: int = 0
+        for v in range(n):
+            if excess[v] < 0:
+                distance[v] = 0
+                push(v, 0)
+            elif excess[v] > 0:
+                active += 1
+        last = 0
+        while active and not queue.empty():
+            w: int = pop()
+            if done[w]:
+                continue
+            done[w] = 1
+            last = distance_w = distance[w]
+            if excess[w] > 0:
+                active -= 1
+            for i in range(subnetwork_first[w], subnetwork_first[w + 1]):
+                v: int = heads[i]
+                candidate = distance_w + weights[i]
+                if candidate < distance[v]:
+                    distance[v] = candidate
+                    push(v, candidate)
+        if active:
+            return False
+        for v in range(n):
+            shift = distance[v] if done[v] else last
+            if shift:
+                price[v] -= shift * epsilon
+        return True
+
+    def saturate(self, a: int, excess: List) -> None:
+        network: ResidualNetwork = self.network
+        amount = network.residual[a]
+        network.push(a, amount)
+        excess[network.head[a ^ 1]] -= amount
+        excess[network.head[a]] += amount
+
+    # Reduzierte Kosten c(u, v) + pi(u) - pi(v) aller Bögen in der Reihenfolge von self.order.
+    def reduced_costs(self) -> np.ndarray:
+        potential: np.ndarray = np.fromiter(self.potential, dtype=self.order_cost.dtype, count=self.network.n)
+        return self.order_cost + potential[self.order_tail] - potential[self.order_head]
+
+    # Restkapazitäten in der Reihenfolge von self.order, mit reverse=True die der Gegenbögen.
+    def residuals(self, reverse: bool = False) -> np.ndarray:
+        residual: List = self.network.residual
+        values: np.ndarray = np.fromiter(residual, dtype=self.residual_dtype, count=len(residual))
+        return values[self.order ^ 1] if reverse else values[self.order]
+
+    # Teilnetzwerk der Bögen in mask (bezogen auf self.order). Gibt wie im Residualnetzwerk den Beginn der Bögen
+    # jedes Knotens, die Bögen und ihre Endknoten zurück. Das Filtern mit NumPy ersetzt die Prüfung jedes Bogens
+    # in den Python-Schleifen.
+    def subnetwork(self, mask: np.ndarray) -> Tuple[List[int], List[int], List[int]]:
+        n: int = self.network.n
+        offsets: np.ndarray = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.order_tail[mask], minlength=n), out=offsets[1:])
+        return offsets.tolist(), self.order[mask].tolist(), self.order_head[mask].tolist()
+
+    # Dijkstra mit reduzierten Kosten über Bögen mit Restkapazität > 0 von allen Knoten mit Überschuss,
+    # bis alle Knoten mit Defizit erreicht sind. Mit reverse=True wird umgekehrt von den Knoten mit Defizit
+    # über die Gegenbögen gesucht. Die Potentiale werden um die Abstände erhöht bzw. verringert, danach haben alle
+    # Bögen kürzester Wege reduzierte Kosten 0. Gibt zurück, ob ein Pfad existiert.
+    def shortest_paths(self, excess: List, reverse: bool = False) -> bool:
+        n: int = self.network.n
+        potential: List = self.potential
+        sign: int = -1 if reverse else 1
+        sources: List[int] = [v for v in range(n) if sign * excess[v] > 0]
+        reduced: np.ndarray = sign * self.reduced_costs()
+        live: np.ndarray = self.residuals(reverse) > 0
+        zero: np.ndarray = reduced == 0
+        # Bögen mit reduzierten Kosten 0 und mit positiven reduzierten Kosten getrennt
+        zero_first, _, zero_heads = self.subnetwork(live & zero)
+        positive: np.ndarray = live & ~zero
+        first, _, heads = self.subnetwork(positive)
+        # Aus den reduzierten Kosten wählt create_priority_queue die Warteschlange
+        # (Bucket-Warteschlange, Radix-Heap bzw. binärer Heap bei nicht ganzzahligen Kosten).
+        queue = self.track(create_priority_queue(reduced[positive], monotone=True), 'push', 'pop', prefix='queue')
+        push, pop = queue.push, queue.pop
+        weights: List = reduced[positive].tolist()
+
+        infinity = float('inf')
+        distance: List = [infinity] * n
+        done: bytearray = bytearray(n)
+        settled: List[int] = []
+        targets: int = sum(1 for value in excess if sign * value < 0)
+        found: bool = False
+        level: List[int] = list(sources)
+        for s in sources:
+            distance[s] = 0
+        while True:
+            # Alle Knoten mit dem aktuellen Abstand: Über Bögen mit reduzierten Kosten 0 erreichte Knoten haben
+            # ihren endgültigen Abstand und werden ohne die Warteschlange abgearbeitet.
+            closure: List[int] = []
+            while level:
+                u: int = level.pop()
+                if done[u]:
+                    continue
+                done[u] = 1
+                closure.append(u)
+                if sign * excess[u] < 0:
+                    targets -= 1
+                    found = True
+                distance_u = distance[u]
+                for v in zero_heads[zero_first[u]:zero_first[u + 1]]:
+                    if not done[v]:
+                        distance[v] = distance_u
+                        level.append(v)
+            settled += closure
+            if not targets:
+                break
+
+            for u in closure:
+                distance_u = distance[u]
+                for v, weight in zip(heads[first[u]:first[u + 1]], weights[first[u]:first[u + 1]]):
+                    candidate = distance_u + weight
+                    if candidate < distance[v]:
+                        distance[v] = candidate
+                        push(v, candidate)
+
+            # Nächster Abstand aus der Warteschlange
+            while not queue.empty():
+                u = pop()
+                if not done[u]:
+                    level.append(u)
+                    break
+            if not level:
+                break
+
+        # Neue Potentiale: pi(v) + min(d(v), D) mit D als Abstand des zuletzt erreichten Knotens. Eine Verschiebung
+        # aller Potentiale um D ändert keine reduzierten Kosten, daher genügt es, die erreichten Knoten um
+        # d(v) - D anzupassen.
+        if found:
+            bound = distance[settled[-1]]
+            for v in settled:
+                potential[v] -= sign * (bound - distance[v])
+        return found
+
+    # Primal-Dual-Schritt: Nach der Anpassung der Potentiale ist jeder Pfad aus Bögen mit reduzierten Kosten 0 ein
+    # kürzester Weg, und das Augmentieren entlang solcher Pfade hält alle reduzierten Kosten nicht-negativ. Ein
+    # maximaler Fluss von den Knoten mit Überschuss zu den Knoten mit Defizit in diesem zulässigen Netzwerk wird wie
+    # bei Dinic mit Levelnetzwerken und blockierenden Flüssen berechnet, bevor Dijkstra erneut nötig ist.
+    def admissible_flow(self, sources: List[int], excess: List) -> None:
+        n: int = self.network.n
+        head, residual = self.network.head, self.network.residual
+        # Mit einem Bogen hat auch sein Gegenbogen reduzierte Kosten 0. Die Bögen werden daher einmal bestimmt,
+        # nur ihre Restkapazität ändert sich durch das Augmentieren.
+        first, arcs, heads = self.subnetwork(self.reduced_costs() == 0)
+
+        while True:
+            # Levelnetzwerk: Abstand von den Knoten mit Überschuss über zulässige Bögen. Über Knoten mit Defizit
+            # hinaus wird nicht gesucht.
+            level: List[int] = [-1] * n
+            queue: List[int] = [s for s in sources if excess[s] > 0]
+            for s in queue:
+                level[s] = 0
+            reached: bool = False
+            for u in queue:
+                if excess[u] < 0:
+                    reached = True
+                    continue
+                next_level: int = level[u] + 1
+                for i in range(first[u], first[u + 1]):
+                    v: int = heads[i]
+                    if level[v] == -1 and residual[arcs[i]] > 0:
+                        level[v] = next_level
+                        queue.append(v)
+            if not reached:
+                return
+            self.count('admissible_phases')
+
+            # Blockierender Fluss von jedem Knoten mit Überschuss aus, Zeiger auf den aktuellen Bogen wie bei Dinic.
+            current: List[int] = first[:-1]
+            for root in sources:
+                # Positionen der Bögen des Pfades von root zum aktuellen Knoten u
+                path: List[int] = []
+                u: int = root
+                while excess[root] > 0:
+                    if excess[u] < 0:
+                        amount = min(excess[root], -excess[u], min(residual[arcs[i]] for i in path))
+                        for i in path:
+                            residual[arcs[i]] -= amount
+                            residual[arcs[i] ^ 1] += amount
+                        excess[root] -= amount
+                        excess[u] += amount
+                        self.count('augmentations')
+                        # Die Suche wird vor dem ersten Bogen mit zu kleiner Restkapazität fortgesetzt.
+                        k: int = next((j for j, i in enumerate(path) if residual[arcs[i]] <= 0), len(path))
+                        del path[k:]
+                        u = heads[path[-1]] if path else root
+                        continue
+
+                    i: int = current[u]
+                    end: int = first[u + 1]
+                    next_level = level[u] + 1
+                    while i < end and (level[heads[i]] != next_level or residual[arcs[i]] <= 0):
+                        i += 1
+                    current[u] = i
+
+                    if i < end:
+                        path.append(i)
+                        u = heads[i]
+                    else:
+                        # Sackgasse: u wird für diese Phase gesperrt.
+                        level[u] = -1
+                        if not path:
+                            break
+                        u = head[arcs[path.pop()] ^ 1]
+                        current[u] += 1
+
+# Zufällige Instanz: k Anbieter und k Nachfrager mit je supply Einheiten auf einem zufälligen gerichteten Graphen
+# mit m Kanten. Ein Kreis durch alle Knoten mit Kapazität k * supply macht jede Instanz zulässig.
+def random_instance(n: int, m: int, k: int, supply: int, seed: Optional[int] = None) -> nx.DiGraph:
+    rng = random.Random(seed)
+    graph = nx.DiGraph()
+    graph.add_nodes_from(range(n))
+    cycle: List[int] = rng.sample(range(n), n)
+    for u, v in zip(cycle, cycle[1:] + cycle[:1]):
+        if u != v:
+            graph.add_edge(u, v, capacity=k * supply, weight=rng.randint(0, 100))
+    edges: int = graph.number_of_edges()
+    while edges < m:
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v and not graph.has_edge(u, v):
+            graph.add_edge(u, v, capacity=rng.randint(1, 50), weight=rng.randint(0, 100))
+            edges += 1
+    nodes: List[int] = rng.sample(range(n), 2 * k)
+    for u in nodes[:k]:
+        graph.nodes[u]['demand'] = -supply
+    for v in nodes[k:]:
+        graph.nodes[v]['demand'] = supply
+    return graph
+
+if __name__ == "__main__":
+    graph: nx.DiGraph = random_instance(10000, 100000, 500, 30, seed=1)
+    start: float = time.perf_counter()
+    expected = nx.min_cost_flow_cost(graph)
+    print(f"networkx: cost {expected} in {time.perf_counter() - start:.4f}s")
+    algorithm = Algorithm(graph)
+    for scaling, name in ((True, "cost scaling"), (False, "primal-dual")):
+        start = time.perf_counter()
+        cost = algorithm.run_cost(scaling)
+        print(f"{name}: cost {cost} in {time.perf_counter() - start:.4f}s")
+        assert cost == expected, f"{name} cost {cost} differs from networkx cost {expected}"
@@ -0,0 +1,271 @@
+import sys
+from pathlib import Path
+
+current_file_path = Path(__file__).resolve()
+parent_directory = current_file_path.parent.parent.parent
+sys.path.append(str(parent_directory))
+
+import networkx as nx
+
+from typing import List, Dict, Hashable, Optional, Set, Tuple, Union
+from structs.random_digraph_generator import GenerateRandomDigraph
+from structs.csr_graph import CSRGraph
+from structs.residual_network import ResidualNetwork
+from structs.graph_readers import read_dimacs_maxflow
+from structs.instrumentation import Instrumented
+
+# Eine globale Neumarkierung wird ausgelöst, sobald die Relabel-Arbeit seit der letzten
+# GLOBAL_RELABEL_ALPHA * n + m übersteigt (wie bei Cherkassky und Goldberg).
+GLOBAL_RELABEL_ALPHA: int = 6
+
+class Algorithm(Instrumented):
+    # Push-Relabel (Goldberg-Tarjan) auf dem Residualnetzwerk aus structs/residual_network.py.
+    #
+    # Phase 1 berechnet einen maximalen Präfluss: Aktive Knoten werden nach höchstem Label gewählt (O(V^2 * sqrt(E))),
+    # die Gap-Heuristik hebt Knoten oberhalb einer leeren Höhe sofort auf n, und die Höhen werden periodisch
+    # durch eine Rückwärts-Breitensuche von t exakt neu bestimmt. Nach Phase 1 ist der Wert des Präflusses in t
+    # bereits der Wert des minimalen Schnitts.
+    # Phase 2 wandelt den Präfluss in einen Fluss um, indem der Überschuss der Knoten mit FIFO-Auswahl zu s
+    # zurückgeschickt wird. Sie ist nur für die Flusszuordnung nötig.
+    def __init__(self, graph: Union[nx.DiGraph, CSRGraph]) -> None:
+        self.graph: CSRGraph = graph if isinstance(graph, CSRGraph) else CSRGraph.from_networkx_capacities(graph)
+        self.network: ResidualNetwork = ResidualNetwork(self.graph)
+        self.height: List[int] = []
+        self.excess: List = []
+
+    # Beide Phasen: Wert des maximalen Flusses und Fluss pro Kante wie bei nx.maximum_flow.
+    def run(self, s: Hashable, t: Hashable) -> Tuple[int, Dict[Hashable, Dict[Hashable, int]]]:
+        value = self.run_value(s, t)
+        # Für s == t gibt es keinen Präfluss, der umgewandelt werden müsste.
+        if self.graph.id(s) == self.graph.id(t):
+            return value, self.network.flow_dict()
+        with self.phase('phase_two'):
+            self.convert_preflow(self.graph.id(s), self.graph.id(t))
+        return value, self.network.flow_dict()
+
+    # Nur Phase 1: Wert des minimalen s-t-Schnitts, der Präfluss wird nicht in einen Fluss umgewandelt.
+    # Jede Anfrage beginnt mit dem Fluss 0.
+    def run_value(self, s: Hashable, t: Hashable) -> int:
+        self.network.reset()
+        s, t = self.graph.id(s), self.graph.id(t)
+        if s == t:
+            return 0
+        with self.phase('phase_one'):
+            self.maximum_preflow(s, t)
+        return self.excess[t]
+
+    # Knoten der s-Seite eines minimalen Schnitts nach run_value: alle Knoten, von denen t im Residualnetzwerk
+    # nicht erreichbar ist.
+    def min_cut_side(self, t: Hashable) -> Set[Hashable]:
+        distance: List[int] = self.distances_to(self.graph.id(t))
+        return set(self.graph.to_labels(u for u in range(self.network.n) if distance[u] == -1))
+
+    # Rückwärts-Breitensuche: Abstand jedes Knotens zu target im Residualnetzwerk, -1 falls nicht erreichbar.
+    def distances_to(self, target: int) -> List[int]:
+        network: ResidualNetwork = self.network
+        first, arcs, head, residual = network.first, network.arcs, network.head, network.residual
+        distance: List[int] = [-1] * network.n
+        distance[target] = 0
+        queue: List[int] = [target]
+        for v in queue:
+            next_distance: int = distance[v] + 1
+            for i in range(first[v], first[v + 1]):
+                # Bogen a führt von v nach u, sein Gegenbogen von u nach v
+                a: int = arcs[i]
+                u: int = head[a]
+                if distance[u] == -1 and residual[a ^ 1] > 0:
+                    distance[u] = next_distance
+                    queue.append(u)
+        return distance
+
+    def maximum_preflow(self, s: int, t: int) -> None:
+        network: ResidualNetwork = self.network
+        n: int = network.n
+        first, arcs, head, residual = network.first, network.arcs, network.head, network.residual
+        excess: List = [0] * n
+        self.excess = excess
+        current: List[int] = first[:-1]
+
+        # Sättigen aller Bögen aus s
+        for i in range(first[s], first[s + 1]):
+            a: int = arcs[i]
+            delta = residual[a]
+            if delta > 0 and head[a] != s:
+                residual[a] = 0
+                residual[a ^ 1] += delta
+                excess[head[a]] += delta
+                excess[s] -= delta
+
+        # Knoten mit Höhe < n je Höhe (für die Gap-Heuristik) und aktive Knoten je Höhe
+        members: List[Set[int]] = [set() for _ in range(n)]
+        active: List[List[int]] = [[] for _ in range(n)]
+        threshold: int = GLOBAL_RELABEL_ALPHA * n + len(arcs)
+
+        # Exakte Höhen aus den Abständen zu t, nicht erreichbare Knoten und s erhalten die Höhe n.
+        # Gibt die größte Höhe unter n zurück.
+        def global_relabel() -> int:
+            self.count('global_relabels')
+            distance: List[int] = self.distances_to(t)
+            # Höhen können sinken, die Zeiger auf den aktuellen Bogen gelten daher nicht mehr
+            current[:] = first[:-1]
+            top: int = 0
+            for h in range(n):
+                members[h].clear()
+                active[h].clear()
+            for u in range(n):
+                h: int = distance[u]
+                if h == -1 or u == s:
+                    height[u] = n
+                    continue
+                height[u] = h
+                members[h].add(u)
+                if excess[u] > 0 and u != t:
+                    active[h].append(u)
+                if h > top:
+                    top = h
+            return top
+
+        height: List[int] = [0] * n
+        self.height = height
+        top: int = global_relabel()
+        work: int = 0
+        b: int = top
+
+        while b >= 0:
+            if not active[b]:
+                b -= 1
+                continue
+            u: int = active[b].pop()
+            if height[u] != b or excess[u] <= 0:
+                continue
+
+            # Entladen von u: Pushen über zulässige Bögen, Relabel wenn keiner mehr übrig ist
+            h: int = b
+            i: int = current[u]
+            end: int = first[u + 1]
+            while excess[u] > 0:
+                if i == end:
+                    # Relabel: Höhe eins über dem niedrigsten Nachbarn mit Restkapazität
+                    self.count('relabels')
+                    new_height: int = n
+                    for j in range(first[u], end):
+                        a = arcs[j]
+                        if residual[a] > 0 and height[head[a]] < new_height:
+                            new_height = height[head[a]]
+                            current[u] = j
+                    new_height += 1
+                    work += end - first[u] + 12
+                    members[h].discard(u)
+                    if not members[h]:
+                        # Gap-Heuristik: Kein Knoten hat mehr Höhe h, alle Knoten darüber erreichen t nicht mehr
+                        self.count('gaps')
+                        for g in range(h + 1, top + 1):
+                            for w in members[g]:
+                                height[w] = n
+                            members[g].clear()
+                            active[g].clear()
+                        height[u] = n
+                        top = h - 1
+                        break
+                    if new_height >= n:
+                        height[u] = n
+                        break
+                    height[u] = h = new_height
+                    members[h].add(u)
+                    if h > top:
+                        top = h
+                    i = current[u]
+                    continue
+
+                a = arcs[i]
+                v: int = head[a]
+                if residual[a] > 0 and height[v] == h - 1:
+                    # Push
+                    delta = excess[u] if excess[u] < residual[a] else residual[a]
+                    residual[a] -= delta
+                    residual[a ^ 1] += delta
+                    excess[u] -= delta
+                    if excess[v] == 0 and v != t:
+                        active[h - 1].append(v)
+                        if h - 1 > b:
+                            b = h - 1
+                    excess[v] += delta
+                    self.count('pushes')
+                    if residual[a] == 0:
+                        i += 1
+                else:
+                    i += 1
+            current[u] = i if height[u] == h else first[u]
+
+            if work > threshold:
+                work = 0
+                top = global_relabel()
+                b = top
+
+    # Schickt den Überschuss aller Knoten außer s und t zurück zu s, danach ist der Präfluss ein Fluss.
+    # FIFO-Auswahl mit Höhen n + Abstand zu s, ohne Gap-Heuristik.
+    def convert_preflow(self, s: int, t: int) -> None:
+        network: ResidualNetwork = self.network
+        n: int = network.n
+        first, arcs, head, residual = network.first, network.arcs, network.head, network.residual
+        excess: List = self.excess
+        distance: List[int] = self.distances_to(s)
+        height: List[int] = [n + d if d != -1 else 2 * n for d in distance]
+        height[t] = 0
+        queue: List[int] = [u for u in range(n) if excess[u] > 0 and u != s and u != t]
+        for u in queue:
+            h: int = height[u]
+            i: int = first[u]
+            end: int = first[u + 1]
+            while excess[u] > 0:
+                if i == end:
+                    self.count('relabels')
+                    new_height: int = 3 * n
+                    for j in range(first[u], end):
+                        a = arcs[j]
+                        if residual[a] > 0 and height[head[a]] < new_height:
+                            new_height = height[head[a]]
+                    height[u] = h = new_height + 1
+                    i = first[u]
+                    continue
+                a = arcs[i]
+                v: int = head[a]
+                if residual[a] > 0 and height[v] == h - 1:
+                    delta = excess[u] if excess[u] < residual[a] else residual[a]
+                    residual[a] -= delta
+                    residual[a ^ 1] += delta
+                    excess[u] -= delta
+                    if excess[v] == 0 and v != s and v != t:
+                        queue.append(v)
+                    excess[v] += delta
+                    self.count('pushes')
+                else:
+                    i += 1
+
+def main(path: Optional[str] = None) -> None:
+    # Eine DIMACS-Max-Flow-Instanz wird nur gelöst (nur Phase 1), ohne Vergleich mit networkx.
+    if path is not None:
+        graph, source, target = read_dimacs_maxflow(path)
+        print(f"The maximum flow is {Algorithm(graph).run_value(s=source, t=target)}")
+        return
+
+    generate_random_digraph = GenerateRandomDigraph(n=10, p=60)
+    graph = generate_random_digraph.generate()
+
+    source: int = 0
+    target: int = graph.number_of_nodes() - 1
+
+    algorithm = Algorithm(graph)
+
+    calculated_flow, flow = algorithm.run(s=source, t=target)
+    expected_flow, _ = nx.maximum_flow(graph, _s=source, _t=target)
+
+    try:
+        assert(calculated_flow == expected_flow)
+        print("Success: The calculated maximum flow matches the expected value.")
+        print(f"The maximum flow is {calculated_flow}")
+    except AssertionError:
+        print(f"Error: calculated flow ({calculated_flow}) is different from expected flow ({expected_flow})")
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
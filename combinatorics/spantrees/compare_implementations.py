@@ -24,6 +24,10 @@ def main() -> None:
     time = timeit.timeit(lambda: prim.run(), number=iterations)
     print(f"Ausfuehrungszeit der eigenen prim Implementierung: {time} Sekunden")
 
+    # Array-Variante ohne Umwandlung in einen networkx-Graphen, bei diesem dichten Graphen mit O(n^2)-Suche.
+    time = timeit.timeit(lambda: prim.run_arrays(), number=iterations)
+    print(f"Ausfuehrungszeit der eigenen prim Implementierung (Arrays): {time} Sekunden")
+
     # iterations = 5 -> 0,45 seconds
     # iterations = 100 -> 6,2 seconds
     time = timeit.timeit(lambda: nx.minimum_spanning_tree(graph, algorithm="prim"), number=iterations)
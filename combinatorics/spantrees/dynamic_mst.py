@@ -0,0 +1,183 @@
+import sys
+from pathlib import Path
+
+current_file_path = Path(__file__).resolve()
+parent_directory = current_file_path.parent.parent.parent
+sys.path.append(str(parent_directory))
+
+from structs.link_cut_tree import LinkCutTree
+from structs.csr_graph import CSRGraph
+from structs.random_graph_generator import GenerateRandomGraph
+from mst import KruskalAlgorithm
+
+from typing import Dict, Hashable, List, Optional, Tuple, Union
+
+import random
+import networkx as nx
+
+Edge = Tuple[int, int]
+
+class DynamicMST:
+    # Hält einen minimalen Spannwald unter Einfügen, Löschen und Gewichtsänderungen von Kanten aktuell.
+    # Der Wald liegt in einem Link-Cut-Baum, in dem jede Baumkante ein eigener Knoten mit ihrem Gewicht ist,
+    # sodass path_max die schwerste Kante auf einem Baumpfad liefert.
+    # Einfügen und Verringern kosten amortisiert O(log n) (Kreiseigenschaft: die neue Kante ersetzt die
+    # schwerste Kante auf dem Baumpfad, falls sie leichter ist). Beim Löschen oder Erhöhen einer Baumkante wird
+    # unter den Nicht-Baumkanten die leichteste gesucht, die die beiden Teilbäume wieder verbindet.
+    def __init__(self, graph: Optional[Union[nx.Graph, CSRGraph]] = None) -> None:
+        self.tree: LinkCutTree = LinkCutTree()
+        # Knoten des Graphen und ihre Ids im Link-Cut-Baum, der zusätzlich die Kantenknoten enthält.
+        self.labels: Dict[int, Hashable] = {}
+        self.index: Dict[Hashable, int] = {}
+        # Gewichte aller Kanten, Schlüssel sind Paare dichter Ids (kleinere zuerst).
+        self.weights: Dict[Edge, float] = {}
+        # Baumkanten und ihre Knoten im Link-Cut-Baum.
+        self.edge_node: Dict[Edge, int] = {}
+        self.node_edge: Dict[int, Edge] = {}
+        # Freigegebene Kantenknoten, die wiederverwendet werden.
+        self.free_nodes: List[int] = []
+        self.weight = 0
+
+        if graph is not None:
+            self.build(graph)
+
+    # Baut den Anfangszustand mit KruskalAlgorithm auf, alle übrigen Kanten werden Nicht-Baumkanten.
+    def build(self, graph: Union[nx.Graph, CSRGraph]) -> None:
+        csr: CSRGraph = graph if isinstance(graph, CSRGraph) else CSRGraph.from_networkx(graph)
+        for label in csr.to_labels(range(csr.number_of_nodes())):
+            self.add_node(label)
+        ids: List[int] = [self.index[label] for label in csr.to_labels(range(csr.number_of_nodes()))]
+        src, dst, weights = csr.edges()
+        for u, v, weight in zip(src.tolist(), dst.tolist(), weights.tolist()):
+            self.weights[self.key(ids[u], ids[v])] = weight
+        spanning_tree = KruskalAlgorithm(csr).run_arrays()
+        for u, v, weight in zip(spanning_tree.src.tolist(), spanning_tree.dst.tolist(), spanning_tree.weights.tolist()):
+            self.link(self.key(ids[u], ids[v]), weight)
+
+    def add_node(self, label: Hashable) -> int:
+        if label not in self.index:
+            self.index[label] = self.tree.add_node()
+            self.labels[self.index[label]] = label
+        return self.index[label]
+
+    def key(self, u: int, v: int) -> Edge:
+        return (u, v) if u < v else (v, u)
+
+    def edge(self, u: Hashable, v: Hashable) -> Edge:
+        if u not in self.index or v not in self.index or self.key(self.index[u], self.index[v]) not in self.weights:
+            raise KeyError(f"edge ({u}, {v}) is not in the graph")
+        return self.key(self.index[u], self.index[v])
+
+    # Fügt eine Kante in den Wald ein.
+    def link(self, edge: Edge, weight) -> None:
+        node: int = self.free_nodes.pop() if self.free_nodes else self.tree.add_node()
+        self.tree.set_value(node, weight)
+        self.tree.link(edge[0], node)
+        self.tree.link(node, edge[1])
+        self.edge_node[edge] = node
+        self.node_edge[node] = edge
+        self.weight += weight
+
+    # Entfernt eine Baumkante aus dem Wald.
+    def cut(self, edge: Edge) -> None:
+        node: int = self.edge_node.pop(edge)
+        del self.node_edge[node]
+        self.tree.cut(edge[0], node)
+        self.tree.cut(node, edge[1])
+        self.tree.set_value(node, float('-inf'))
+        self.free_nodes.append(node)
+        self.weight -= self.weights[edge]
+
+    # Prüft eine Nicht-Baumkante gegen die Kreiseigenschaft und tauscht sie bei Bedarf in den Wald.
+    def offer(self, edge: Edge) -> None:
+        u, v = edge
+        weight = self.weights[edge]
+        if not self.tree.connected(u, v):
+            self.link(edge, weight)
+            return
+        heaviest: int = self.tree.path_max(u, v)
+        if weight < self.tree.value[heaviest]:
+            self.cut(self.node_edge[heaviest])
+            self.link(edge, weight)
+
+    # Sucht nach dem Entfernen einer Baumkante (u, v) die leichteste Nicht-Baumkante zwischen den Teilbäumen.
+    def replace(self, u: int, v: int) -> None:
+        root_u: int = self.tree.find_root(u)
+        root_v: int = self.tree.find_root(v)
+        best: Optional[Edge] = None
+        for edge, weight in self.weights.items():
+            if edge in self.edge_node or (best is not None and weight >= self.weights[best]):
+                continue
+            roots = (self.tree.find_root(edge[0]), self.tree.find_root(edge[1]))
+            if roots == (root_u, root_v) or roots == (root_v, root_u):
+                best = edge
+        if best is not None:
+            self.link(best, self.weights[best])
+
+    def add_edge(self, u: Hashable, v: Hashable, weight) -> None:
+        if u == v:
+            return
+        edge: Edge = self.key(self.add_node(u), self.add_node(v))
+        if edge in self.weights:
+            self.update_weight(u, v, weight)
+            return
+        self.weights[edge] = weight
+        self.offer(edge)
+
+    def remove_edge(self, u: Hashable, v: Hashable) -> None:
+        edge: Edge = self.edge(u, v)
+        if edge in self.edge_node:
+            self.cut(edge)
+            del self.weights[edge]
+            self.replace(*edge)
+        else:
+            del self.weights[edge]
+
+    def update_weight(self, u: Hashable, v: Hashable, weight) -> None:
+        edge: Edge = self.edge(u, v)
+        old = self.weights[edge]
+        if edge in self.edge_node:
+            if weight <= old:
+                # Eine leichtere Baumkante bleibt im minimalen Spannwald.
+                self.tree.set_value(self.edge_node[edge], weight)
+                self.weight += weight - old
+                self.weights[edge] = weight
+            else:
+                # Eine schwerere Baumkante wird entfernt und konkurriert danach mit den Nicht-Baumkanten.
+                self.cut(edge)
+                self.weights[edge] = weight
+                self.replace(*edge)
+        else:
+            self.weights[edge] = weight
+            if weight < old:
+                self.offer(edge)
+
+    def is_tree_edge(self, u: Hashable, v: Hashable) -> bool:
+        return self.edge(u, v) in self.edge_node
+
+    def total_weight(self):
+        return self.weight
+
+    def number_of_tree_edges(self) -> int:
+        return len(self.edge_node)
+
+    # Gibt den aktuellen Spannwald als networkx-Graphen zurück.
+    def to_networkx(self) -> nx.Graph:
+        forest = nx.Graph()
+        forest.add_nodes_from(self.index)
+        forest.add_weighted_edges_from((self.labels[u], self.labels[v], self.weights[(u, v)]) for u, v in self.edge_node)
+        return forest
+
+if __name__ == "__main__":
+    generate_random_graph = GenerateRandomGraph(50, 20)
+    graph: nx.Graph = generate_random_graph.generate()
+    dynamic_mst = DynamicMST(graph)
+    print(graph)
+    print(dynamic_mst.to_networkx(), dynamic_mst.total_weight())
+
+    # Ändert zufällige Kantengewichte und vergleicht mit einer Neuberechnung.
+    for u, v in random.sample(list(graph.edges()), 10):
+        weight: int = random.randint(1, 10)
+        graph[u][v]['weight'] = weight
+        dynamic_mst.update_weight(u, v, weight)
+    print(dynamic_mst.total_weight(), KruskalAlgorithm(graph).run().size(weight='weight'))
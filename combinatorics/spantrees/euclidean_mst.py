@@ -0,0 +1,108 @@
+import sys
+from pathlib import Path
+
+current_file_path = Path(__file__).resolve()
+parent_directory = current_file_path.parent.parent.parent
+sys.path.append(str(parent_directory))
+
+from structs.csr_graph import CSRGraph
+from mst import KruskalAlgorithm, SpanningTree
+
+from typing import Tuple
+
+import time
+import numpy as np
+import networkx as nx
+
+# SciPy wird nur für die Triangulierung und den k-d-Baum benötigt und ist keine Abhängigkeit der übrigen Module.
+try:
+    from scipy.spatial import Delaunay, QhullError, cKDTree
+except ImportError as error:
+    raise ImportError("euclidean_mst requires scipy for the Delaunay triangulation (pip install scipy)") from error
+
+# Startwert für die Anzahl der Nachbarn im k-Nächste-Nachbarn-Graphen, falls keine Triangulierung möglich ist.
+KNN_NEIGHBORS: int = 8
+
+class EuclideanMSTAlgorithm:
+    # Euklidischer minimaler Spannbaum einer Punktmenge (n x 2 oder n x 3), ohne den vollständigen Graphen aufzubauen.
+    # Der Spannbaum ist immer in der Delaunay-Triangulierung enthalten, die nur O(n) Kanten hat. Ihre Kanten
+    # werden mit den Abständen als Gewichte an KruskalAlgorithm übergeben, insgesamt O(n log n).
+    # Bei entarteten Punktmengen (z.B. alle Punkte auf einer Geraden) wird ein k-Nächste-Nachbarn-Graph
+    # aus einem k-d-Baum verwendet, dessen k verdoppelt wird, bis er zusammenhängend ist.
+    def __init__(self, points: np.ndarray) -> None:
+        self.points: np.ndarray = np.asarray(points, dtype=np.float64)
+        if self.points.ndim != 2 or self.points.shape[1] not in (2, 3):
+            raise ValueError("points must be an array of shape (n, 2) or (n, 3)")
+
+    def run(self) -> nx.Graph:
+        mst: nx.Graph = self.run_arrays().to_networkx()
+        nx.set_node_attributes(mst, dict(enumerate(map(tuple, self.points.tolist()))), 'pos')
+        return mst
+
+    def run_arrays(self) -> SpanningTree:
+        n: int = len(self.points)
+        src, dst = self.candidate_edges()
+        weights: np.ndarray = np.linalg.norm(self.points[src] - self.points[dst], axis=1)
+        graph: CSRGraph = CSRGraph.from_edges(n, src, dst, weights)
+        return KruskalAlgorithm(graph).run_arrays()
+
+    # Gibt die Kandidatenkanten als Arrays (src, dst) zurück, jede Kante genau einmal.
+    def candidate_edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        n: int = len(self.points)
+        if n < 2:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        try:
+            return self.delaunay_edges()
+        except QhullError:
+            return self.knn_edges()
+
+    def delaunay_edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        triangulation = Delaunay(self.points)
+        simplices: np.ndarray = triangulation.simplices
+        k: int = simplices.shape[1]
+        # Alle Paare von Ecken eines Simplex sind Kanten der Triangulierung.
+        pairs = [simplices[:, [i, j]] for i in range(k) for j in range(i + 1, k)]
+        # Doppelte und nicht eingefügte Punkte werden mit ihrer nächsten Ecke verbunden.
+        if len(triangulation.coplanar):
+            pairs.append(triangulation.coplanar[:, [0, 2]])
+        return self.unique_edges(np.concatenate(pairs))
+
+    def knn_edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        n: int = len(self.points)
+        tree = cKDTree(self.points)
+        k: int = min(KNN_NEIGHBORS, n - 1)
+        while True:
+            # Der erste Treffer ist der Punkt selbst.
+            _, neighbors = tree.query(self.points, k=k + 1)
+            pairs: np.ndarray = np.column_stack((np.repeat(np.arange(n), k), neighbors[:, 1:].ravel()))
+            src, dst = self.unique_edges(pairs)
+            count, _ = CSRGraph.from_edges(n, src, dst).components()
+            if count == 1 or k == n - 1:
+                return src, dst
+            k = min(2 * k, n - 1)
+
+    # Normalisiert Kanten auf (kleinerer, größerer) Endpunkt und entfernt Duplikate und Schleifen.
+    def unique_edges(self, pairs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        n: int = len(self.points)
+        pairs = np.sort(pairs.astype(np.int64), axis=1)
+        # Kodiert jedes Paar als eine Zahl, np.unique ist auf eindimensionalen Arrays deutlich schneller.
+        keys: np.ndarray = np.unique(pairs[:, 0] * n + pairs[:, 1])
+        src, dst = np.divmod(keys, n)
+        loops: np.ndarray = src != dst
+        return src[loops], dst[loops]
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    points: np.ndarray = rng.random((200, 2))
+    mst: nx.Graph = EuclideanMSTAlgorithm(points).run()
+
+    # Vergleich mit dem vollständigen Graphen.
+    complete: nx.Graph = nx.complete_graph(len(points))
+    for u, v in complete.edges():
+        complete[u][v]['weight'] = float(np.linalg.norm(points[u] - points[v]))
+    print(mst.size(weight='weight'), nx.minimum_spanning_tree(complete).size(weight='weight'))
+
+    points = rng.random((100000, 2))
+    start: float = time.perf_counter()
+    spanning_tree: SpanningTree = EuclideanMSTAlgorithm(points).run_arrays()
+    print(f"{len(points)} points: {spanning_tree.total_weight():.3f} in {time.perf_counter() - start:.2f}s")
@@ -1,3 +1,4 @@
+import os
 import sys
 from pathlib import Path
 
@@ -5,94 +6,458 @@ current_file_path = Path(__file__).resolve()
 parent_directory = current_file_path.parent.parent.parent
 sys.path.append(str(parent_directory))
 
-from structs.union_find import UnionFind
-from structs.priority_queue import PriorityQueue
+from structs.union_find import ArrayUnionFind
+from structs.priority_queue import PriorityQueue, create_priority_queue
 from structs.random_graph_generator import GenerateRandomGraph
+from structs.csr_graph import CSRGraph
+from structs.graph_readers import load_graph
+from structs.shared_arrays import SharedArrays, Spec, attach
+from structs.instrumentation import Instrumented
 
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Dict
+from multiprocessing import Pool
+from typing import Dict, Hashable, List, Optional, Tuple, Union
 
+import numpy as np
 import networkx as nx
 
-class Algorithm(ABC):
-    def __init__(self, graph: nx.Graph) -> None:
-        self.graph: nx.Graph = graph.copy()
+# PrimAlgorithm wählt die O(n^2)-Array-Variante, wenn der mittlere Grad mindestens DENSE_MIN_DEGREE + n / 400 beträgt.
+# Gemessen kostet ein Schritt der Array-Variante etwa so viel wie 50 Heap-Relaxierungen plus einen Anteil linear in n.
+DENSE_MIN_DEGREE: int = 50
+# Blockgröße für union_many in KruskalAlgorithm, nach jedem Block wird geprüft, ob der Wald vollständig ist.
+KRUSKAL_BLOCK: int = 1024
+# Teilmengen bis zu dieser Größe sortiert Filter-Kruskal direkt.
+FILTER_KRUSKAL_THRESHOLD: int = 4096
+# Mindestanzahl an Bögen pro Worker-Prozess in BoruvkaAlgorithm, kleinere Graphen werden im eigenen Prozess bearbeitet.
+BORUVKA_MIN_ARCS_PER_WORKER: int = 1 << 18
+# Komponenten ab dieser Kantenzahl berechnet SpanningForestAlgorithm in eigenen Worker-Prozessen.
+FOREST_MIN_EDGES_PER_WORKER: int = 1 << 18
+
+class SpanningTree:
+    # Ergebnis eines Spannbaum-Algorithmus als Kanten-Arrays über dichte Ids. Der networkx-Graph mit den
+    # ursprünglichen Knotenbezeichnern wird erst bei Bedarf erzeugt. Bei Prim ist zusätzlich das
+    # Vorgänger-Array parent bekannt (-1 für die Wurzel und nicht erreichte Knoten).
+    # Spannt der Baum nur eine Komponente auf, enthält nodes deren Knoten.
+    def __init__(self, graph: CSRGraph, src: np.ndarray, dst: np.ndarray, weights: np.ndarray, parent: Optional[np.ndarray] = None,
+                 nodes: Optional[np.ndarray] = None) -> None:
+        self.graph: CSRGraph = graph
+        self.src: np.ndarray = np.asarray(src, dtype=np.int64)
+        self.dst: np.ndarray = np.asarray(dst, dtype=np.int64)
+        self.weights: np.ndarray = np.asarray(weights, dtype=graph.weights.dtype)
+        self.parent: Optional[np.ndarray] = parent
+        self.nodes: Optional[np.ndarray] = nodes
+        self._networkx: Optional[nx.Graph] = None
+
+    # Baut den Baum aus einem Vorgänger-Array und dem Gewicht der Kante zum Vorgänger auf.
+    @classmethod
+    def from_parents(cls, graph: CSRGraph, parent: np.ndarray, weights: np.ndarray) -> "SpanningTree":
+        nodes: np.ndarray = np.flatnonzero(parent >= 0)
+        return cls(graph, nodes, parent[nodes], weights[nodes], parent=parent)
+
+    def number_of_edges(self) -> int:
+        return len(self.src)
+
+    def total_weight(self):
+        return self.weights.sum()
+
+    def to_networkx(self) -> nx.Graph:
+        if self._networkx is None:
+            mst = nx.Graph()
+            nodes = range(self.graph.number_of_nodes()) if self.nodes is None else self.nodes.tolist()
+            mst.add_nodes_from(self.graph.to_labels(nodes))
+            mst.add_weighted_edges_from(zip(self.graph.to_labels(self.src.tolist()), self.graph.to_labels(self.dst.tolist()), self.weights.tolist()))
+            self._networkx = mst
+        return self._networkx
+
+class Algorithm(Instrumented, ABC):
+    def __init__(self, graph: Union[nx.Graph, CSRGraph]) -> None:
+        # Die Algorithmen arbeiten auf der kompakten CSR-Darstellung, die Eingabe wird nicht kopiert.
+        self.graph: CSRGraph = graph if isinstance(graph, CSRGraph) else CSRGraph.from_networkx(graph)
 
     @abstractmethod
     def run(self) -> nx.Graph:
         pass
-                                                                                                                                                                                                                                                                                                                                                                                                                                      
+
+    # Baut den Ergebnisbaum aus dichten Ids mit den ursprünglichen Knotenbezeichnern auf.
+    def build_tree(self, src: List[int], dst: List[int], weights: List) -> nx.Graph:
+        return SpanningTree(self.graph, src, dst, weights).to_networkx()
+
 class PrimAlgorithm(Algorithm):
-    def run(self, start: int = 0) -> nx.Graph:
-        mst: nx.Graph = nx.empty_graph(self.graph.number_of_nodes())
-        queue = PriorityQueue()
-        # Setzt den Startknoten als besucht.
-        visited = set([start])
-        # Wörterbuch zur Speicherung der Vorgängerknoten.
-        prev: Dict = {}
+    TRACKED = ('relax',)
+
+    def run(self, start: Optional[Hashable] = None) -> nx.Graph:
+        return self.run_arrays(start).to_networkx()
+
+    # Berechnet den Spannbaum der Komponente von start als Vorgänger-/Gewichts-Arrays. Ohne Angabe von start
+    # beginnt die Suche beim Knoten mit der dichten Id 0. Ohne Angabe von dense wird bei dichten Graphen die
+    # O(n^2)-Array-Variante gewählt, sonst die Variante mit indiziertem Heap.
+    def run_arrays(self, start: Optional[Hashable] = None, dense: Optional[bool] = None) -> SpanningTree:
+        n: int = self.graph.number_of_nodes()
+        if dense is None:
+            dense = self.graph.number_of_arcs() >= n * (DENSE_MIN_DEGREE + n / 400)
+        root: int = 0 if start is None else self.graph.id(start)
+        if dense:
+            parent, arc = self.scan_dense(root)
+        else:
+            parent, arc = self.scan_heap(root)
+        # Das Gewicht der Baumkante eines Knotens ergibt sich aus dem gewählten Bogen. Gelesen wird nur für Knoten
+        # mit Baumkante, ein Graph ohne Kanten hat ein leeres Gewichts-Array.
+        weights: np.ndarray = np.zeros(len(parent), dtype=self.graph.weights.dtype)
+        weights[parent >= 0] = self.graph.weights[arc[parent >= 0]]
+        return SpanningTree.from_parents(self.graph, parent, weights)
 
+    # Prim mit indiziertem Heap: key[v] ist das Gewicht der leichtesten bekannten Kante zum Baum.
+    def scan_heap(self, root: int) -> Tuple[np.ndarray, np.ndarray]:
+        n: int = self.graph.number_of_nodes()
+        # Die CSR-Arrays werden einmal in Listen umgewandelt, da Einzelzugriffe darauf in Python schneller sind.
+        offsets: List[int] = self.graph.offsets.tolist()
+        targets: List[int] = self.graph.targets.tolist()
+        weights: List = self.graph.weights.tolist()
+        # Bei kleinen ganzzahligen Gewichten wird automatisch eine Bucket-Warteschlange gewählt.
+        queue: PriorityQueue = self.track(create_priority_queue(self.graph.weights), 'push', 'pop', 'decrease_key', prefix='queue')
+        visited: List[bool] = [False] * n
+        # Leichteste bekannte Kante zum Baum (key), ihr Endpunkt im Baum (prev) und der zugehörige Bogen (arc).
+        key: List = [None] * n
+        prev: List[int] = [-1] * n
+        arc: List[int] = [-1] * n
+
+        visited[root] = True
         # Fügt die anfänglichen Kanten zum Startknoten in die Warteschlange ein.
-        self.add_initial_edges(start, queue, prev)
+        self.relax(root, offsets, targets, weights, visited, key, prev, arc, queue)
 
         while not queue.empty():
             # Entfernt und gibt den Knoten mit der niedrigsten Kante aus der Warteschlange zurück.
             u: int = queue.pop()
-            if u not in visited:
-                self.update_mst_and_queue(u, visited, mst, queue, prev)
-
-        return mst
-    
-    def add_initial_edges(self, start: int, queue: PriorityQueue, prev: Dict):
-        # Durchläuft alle Nachbarn des Startknotens.
-        for neighbor, d in self.graph[start].items():
-            # Fügt den Nachbarn mit dem Gewicht der Kante zur Warteschlange hinzu.
-            queue.push(neighbor, d['weight'])
-            # Speichert den Startknoten als Vorgänger des Nachbarn.
-            prev[neighbor] = start
-
-    def update_mst_and_queue(self, u: int, visited: set, mst: nx.Graph, queue: PriorityQueue, prev: Dict):
-        # Fügt die Kante zum MST hinzu, wenn ein Vorgänger existiert.
-        if u in prev:
-            mst.add_edge(u, prev[u], weight=self.graph[u][prev[u]]['weight'])
-        # Markiert den Knoten als besucht.
-        visited.add(u)
+            visited[u] = True
+            self.relax(u, offsets, targets, weights, visited, key, prev, arc, queue)
+
+        return np.array(prev, dtype=np.int64), np.array(arc, dtype=np.int64)
 
+    def relax(self, u: int, offsets: List[int], targets: List[int], weights: List, visited: List[bool],
+              key: List, prev: List[int], arc: List[int], queue: PriorityQueue) -> None:
         # Durchläuft alle Nachbarn des neuen Knotens.
-        for v, data in self.graph[u].items():
-            # Überprüft, ob der Nachbar nicht besucht wurde oder eine leichtere Kante existiert.
-            if v not in visited and (v not in prev or data['weight'] < self.graph[v][prev[v]]['weight']):
+        for i in range(offsets[u], offsets[u + 1]):
+            v: int = targets[i]
+            weight = weights[i]
+            # Überprüft, ob der Nachbar nicht besucht wurde und ob eine leichtere Kante existiert.
+            if not visited[v] and (key[v] is None or weight < key[v]):
                 # Aktualisiert die Warteschlange und den Vorgänger für den Nachbarn.
-                queue.push(v, data['weight'])
+                # Jeder Knoten ist höchstens einmal in der Warteschlange, sein Schlüssel wird nur verringert.
+                if v in queue:
+                    queue.decrease_key(v, weight)
+                else:
+                    queue.push(v, weight)
+                key[v] = weight
                 prev[v] = u
+                arc[v] = i
+
+    # Prim für dichte Graphen: In jedem der n Schritte wird der nächste Knoten per argmin über das key-Array
+    # gewählt und seine Nachbarschaft vektorisiert eingearbeitet. Das kostet O(n^2) statt O(m log n).
+    def scan_dense(self, root: int) -> Tuple[np.ndarray, np.ndarray]:
+        n: int = self.graph.number_of_nodes()
+        offsets: np.ndarray = self.graph.offsets
+        targets: np.ndarray = self.graph.targets
+        weights: np.ndarray = self.graph.weights
+        key: np.ndarray = np.full(n, np.inf)
+        parent: np.ndarray = np.full(n, -1, dtype=np.int64)
+        arc: np.ndarray = np.full(n, -1, dtype=np.int64)
+        in_tree: np.ndarray = np.zeros(n, dtype=bool)
+
+        u: int = root
+        for _ in range(n):
+            self.count('dense_steps')
+            in_tree[u] = True
+            # Knoten im Baum werden für die Minimumsuche auf unendlich gesetzt.
+            key[u] = np.inf
+            low, high = offsets[u], offsets[u + 1]
+            neighbors: np.ndarray = targets[low:high]
+            neighbor_weights: np.ndarray = weights[low:high]
+            improved: np.ndarray = np.flatnonzero(~in_tree[neighbors] & (neighbor_weights < key[neighbors]))
+            if len(improved):
+                # Absteigend nach Gewicht sortiert, damit bei Mehrfachkanten die leichteste zuletzt geschrieben wird.
+                improved = improved[np.argsort(neighbor_weights[improved], kind='stable')[::-1]]
+                key[neighbors[improved]] = neighbor_weights[improved]
+                parent[neighbors[improved]] = u
+                arc[neighbors[improved]] = low + improved
+            u = int(np.argmin(key))
+            if key[u] == np.inf:
+                break
+        return parent, arc
 
 class KruskalAlgorithm(Algorithm):
-    def run(self) -> nx.Graph:
-        mst: nx.Graph = nx.empty_graph(self.graph.number_of_nodes())
-        union_find = UnionFind(list(self.graph.nodes()))
-
-        # Sortiert die Kanten des Graphen nach ihrem Gewicht in aufsteigender Reihenfolge.
-        sorted_edges: List[Tuple[int, int, Dict[str, int]]] = sorted(self.graph.edges(data=True), key=lambda x: x[2]['weight'])
-        
-        for u, v, data in sorted_edges:
-            # Überprüft, ob die Hinzufügung der Kante einen Kreis im MST erzeugen würde.
-            if union_find.find(u) != union_find.find(v):
-                # Fügt die Kante zum MST hinzu, wenn kein Kreis entsteht.
-                mst.add_edge(u, v, **data)
-                # Vereinigt die beiden Knoten in der Union-Find-Datenstruktur.
-                union_find.union(u, v)
-
-        return mst
+    def run(self, filter_kruskal: bool = False) -> nx.Graph:
+        return self.run_arrays(filter_kruskal).to_networkx()
+
+    # Sortiert die Gewichte mit einem vektorisierten argsort und bricht ab, sobald der Wald n-1 Kanten hat.
+    # Mit filter_kruskal=True werden die Kanten stattdessen wie bei Quickselect an einem Pivot-Gewicht geteilt:
+    # Zuerst wird der leichte Teil verarbeitet, danach werden aus dem schweren Teil alle Kanten innerhalb einer
+    # bestehenden Komponente verworfen, bevor er weiter geteilt und sortiert wird.
+    # Bei gleichen Gewichten entscheidet in beiden Varianten die Kanten-Id.
+    def run_arrays(self, filter_kruskal: bool = False) -> SpanningTree:
+        n: int = self.graph.number_of_nodes()
+        src, dst, weights = self.graph.edges()
+        union_find: ArrayUnionFind = self.track(ArrayUnionFind(n), 'union_many', 'roots', prefix='union_find')
+        tree: List[np.ndarray] = []
+        # Anzahl der bisher gefundenen Baumkanten als Liste, damit add_edges sie verändern kann.
+        count: List[int] = [0]
+
+        # Verarbeitet aufsteigend sortierte Kanten blockweise mit union_many, bis der Wald vollständig ist.
+        def add_edges(edges: np.ndarray) -> None:
+            for low in range(0, len(edges), KRUSKAL_BLOCK):
+                if count[0] >= n - 1:
+                    return
+                block: np.ndarray = edges[low:low + KRUSKAL_BLOCK]
+                self.count('scanned_edges', len(block))
+                # union_many gibt für jede Kante zurück, ob sie zwei Komponenten verbunden hat.
+                taken: np.ndarray = block[np.array(union_find.union_many(src[block].tolist(), dst[block].tolist()), dtype=bool)]
+                tree.append(taken)
+                count[0] += len(taken)
+
+        if not filter_kruskal:
+            # Sortiert die Kanten des Graphen nach ihrem Gewicht in aufsteigender Reihenfolge.
+            with self.phase('sort'):
+                order: np.ndarray = np.argsort(weights, kind='stable')
+            with self.phase('union'):
+                add_edges(order)
+        else:
+            self.filter_kruskal(np.arange(len(weights)), src, dst, weights, union_find, add_edges, count, n)
+
+        edges: np.ndarray = np.concatenate(tree) if tree else np.empty(0, dtype=np.int64)
+        return SpanningTree(self.graph, src[edges], dst[edges], weights[edges])
+
+    def filter_kruskal(self, edges: np.ndarray, src: np.ndarray, dst: np.ndarray, weights: np.ndarray,
+                       union_find: ArrayUnionFind, add_edges, count: List[int], n: int) -> None:
+        rng = np.random.default_rng(0)
+        # Stapel von Kantenmengen (aufsteigend nach Id), oben liegt jeweils die leichteste.
+        # Einträge mit filter=True werden vor der weiteren Verarbeitung gefiltert.
+        stack: List[Tuple[np.ndarray, bool]] = [(edges, False)]
+        while stack and count[0] < n - 1:
+            part, needs_filter = stack.pop()
+            if needs_filter:
+                # Verwirft Kanten, deren Endpunkte bereits in derselben Komponente liegen.
+                roots: np.ndarray = union_find.roots()
+                kept: np.ndarray = roots[src[part]] != roots[dst[part]]
+                self.count('filtered_edges', len(part) - int(kept.sum()))
+                part = part[kept]
+            if len(part) <= FILTER_KRUSKAL_THRESHOLD:
+                add_edges(part[np.argsort(weights[part], kind='stable')])
+                continue
+
+            part_weights: np.ndarray = weights[part]
+            pivot = part_weights[rng.integers(len(part))]
+            light: np.ndarray = part_weights < pivot
+            if not light.any():
+                # Das Pivot ist das Minimum, dann gehören alle Kanten mit diesem Gewicht zum leichten Teil.
+                light = part_weights <= pivot
+            if light.all():
+                # Alle Gewichte sind gleich, die Reihenfolge ergibt sich aus den Kanten-Ids.
+                add_edges(part)
+                continue
+            stack.append((part[~light], True))
+            stack.append((part[light], False))
+
+# Bestimmt für die Bögen low..high-1 je Komponente den leichtesten ausgehenden Bogen.
+# Gibt die Komponenten und den Rang des jeweils gewählten Bogens zurück.
+def lightest_arcs(sources: np.ndarray, targets: np.ndarray, ranks: np.ndarray, component: np.ndarray,
+                  low: int, high: int) -> Tuple[np.ndarray, np.ndarray]:
+    tail: np.ndarray = component[sources[low:high]]
+    head: np.ndarray = component[targets[low:high]]
+    outgoing: np.ndarray = tail != head
+    # Der Rang jeder Kante ist kleiner als len(ranks), dieser Wert steht für "keine ausgehende Kante".
+    best: np.ndarray = np.full(len(component), len(ranks), dtype=np.int64)
+    np.minimum.at(best, tail[outgoing], ranks[low:high][outgoing])
+    tails: np.ndarray = np.flatnonzero(best < len(ranks))
+    return tails, best[tails]
+
+# Arrays im Shared Memory der Worker-Prozesse von BoruvkaAlgorithm und SpanningForestAlgorithm,
+# gesetzt durch _attach_shared.
+_shared: Dict[str, np.ndarray] = {}
+_blocks: List = []
+
+def _attach_shared(spec: Spec) -> None:
+    global _shared, _blocks
+    _shared, _blocks = attach(spec)
+
+def _lightest_arcs_shared(bounds: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    return lightest_arcs(_shared['sources'], _shared['targets'], _shared['ranks'], _shared['component'], *bounds)
+
+class BoruvkaAlgorithm(Algorithm):
+    def run(self, workers: Optional[int] = None) -> nx.Graph:
+        return self.run_arrays(workers).to_networkx()
+
+    # Borůvka: In jeder Runde wählt jede Komponente ihre leichteste ausgehende Kante, danach werden die
+    # Komponenten entlang dieser Kanten vektorisiert zusammengezogen. Die Suche nach den leichtesten Kanten
+    # wird auf workers Prozesse verteilt (Standard: alle Kerne), die die Bögen im Shared Memory lesen.
+    # Gleiche Gewichte werden nach Kanten-Id entschieden, der Wald ist daher derselbe wie bei KruskalAlgorithm.
+    def run_arrays(self, workers: Optional[int] = None) -> SpanningTree:
+        n: int = self.graph.number_of_nodes()
+        src, dst, weights = self.graph.edges()
+        m: int = len(weights)
+        # Der Rang einer Kante ist ihre Position in der nach (Gewicht, Kanten-Id) sortierten Reihenfolge,
+        # damit sind alle Kanten verschieden schwer und der minimale Spannwald ist eindeutig.
+        order: np.ndarray = np.argsort(weights, kind='stable')
+        rank: np.ndarray = np.empty(m, dtype=np.int64)
+        rank[order] = np.arange(m)
+        if self.graph.directed:
+            # Gerichtete Bögen werden in beiden Richtungen betrachtet.
+            arrays = {'sources': np.concatenate((src, dst)), 'targets': np.concatenate((dst, src)),
+                      'ranks': np.concatenate((rank, rank))}
+        else:
+            arrays = {'sources': self.graph.sources(), 'targets': self.graph.targets, 'ranks': rank[self.graph.edge_ids]}
+        arrays['component'] = np.arange(n, dtype=np.int64)
+
+        arcs: int = len(arrays['targets'])
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = max(1, min(workers, arcs // BORUVKA_MIN_ARCS_PER_WORKER))
+        if workers == 1:
+            tree_ranks: np.ndarray = self.contract(arrays, lambda: [lightest_arcs(arrays['sources'], arrays['targets'], arrays['ranks'], arrays['component'], 0, arcs)])
+        else:
+            bounds: List[Tuple[int, int]] = [(arcs * i // workers, arcs * (i + 1) // workers) for i in range(workers)]
+            with SharedArrays(arrays) as shared, Pool(workers, initializer=_attach_shared, initargs=(shared.spec(),)) as pool:
+                tree_ranks = self.contract(shared.arrays, lambda: pool.map(_lightest_arcs_shared, bounds))
+
+        edges: np.ndarray = np.sort(order[tree_ranks])
+        return SpanningTree(self.graph, src[edges], dst[edges], weights[edges])
+
+    # Führt die Borůvka-Runden aus. search liefert die leichtesten Bögen je Komponente (ggf. aus mehreren Teilen),
+    # arrays['component'] wird nach jeder Runde aktualisiert. Gibt die Ränge der Baumkanten zurück.
+    def contract(self, arrays: Dict[str, np.ndarray], search) -> np.ndarray:
+        n: int = self.graph.number_of_nodes()
+        m: int = self.graph.number_of_edges()
+        sources: np.ndarray = arrays['sources']
+        targets: np.ndarray = arrays['targets']
+        ranks: np.ndarray = arrays['ranks']
+        component: np.ndarray = arrays['component']
+        # Bildet jeden Rang auf einen Bogen der zugehörigen Kante ab.
+        arc_of_rank: np.ndarray = np.empty(m, dtype=np.int64)
+        arc_of_rank[ranks] = np.arange(len(ranks))
+        tree: List[np.ndarray] = []
+
+        while True:
+            self.count('rounds')
+            # Führt die Ergebnisse der Teile zusammen, m steht für "keine ausgehende Kante".
+            best: np.ndarray = np.full(n, m, dtype=np.int64)
+            with self.phase('search'):
+                parts = search()
+            for tails, tail_ranks in parts:
+                np.minimum.at(best, tails, tail_ranks)
+            chosen: np.ndarray = np.flatnonzero(best < m)
+            if not len(chosen):
+                break
+            chosen_ranks: np.ndarray = best[chosen]
+            arc: np.ndarray = arc_of_rank[chosen_ranks]
+            tail: np.ndarray = component[sources[arc]]
+            head: np.ndarray = component[targets[arc]]
+            other: np.ndarray = np.where(tail == chosen, head, tail)
+            # Zwei Komponenten, die dieselbe Kante gewählt haben, würden einen 2-Kreis bilden
+            # und werden deshalb nur einmal als Baumkante gezählt.
+            tree.append(np.unique(chosen_ranks))
+
+            # Jede Komponente zeigt auf die Komponente am anderen Ende ihrer Kante. Bei 2-Kreisen wird die
+            # kleinere Komponente zur Wurzel, danach werden die Wurzeln per Pointer Jumping bestimmt.
+            parent: np.ndarray = np.arange(n, dtype=np.int64)
+            parent[chosen] = other
+            mutual: np.ndarray = (parent[other] == chosen) & (chosen < other)
+            parent[chosen[mutual]] = chosen[mutual]
+            while True:
+                grandparent: np.ndarray = parent[parent]
+                if np.array_equal(grandparent, parent):
+                    break
+                parent = grandparent
+            component[:] = parent[component]
+
+        return np.concatenate(tree) if tree else np.empty(0, dtype=np.int64)
+
+# Berechnet den minimalen Spannbaum der Kanten low..high-1 (eine Komponente) im Worker-Prozess.
+# Gibt die Baumkanten mit den dichten Ids des Gesamtgraphen zurück.
+def _component_tree_shared(bounds: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    low, high = bounds
+    return component_tree(_shared['src'][low:high], _shared['dst'][low:high], _shared['weights'][low:high])
+
+def component_tree(src: np.ndarray, dst: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Nummeriert die Knoten der Komponente dicht durch, damit der Teilgraph nur so groß wie die Komponente ist.
+    nodes, ids = np.unique(np.concatenate((src, dst)), return_inverse=True)
+    graph: CSRGraph = CSRGraph.from_edges(len(nodes), ids[:len(src)], ids[len(src):], weights)
+    spanning_tree: SpanningTree = KruskalAlgorithm(graph).run_arrays()
+    return nodes[spanning_tree.src], nodes[spanning_tree.dst], spanning_tree.weights
+
+class SpanningForestAlgorithm(Algorithm):
+    # Minimaler Spannwald für nicht zusammenhängende Graphen: Ein minimaler Spannbaum je Komponente.
+    def run(self, workers: Optional[int] = None) -> nx.Graph:
+        forest = nx.Graph()
+        forest.add_nodes_from(self.graph.to_labels(range(self.graph.number_of_nodes())))
+        for spanning_tree in self.run_components(workers):
+            forest.add_edges_from(spanning_tree.to_networkx().edges(data=True))
+        return forest
+
+    # Bestimmt zuerst die Komponenten in einem linearen Durchlauf. Komponenten mit mindestens
+    # FOREST_MIN_EDGES_PER_WORKER Kanten werden auf workers Prozesse verteilt (Standard: alle Kerne),
+    # alle kleineren gemeinsam mit einem KruskalAlgorithm-Lauf im eigenen Prozess berechnet.
+    # Gibt je Komponente (nummeriert nach ihrem kleinsten Knoten) einen SpanningTree zurück.
+    def run_components(self, workers: Optional[int] = None) -> List[SpanningTree]:
+        with self.phase('components'):
+            count, label = self.graph.components()
+        self.count('components', count)
+        src, dst, weights = self.graph.edges()
+        # Sortiert die Kanten nach Komponente, die Kanten jeder Komponente liegen danach zusammenhängend
+        # und in der Reihenfolge ihrer Kanten-Ids.
+        order: np.ndarray = np.argsort(label[src], kind='stable')
+        src, dst, weights = src[order], dst[order], weights[order]
+        edge_offsets: np.ndarray = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(label[src], minlength=count), out=edge_offsets[1:])
+        sizes: np.ndarray = np.diff(edge_offsets)
+
+        large: np.ndarray = np.flatnonzero(sizes >= FOREST_MIN_EDGES_PER_WORKER)
+        trees: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        if workers is None:
+            workers = os.cpu_count() or 1
+        bounds: List[Tuple[int, int]] = [(edge_offsets[c], edge_offsets[c + 1]) for c in large.tolist()]
+        if workers > 1 and len(large):
+            with SharedArrays({'src': src, 'dst': dst, 'weights': weights}) as shared, \
+                    Pool(min(workers, len(large)), initializer=_attach_shared, initargs=(shared.spec(),)) as pool:
+                trees = pool.map(_component_tree_shared, bounds)
+        else:
+            trees = [component_tree(src[low:high], dst[low:high], weights[low:high]) for low, high in bounds]
+
+        # Die kleinen Komponenten haben disjunkte Knotenmengen, ein gemeinsamer Lauf ergibt ihre Spannbäume.
+        small: np.ndarray = np.repeat(sizes < FOREST_MIN_EDGES_PER_WORKER, sizes)
+        trees.append(component_tree(src[small], dst[small], weights[small]))
+        tree_src: np.ndarray = np.concatenate([tree[0] for tree in trees])
+        tree_dst: np.ndarray = np.concatenate([tree[1] for tree in trees])
+        tree_weights: np.ndarray = np.concatenate([tree[2] for tree in trees]).astype(weights.dtype)
+
+        # Teilt die Baumkanten und Knoten nach Komponenten auf.
+        tree_order: np.ndarray = np.argsort(label[tree_src], kind='stable')
+        tree_offsets: np.ndarray = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(label[tree_src], minlength=count), out=tree_offsets[1:])
+        node_order: np.ndarray = np.argsort(label, kind='stable')
+        node_offsets: np.ndarray = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(label, minlength=count), out=node_offsets[1:])
+        forest: List[SpanningTree] = []
+        for c in range(count):
+            edges: np.ndarray = tree_order[tree_offsets[c]:tree_offsets[c + 1]]
+            forest.append(SpanningTree(self.graph, tree_src[edges], tree_dst[edges], tree_weights[edges],
+                                       nodes=node_order[node_offsets[c]:node_offsets[c + 1]]))
+        return forest
 
 if __name__ == "__main__":
-    generate_random_graph = GenerateRandomGraph(6, 50)
-    graph: nx.Graph = generate_random_graph.generate()
+    # Optional kann eine Graphdatei (Kantenliste, METIS, Matrix Market oder .bin) übergeben werden.
+    if len(sys.argv) > 1:
+        graph: CSRGraph = load_graph(sys.argv[1])
+    else:
+        generate_random_graph = GenerateRandomGraph(6, 50)
+        graph: nx.Graph = generate_random_graph.generate()
 
     prim = PrimAlgorithm(graph)
     kruskal = KruskalAlgorithm(graph)
+    boruvka = BoruvkaAlgorithm(graph)
 
     min_span_tree_prim = prim.run()
     min_span_tree_kruskal = kruskal.run()
+    min_span_tree_boruvka = boruvka.run()
 
     print(graph)
     print(min_span_tree_prim)
-    print(min_span_tree_kruskal)
\ No newline at end of file
+    print(min_span_tree_kruskal)
+    print(min_span_tree_boruvka)
\ No newline at end of file
@@ -0,0 +1,102 @@
+import numpy as np
+
+from typing import Hashable, Optional
+from structs.csr_graph import CSRGraph
+
+class BottleneckIndex:
+    # Beantwortet Anfragen nach dem größten Kantengewicht auf dem Pfad zwischen zwei Knoten eines Baums oder Walds
+    # (Minimax-Pfad, im minimalen Spannbaum gleich dem Bottleneck-Wert im ursprünglichen Graphen).
+    # Aufbau per Binary Lifting in O(n log n): up[k][v] ist der 2^k-te Vorfahre von v und top[k][v] das größte
+    # Gewicht auf diesem Weg. Eine Anfrage kostet O(log n), query_many beantwortet ganze Arrays vektorisiert.
+    # Knoten werden als dichte Ids 0..n-1 angegeben, query übersetzt Bezeichner über den optionalen Graphen.
+    def __init__(self, n: int, src: np.ndarray, dst: np.ndarray, weights: np.ndarray, graph: Optional[CSRGraph] = None) -> None:
+        self.graph: Optional[CSRGraph] = graph
+        weights = np.asarray(weights)
+        # Neutrales Element für das Maximum, Ergebnis bei Anfragen mit u == v.
+        self.identity = np.iinfo(weights.dtype).min if weights.dtype.kind in 'iu' else -np.inf
+        tree: CSRGraph = CSRGraph.from_edges(n, src, dst, weights)
+        parent, parent_weight, self.depth, self.component = self.root(tree)
+
+        levels: int = max(1, int(n - 1).bit_length())
+        self.up: np.ndarray = np.empty((levels, n), dtype=np.int64)
+        self.top: np.ndarray = np.empty((levels, n), dtype=weights.dtype)
+        self.up[0] = parent
+        self.top[0] = parent_weight
+        for k in range(1, levels):
+            self.up[k] = self.up[k - 1][self.up[k - 1]]
+            self.top[k] = np.maximum(self.top[k - 1], self.top[k - 1][self.up[k - 1]])
+
+    # Baut den Index aus einem SpanningTree (combinatorics/spantrees/mst.py) auf.
+    @classmethod
+    def from_spanning_tree(cls, spanning_tree) -> "BottleneckIndex":
+        graph: CSRGraph = spanning_tree.graph
+        return cls(graph.number_of_nodes(), spanning_tree.src, spanning_tree.dst, spanning_tree.weights, graph=graph)
+
+    # Wurzelt jeden Baum des Walds an seinem kleinsten Knoten per Breitensuche. Wurzeln sind ihr eigener
+    # Vorgänger mit dem neutralen Gewicht.
+    def root(self, tree: CSRGraph):
+        n: int = tree.number_of_nodes()
+        offsets = tree.offsets.tolist()
+        targets = tree.targets.tolist()
+        weights = tree.weights.tolist()
+        parent = list(range(n))
+        parent_weight = [self.identity] * n
+        depth = [-1] * n
+        component = [-1] * n
+        for root in range(n):
+            if depth[root] != -1:
+                continue
+            depth[root] = 0
+            component[root] = root
+            queue = [root]
+            for u in queue:
+                for i in range(offsets[u], offsets[u + 1]):
+                    v: int = targets[i]
+                    if depth[v] == -1:
+                        depth[v] = depth[u] + 1
+                        parent[v] = u
+                        parent_weight[v] = weights[i]
+                        component[v] = root
+                        queue.append(v)
+        return (np.array(parent, dtype=np.int64), np.array(parent_weight, dtype=tree.weights.dtype),
+                np.array(depth, dtype=np.int64), np.array(component, dtype=np.int64))
+
+    def connected(self, u: int, v: int) -> bool:
+        return self.component[u] == self.component[v]
+
+    # Bottleneck-Wert zwischen zwei Knoten (Bezeichner des Graphen, falls angegeben).
+    def query(self, u: Hashable, v: Hashable):
+        if self.graph is not None:
+            u, v = self.graph.id(u), self.graph.id(v)
+        return self.query_many(np.array([u]), np.array([v]))[0]
+
+    # Beantwortet die Anfragen (us[i], vs[i]) für alle i gleichzeitig, us und vs sind Arrays dichter Ids.
+    def query_many(self, us: np.ndarray, vs: np.ndarray) -> np.ndarray:
+        us = np.asarray(us, dtype=np.int64)
+        vs = np.asarray(vs, dtype=np.int64)
+        if np.any(self.component[us] != self.component[vs]):
+            raise ValueError("query contains nodes from different trees")
+        # u ist jeweils der tiefere Knoten.
+        deeper: np.ndarray = self.depth[us] >= self.depth[vs]
+        u: np.ndarray = np.where(deeper, us, vs)
+        v: np.ndarray = np.where(deeper, vs, us)
+        result: np.ndarray = np.full(len(u), self.identity, dtype=self.top.dtype)
+
+        # Hebt u auf die Tiefe von v an.
+        difference: np.ndarray = self.depth[u] - self.depth[v]
+        for k in range(len(self.up)):
+            jump: np.ndarray = (difference >> k) & 1 == 1
+            result[jump] = np.maximum(result[jump], self.top[k][u[jump]])
+            u[jump] = self.up[k][u[jump]]
+
+        # Hebt beide Knoten gleichzeitig an, solange ihre Vorfahren verschieden sind.
+        for k in reversed(range(len(self.up))):
+            jump = self.up[k][u] != self.up[k][v]
+            result[jump] = np.maximum(result[jump], np.maximum(self.top[k][u[jump]], self.top[k][v[jump]]))
+            u[jump] = self.up[k][u[jump]]
+            v[jump] = self.up[k][v[jump]]
+
+        # Verbleibende Paare u != v haben denselben Vorgänger, den gemeinsamen Vorfahren.
+        last: np.ndarray = u != v
+        result[last] = np.maximum(result[last], np.maximum(self.top[0][u[last]], self.top[0][v[last]]))
+        return result
@@ -0,0 +1,162 @@
+import numpy as np
+import networkx as nx
+
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+class CSRGraph:
+    # Kompakte Graphdarstellung im CSR-Format (Compressed Sparse Row). Die ausgehenden Bögen von Knoten u
+    # liegen in targets[offsets[u]:offsets[u + 1]], mit Gewichten in weights und Kanten-Ids in edge_ids.
+    # Ungerichtete Kanten werden als zwei Bögen mit derselben Kanten-Id gespeichert.
+    # Knoten sind intern dichte Ids 0..n-1, labels bildet sie auf die ursprünglichen Bezeichner ab
+    # (None bedeutet, dass die Bezeichner bereits 0..n-1 sind).
+    def __init__(self, offsets: np.ndarray, targets: np.ndarray, weights: np.ndarray, edge_ids: np.ndarray,
+                 directed: bool = False, labels: Optional[List[Hashable]] = None) -> None:
+        self.offsets: np.ndarray = offsets
+        self.targets: np.ndarray = targets
+        self.weights: np.ndarray = weights
+        self.edge_ids: np.ndarray = edge_ids
+        self.directed: bool = directed
+        self.labels: Optional[List[Hashable]] = labels
+        self.index: Optional[Dict[Hashable, int]] = None if labels is None else {label: i for i, label in enumerate(labels)}
+
+    # Baut den Graphen vektorisiert aus Kanten-Arrays auf. Die Kanten-Id ist die Position im Eingabe-Array.
+    @classmethod
+    def from_edges(cls, n: int, src: Iterable[int], dst: Iterable[int], weight: Optional[Iterable] = None,
+                   directed: bool = False, labels: Optional[List[Hashable]] = None) -> "CSRGraph":
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        weight = np.ones(len(src), dtype=np.int64) if weight is None else np.asarray(weight)
+        ids: np.ndarray = np.arange(len(src), dtype=np.int32)
+        if directed:
+            tail, head, arc_weight, arc_ids = src, dst, weight, ids
+        else:
+            tail = np.concatenate((src, dst))
+            head = np.concatenate((dst, src))
+            arc_weight = np.concatenate((weight, weight))
+            arc_ids = np.concatenate((ids, ids))
+
+        # Stabile Sortierung nach Startknoten, die Reihenfolge innerhalb eines Knotens folgt den Kanten-Ids.
+        order: np.ndarray = np.argsort(tail, kind='stable')
+        offsets = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(tail, minlength=n), out=offsets[1:])
+        return cls(offsets, head[order].astype(np.int32), arc_weight[order], arc_ids[order],
+                   directed=directed, labels=labels)
+
+    # Wandelt einen networkx-Graphen um. Ohne Angabe wird bei gerichteten Graphen 'capacity',
+    # sonst 'weight' als Gewicht verwendet, fehlende Attribute zählen als 1. Flussalgorithmen verwenden
+    # stattdessen from_networkx_capacities.
+    @classmethod
+    def from_networkx(cls, graph: Union[nx.Graph, nx.DiGraph], weight: Optional[str] = None) -> "CSRGraph":
+        directed: bool = graph.is_directed()
+        if weight is None:
+            weight = 'capacity' if directed else 'weight'
+        labels: List[Hashable] = list(graph.nodes())
+        index: Dict[Hashable, int] = {label: i for i, label in enumerate(labels)}
+        m: int = graph.number_of_edges()
+        src = np.empty(m, dtype=np.int64)
+        dst = np.empty(m, dtype=np.int64)
+        values: List = [None] * m
+        for k, (u, v, w) in enumerate(graph.edges(data=weight, default=1)):
+            src[k] = index[u]
+            dst[k] = index[v]
+            values[k] = w
+        # Bezeichner 0..n-1 in dieser Reihenfolge benötigen keine Abbildung.
+        if all(type(label) is int and label == i for i, label in enumerate(labels)):
+            labels = None
+        return cls.from_edges(len(index), src, dst, np.array(values) if m else np.empty(0, dtype=np.int64),
+                              directed=directed, labels=labels)
+
+    # Eingabe für Flussalgorithmen: Die Kapazitäten werden unabhängig von der Richtung des Graphen aus dem Attribut
+    # capacity gelesen. Fehlt es an einer Kante, wird ein ValueError ausgelöst, statt still 1 anzunehmen.
+    @classmethod
+    def from_networkx_capacities(cls, graph: Union[nx.Graph, nx.DiGraph], capacity: str = 'capacity') -> "CSRGraph":
+        if any(value is None for _, _, value in graph.edges(data=capacity)):
+            raise ValueError(f"every edge needs a '{capacity}' attribute")
+        return cls.from_networkx(graph, weight=capacity)
+
+    def to_networkx(self, weight: Optional[str] = None) -> Union[nx.Graph, nx.DiGraph]:
+        if weight is None:
+            weight = 'capacity' if self.directed else 'weight'
+        graph = nx.DiGraph() if self.directed else nx.Graph()
+        graph.add_nodes_from(self.to_labels(range(self.number_of_nodes())))
+        src, dst, w = self.edges()
+        graph.add_weighted_edges_from(zip(self.to_labels(src.tolist()), self.to_labels(dst.tolist()), w.tolist()), weight=weight)
+        return graph
+
+    def __str__(self) -> str:
+        kind: str = "directed " if self.directed else ""
+        return f"CSRGraph ({kind}{self.number_of_nodes()} nodes, {self.number_of_edges()} edges)"
+
+    def is_directed(self) -> bool:
+        return self.directed
+
+    def number_of_nodes(self) -> int:
+        return len(self.offsets) - 1
+
+    def number_of_edges(self) -> int:
+        return len(self.targets) if self.directed else len(self.targets) // 2
+
+    def number_of_arcs(self) -> int:
+        return len(self.targets)
+
+    def degree(self, u: int) -> int:
+        return int(self.offsets[u + 1] - self.offsets[u])
+
+    # Nachbarn (dichte Ids) und Gewichte der ausgehenden Bögen eines Knotens als Sichten auf die Arrays.
+    def neighbors(self, u: int) -> np.ndarray:
+        return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+    def neighbor_weights(self, u: int) -> np.ndarray:
+        return self.weights[self.offsets[u]:self.offsets[u + 1]]
+
+    # Startknoten jedes Bogens, passend zu targets.
+    def sources(self) -> np.ndarray:
+        return np.repeat(np.arange(self.number_of_nodes(), dtype=np.int32), np.diff(self.offsets))
+
+    # Gibt jede Kante genau einmal als Arrays (src, dst, weight) zurück, sortiert nach Kanten-Id.
+    def edges(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        order: np.ndarray = np.argsort(self.edge_ids, kind='stable')
+        if not self.directed:
+            # Jede ungerichtete Kante ist genau zweimal gespeichert.
+            order = order[::2]
+        return self.sources()[order], self.targets[order], self.weights[order]
+
+    # Bestimmt die (schwachen) Zusammenhangskomponenten mit einer Breitensuche in einem Durchlauf, O(n + m).
+    # Gibt die Anzahl der Komponenten und die Komponente jedes Knotens zurück, nummeriert nach kleinstem Knoten.
+    def components(self) -> Tuple[int, np.ndarray]:
+        n: int = self.number_of_nodes()
+        if self.directed:
+            # Schwacher Zusammenhang: Die Bögen werden in beiden Richtungen benötigt.
+            src, dst, _ = self.edges()
+            graph: CSRGraph = CSRGraph.from_edges(n, src, dst)
+            return graph.components()
+        offsets: List[int] = self.offsets.tolist()
+        targets: List[int] = self.targets.tolist()
+        label: List[int] = [-1] * n
+        count: int = 0
+        for root in range(n):
+            if label[root] != -1:
+                continue
+            label[root] = count
+            queue: List[int] = [root]
+            for u in queue:
+                for i in range(offsets[u], offsets[u + 1]):
+                    v: int = targets[i]
+                    if label[v] == -1:
+                        label[v] = count
+                        queue.append(v)
+            count += 1
+        return count, np.array(label, dtype=np.int64)
+
+    # Übersetzung zwischen ursprünglichen Bezeichnern und dichten Ids.
+    def id(self, label: Hashable) -> int:
+        return label if self.index is None else self.index[label]
+
+    def label(self, i: int) -> Hashable:
+        return i if self.labels is None else self.labels[i]
+
+    def to_labels(self, ids: Iterable[int]) -> List[Hashable]:
+        if self.labels is None:
+            return list(ids)
+        labels = self.labels
+        return [labels[i] for i in ids]
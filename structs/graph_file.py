@@ -0,0 +1,89 @@
+import struct
+import numpy as np
+
+from pathlib import Path
+from typing import Union
+from structs.csr_graph import CSRGraph
+
+# Binäres Dateiformat für CSRGraph, das ohne Parsen per numpy.memmap geöffnet werden kann.
+#
+# Aufbau (Little Endian):
+#   Header, 64 Bytes: Magic b"GRPYCSR\0", Version (uint32), Flags (uint32, Bit 0 = gerichtet),
+#                     Anzahl Knoten n (uint64), Anzahl Bögen (uint64), dtype der Gewichte (8 Bytes, z.B. b"<i8"),
+#                     danach Nullbytes bis Byte 64
+#   offsets:  (n + 1) x int32
+#   targets:  Bögen x int32
+#   edge_ids: Bögen x int32
+#   weights:  Bögen x dtype der Gewichte
+# Jeder Abschnitt beginnt an einer durch 8 teilbaren Position.
+# Da die Arrays nur lesend eingeblendet werden, teilen sich mehrere Prozesse dieselben Seiten im Page Cache.
+
+MAGIC: bytes = b"GRPYCSR\0"
+VERSION: int = 1
+HEADER = struct.Struct("<8sIIQQ8s")
+HEADER_SIZE: int = 64
+
+def _align(position: int) -> int:
+    return (position + 7) // 8 * 8
+
+# Berechnet die Startpositionen der vier Abschnitte.
+def _layout(n: int, arcs: int, weight_dtype: np.dtype):
+    offsets_start: int = HEADER_SIZE
+    targets_start: int = _align(offsets_start + (n + 1) * 4)
+    edge_ids_start: int = _align(targets_start + arcs * 4)
+    weights_start: int = _align(edge_ids_start + arcs * 4)
+    end: int = weights_start + arcs * weight_dtype.itemsize
+    return offsets_start, targets_start, edge_ids_start, weights_start, end
+
+def write_graph(graph: CSRGraph, path: Union[str, Path]) -> None:
+    if graph.labels is not None:
+        raise ValueError("only graphs with dense node ids 0..n-1 can be written, relabel the graph first")
+    n: int = graph.number_of_nodes()
+    arcs: int = graph.number_of_arcs()
+    weights: np.ndarray = np.asarray(graph.weights)
+    weight_dtype: np.dtype = weights.dtype.newbyteorder("<")
+    layout = _layout(n, arcs, weight_dtype)
+    sections = (
+        np.asarray(graph.offsets, dtype="<i4"),
+        np.asarray(graph.targets, dtype="<i4"),
+        np.asarray(graph.edge_ids, dtype="<i4"),
+        weights.astype(weight_dtype, copy=False),
+    )
+
+    with open(path, "wb") as file:
+        header: bytes = HEADER.pack(MAGIC, VERSION, int(graph.directed), n, arcs, weight_dtype.str.encode("ascii"))
+        file.write(header.ljust(HEADER_SIZE, b"\0"))
+        for start, array in zip(layout, sections):
+            # Auffüllen bis zum Beginn des Abschnitts.
+            file.write(b"\0" * (start - file.tell()))
+            array.tofile(file)
+
+# Öffnet eine Graphdatei. Mit mmap=True werden die Arrays nur eingeblendet und erst bei Zugriff seitenweise gelesen,
+# ansonsten werden sie vollständig in den Speicher geladen.
+def read_graph(path: Union[str, Path], mmap: bool = True) -> CSRGraph:
+    with open(path, "rb") as file:
+        header: bytes = file.read(HEADER_SIZE)
+    if len(header) < HEADER_SIZE:
+        raise ValueError(f"{path}: file is too short for a graph header")
+    magic, version, flags, n, arcs, weight_dtype = HEADER.unpack_from(header)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a graph file")
+    if version != VERSION:
+        raise ValueError(f"{path}: unsupported graph file version {version}")
+    weight_dtype = np.dtype(weight_dtype.rstrip(b"\0").decode("ascii"))
+    offsets_start, targets_start, edge_ids_start, weights_start, _ = _layout(n, arcs, weight_dtype)
+
+    def section(start: int, dtype, count: int) -> np.ndarray:
+        if count == 0:
+            return np.empty(0, dtype=dtype)
+        if mmap:
+            return np.memmap(path, dtype=dtype, mode="r", offset=start, shape=(count,))
+        return np.fromfile(path, dtype=dtype, count=count, offset=start)
+
+    return CSRGraph(
+        section(offsets_start, "<i4", n + 1),
+        section(targets_start, "<i4", arcs),
+        section(weights_start, weight_dtype, arcs),
+        section(edge_ids_start, "<i4", arcs),
+        directed=bool(flags & 1),
+    )
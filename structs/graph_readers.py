@@ -0,0 +1,228 @@
+import numpy as np
+
+from itertools import islice
+from pathlib import Path
+from typing import IO, Iterator, List, Set, Tuple, Union
+from structs.csr_graph import CSRGraph
+from structs.graph_file import read_graph
+
+# Streamende Leser für gängige Benchmark-Formate. Die Dateien werden blockweise gelesen, jeder Block wird
+# in einem Aufruf mit NumPy geparst und direkt in vorab angelegte Kanten-Arrays geschrieben,
+# aus denen CSRGraph.from_edges den Graphen baut. Es entsteht kein networkx-Graph und kein add_edge pro Kante.
+# Knoten werden als dichte Ids 0..n-1 zurückgegeben, 1-basierte Formate werden um eins verschoben.
+
+# Anzahl der Zeilen pro Block.
+CHUNK_LINES: int = 1 << 16
+
+def _chunks(file: IO, chunk_lines: int = CHUNK_LINES) -> Iterator[List[str]]:
+    while True:
+        lines: List[str] = list(islice(file, chunk_lines))
+        if not lines:
+            return
+        yield lines
+
+# Parst die Zeilen eines Blocks als Tabelle mit `columns` Spalten.
+def _parse(lines: List[str], columns: int, dtype=np.int64) -> np.ndarray:
+    values: np.ndarray = np.array(" ".join(lines).split(), dtype=dtype)
+    if len(values) % columns:
+        raise ValueError(f"malformed input: expected {columns} values per line")
+    return values.reshape(-1, columns)
+
+# Ganzzahlige Gewichte bleiben ganzzahlig, ansonsten werden Fließkommazahlen verwendet.
+def _as_weights(values: np.ndarray) -> np.ndarray:
+    if values.dtype.kind == 'f' and np.all(np.mod(values, 1) == 0):
+        return values.astype(np.int64)
+    return values
+
+class _EdgeBuffer:
+    # Sammelt Kanten blockweise. Ist die Anzahl aus dem Dateikopf bekannt, wird einmal passend angelegt,
+    # sonst werden die Blöcke erst am Ende zusammengefügt.
+    def __init__(self, m: int = None, weight_dtype=np.int64) -> None:
+        self.count: int = 0
+        self.parts: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        if m is not None:
+            self.src = np.empty(m, dtype=np.int64)
+            self.dst = np.empty(m, dtype=np.int64)
+            self.weight = np.empty(m, dtype=weight_dtype)
+        self.preallocated: bool = m is not None
+
+    def add(self, src: np.ndarray, dst: np.ndarray, weight: np.ndarray) -> None:
+        k: int = len(src)
+        if self.preallocated:
+            if self.count + k > len(self.src):
+                raise ValueError("input contains more edges than announced in its header")
+            self.src[self.count:self.count + k] = src
+            self.dst[self.count:self.count + k] = dst
+            self.weight[self.count:self.count + k] = weight
+        else:
+            self.parts.append((src, dst, weight))
+        self.count += k
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self.preallocated:
+            return self.src[:self.count], self.dst[:self.count], self.weight[:self.count]
+        if not self.parts:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return tuple(np.concatenate(column) for column in zip(*self.parts))
+
+# DIMACS Max-Flow: "p max n m", "n id s", "n id t", "a u v capacity". Gibt (Graph, s, t) zurück.
+def read_dimacs_maxflow(path: Union[str, Path]) -> Tuple[CSRGraph, int, int]:
+    n: int = 0
+    s: int = -1
+    t: int = -1
+    edges: _EdgeBuffer = None
+    with open(path) as file:
+        for lines in _chunks(file):
+            arcs: List[str] = []
+            for line in lines:
+                kind: str = line[:1]
+                if kind == 'a':
+                    arcs.append(line[1:])
+                elif kind == 'p':
+                    _, problem, nodes, m = line.split()
+                    if problem != 'max':
+                        raise ValueError(f"{path}: expected a max-flow problem, got '{problem}'")
+                    n = int(nodes)
+                    edges = _EdgeBuffer(int(m))
+                elif kind == 'n':
+                    _, node, role = line.split()
+                    if role == 's':
+                        s = int(node) - 1
+                    elif role == 't':
+                        t = int(node) - 1
+            if arcs:
+                if edges is None:
+                    raise ValueError(f"{path}: arc lines before problem line")
+                table: np.ndarray = _parse(arcs, 3)
+                edges.add(table[:, 0] - 1, table[:, 1] - 1, table[:, 2])
+    if edges is None or s < 0 or t < 0:
+        raise ValueError(f"{path}: missing problem line, source or sink")
+    return CSRGraph.from_edges(n, *edges.arrays(), directed=True), s, t
+
+# DIMACS Assignment: "p asn n m", "n id" für jeden Knoten der linken Seite, "a u v cost".
+# Gibt den ungerichteten bipartiten Graphen mit den Kosten als Gewichten und die linke Knotenmenge zurück.
+def read_dimacs_assignment(path: Union[str, Path]) -> Tuple[CSRGraph, Set[int]]:
+    n: int = 0
+    left: Set[int] = set()
+    edges: _EdgeBuffer = None
+    with open(path) as file:
+        for lines in _chunks(file):
+            arcs: List[str] = []
+            for line in lines:
+                kind: str = line[:1]
+                if kind == 'a':
+                    arcs.append(line[1:])
+                elif kind == 'p':
+                    _, problem, nodes, m = line.split()
+                    if problem != 'asn':
+                        raise ValueError(f"{path}: expected an assignment problem, got '{problem}'")
+                    n = int(nodes)
+                    edges = _EdgeBuffer(int(m), weight_dtype=np.float64)
+                elif kind == 'n':
+                    left.add(int(line.split()[1]) - 1)
+            if arcs:
+                if edges is None:
+                    raise ValueError(f"{path}: arc lines before problem line")
+                table: np.ndarray = _parse(arcs, 3, dtype=np.float64)
+                edges.add(table[:, 0].astype(np.int64) - 1, table[:, 1].astype(np.int64) - 1, table[:, 2])
+    if edges is None:
+        raise ValueError(f"{path}: missing problem line")
+    src, dst, weight = edges.arrays()
+    return CSRGraph.from_edges(n, src, dst, _as_weights(weight)), left
+
+# METIS: Kopfzeile "n m [fmt [ncon]]", danach eine Zeile pro Knoten mit seinen (1-basierten) Nachbarn.
+# fmt = 1 bzw. 11 bedeutet Kantengewichte nach jedem Nachbarn, fmt = 10 bzw. 11 ncon Knotengewichte am Zeilenanfang.
+# Jede Kante steht in beiden Zeilen und wird nur einmal (für u < v) übernommen.
+def read_metis(path: Union[str, Path]) -> CSRGraph:
+    with open(path) as file:
+        header: List[str] = []
+        for line in file:
+            if not line.startswith('%') and line.strip():
+                header = line.split()
+                break
+        n, m = int(header[0]), int(header[1])
+        fmt: str = header[2].rjust(3, '0') if len(header) > 2 else "000"
+        has_vertex_weights: bool = fmt[1] == '1'
+        has_edge_weights: bool = fmt[2] == '1'
+        ncon: int = int(header[3]) if len(header) > 3 else (1 if has_vertex_weights else 0)
+        step: int = 2 if has_edge_weights else 1
+
+        edges = _EdgeBuffer(m)
+        u: int = 0
+        for lines in _chunks(file):
+            src: List[np.ndarray] = []
+            dst: List[np.ndarray] = []
+            weight: List[np.ndarray] = []
+            for line in lines:
+                if line.startswith('%'):
+                    continue
+                values: np.ndarray = np.array(line.split(), dtype=np.int64)[ncon:]
+                neighbors: np.ndarray = values[::step] - 1
+                mask: np.ndarray = neighbors > u
+                src.append(np.full(np.count_nonzero(mask), u, dtype=np.int64))
+                dst.append(neighbors[mask])
+                weight.append(values[1::2][mask] if has_edge_weights else np.ones(np.count_nonzero(mask), dtype=np.int64))
+                u += 1
+            if src:
+                edges.add(np.concatenate(src), np.concatenate(dst), np.concatenate(weight))
+    return CSRGraph.from_edges(n, *edges.arrays())
+
+# Matrix Market im Koordinatenformat. Quadratische Matrizen werden als Graph gelesen (symmetric: ungerichtet,
+# general: gerichtet), rechteckige als bipartiter Graph mit Zeilen 0..r-1 und Spalten r..r+c-1.
+# Bei 'pattern' erhalten alle Kanten das Gewicht 1.
+def read_matrix_market(path: Union[str, Path]) -> CSRGraph:
+    with open(path) as file:
+        banner: List[str] = file.readline().lower().split()
+        if len(banner) < 5 or banner[0] != '%%matrixmarket' or banner[2] != 'coordinate':
+            raise ValueError(f"{path}: only Matrix Market coordinate files are supported")
+        field, symmetry = banner[3], banner[4]
+        for line in file:
+            if not line.startswith('%') and line.strip():
+                rows, cols, nnz = (int(value) for value in line.split())
+                break
+        pattern: bool = field == 'pattern'
+        columns: int = 2 if pattern else 3
+        bipartite: bool = rows != cols
+        directed: bool = not bipartite and symmetry == 'general'
+
+        edges = _EdgeBuffer(nnz, weight_dtype=np.float64)
+        for lines in _chunks(file):
+            table: np.ndarray = _parse([line for line in lines if not line.startswith('%')], columns, dtype=np.float64)
+            src: np.ndarray = table[:, 0].astype(np.int64) - 1
+            dst: np.ndarray = table[:, 1].astype(np.int64) - 1
+            if bipartite:
+                dst += rows
+            weight: np.ndarray = np.ones(len(table)) if pattern else table[:, 2]
+            edges.add(src, dst, weight)
+    src, dst, weight = edges.arrays()
+    return CSRGraph.from_edges(rows + cols if bipartite else rows, src, dst, _as_weights(weight), directed=directed)
+
+# Kantenliste mit Zeilen "u v [weight]" und nicht-negativen ganzzahligen Knoten, Kommentare beginnen mit '#' oder '%'.
+def read_edge_list(path: Union[str, Path], directed: bool = False) -> CSRGraph:
+    edges = _EdgeBuffer(weight_dtype=np.float64)
+    columns: int = 0
+    with open(path) as file:
+        for lines in _chunks(file):
+            data: List[str] = [line for line in lines if line.strip() and line[0] not in '#%']
+            if not data:
+                continue
+            if not columns:
+                columns = len(data[0].split())
+            table: np.ndarray = _parse(data, columns, dtype=np.float64)
+            weight: np.ndarray = table[:, 2] if columns > 2 else np.ones(len(table))
+            edges.add(table[:, 0].astype(np.int64), table[:, 1].astype(np.int64), weight)
+    src, dst, weight = edges.arrays()
+    n: int = int(max(src.max(), dst.max())) + 1 if len(src) else 0
+    return CSRGraph.from_edges(n, src, dst, _as_weights(weight), directed=directed)
+
+# Liest einen ungerichteten Graphen anhand der Dateiendung: .bin (structs.graph_file), .graph/.metis, .mtx,
+# sonst Kantenliste.
+def load_graph(path: Union[str, Path]) -> CSRGraph:
+    suffix: str = Path(path).suffix.lower()
+    if suffix == '.bin':
+        return read_graph(path)
+    if suffix in ('.graph', '.metis'):
+        return read_metis(path)
+    if suffix == '.mtx':
+        return read_matrix_market(path)
+    return read_edge_list(path)
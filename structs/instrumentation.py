@@ -0,0 +1,134 @@
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterator, Optional, Tuple
+
+# Optionale Messung der Hot Paths aller Algorithmen. Ohne enable_stats() sind weder Methoden umhüllt noch
+# wird gezählt, die Kosten beschränken sich auf eine Abfrage von self.stats pro Lauf bzw. pro Phase.
+
+class Stats:
+    # Zähler (Aufrufe, Augmentierungen, Dualanpassungen, ...) und Dauer benannter Phasen eines Laufs.
+    def __init__(self) -> None:
+        self.counters: Dict[str, int] = {}
+        self.phases: Dict[str, float] = {}
+        # Ergebnis von Instrumented.profile: Textausgabe von cProfile bzw. tracemalloc und Spitzenspeicher.
+        self.profile: Optional[str] = None
+        self.peak_bytes: Optional[int] = None
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def reset(self) -> None:
+        self.counters.clear()
+        self.phases.clear()
+        self.profile = None
+        self.peak_bytes = None
+
+    # Flache Darstellung für JSON, Phasen erhalten das Präfix "phase.".
+    def as_dict(self) -> Dict[str, float]:
+        result: Dict[str, float] = dict(self.counters)
+        result.update({f"phase.{name}": seconds for name, seconds in self.phases.items()})
+        if self.peak_bytes is not None:
+            result["peak_bytes"] = self.peak_bytes
+        return result
+
+    def __str__(self) -> str:
+        lines = [f"{name}: {value}" for name, value in sorted(self.counters.items())]
+        lines += [f"phase {name}: {seconds:.4f}s" for name, seconds in sorted(self.phases.items())]
+        if self.peak_bytes is not None:
+            lines.append(f"peak memory: {self.peak_bytes / 2 ** 20:.1f} MiB")
+        return "\n".join(lines)
+
+# Ersetzt die Methode name von obj durch eine Hülle, die jeden Aufruf unter counter zählt. Die Hülle wird als
+# Instanzattribut gesetzt, die Klasse bleibt unverändert. Eine bereits vorhandene Hülle wird ersetzt.
+def _track(obj, name: str, counter: str, stats: Stats) -> None:
+    method = getattr(obj, name)
+    method = getattr(method, '__wrapped__', method)
+    counters: Dict[str, int] = stats.counters
+
+    def wrapper(*args, **kwargs):
+        counters[counter] = counters.get(counter, 0) + 1
+        return method(*args, **kwargs)
+
+    wrapper.__wrapped__ = method
+    setattr(obj, name, wrapper)
+
+def _untrack(obj, name: str) -> None:
+    if hasattr(getattr(obj, name, None), '__wrapped__') and name in vars(obj):
+        delattr(obj, name)
+
+class Instrumented:
+    # Mixin für Algorithmen. Methoden in TRACKED werden nach enable_stats() pro Aufruf gezählt,
+    # Hilfsstrukturen (Union-Find, Warteschlangen, Matroid-Orakel) meldet der Algorithmus mit track() an.
+    TRACKED: Tuple[str, ...] = ()
+    stats: Optional[Stats] = None
+
+    def enable_stats(self) -> Stats:
+        self.stats = Stats()
+        for name in self.TRACKED:
+            _track(self, name, name, self.stats)
+        return self.stats
+
+    def disable_stats(self) -> None:
+        for name in self.TRACKED:
+            _untrack(self, name)
+        self.stats = None
+
+    # Zählt die Aufrufe der angegebenen Methoden von obj als "<prefix>.<methode>" und gibt obj zurück.
+    # Ohne aktive Messung wird obj unverändert zurückgegeben.
+    def track(self, obj, *methods: str, prefix: str = ""):
+        if self.stats is not None:
+            for name in methods:
+                _track(obj, name, f"{prefix}.{name}" if prefix else name, self.stats)
+        return obj
+
+    # Entfernt die mit track() an obj angebrachten Hüllen. Für Objekte des Aufrufers, damit nach dem Lauf keine
+    # Hülle mehr in eine veraltete Stats-Instanz zählt.
+    def untrack(self, obj, *methods: str) -> None:
+        for name in methods:
+            _untrack(obj, name)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        if self.stats is not None:
+            self.stats.count(name, amount)
+
+    def phase(self, name: str):
+        return nullcontext() if self.stats is None else self.stats.phase(name)
+
+    # Führt die Methode method unter cProfile (mode="cprofile") oder tracemalloc (mode="tracemalloc") aus.
+    # Die Auswertung steht danach in stats.profile, bei tracemalloc zusätzlich der Spitzenspeicher in stats.peak_bytes.
+    def profile(self, method: str, *args, mode: str = "cprofile", limit: int = 20, **kwargs):
+        if self.stats is None:
+            self.enable_stats()
+        self.stats.reset()
+        run = getattr(self, method)
+        if mode == "cprofile":
+            profiler = cProfile.Profile()
+            result = profiler.runcall(run, *args, **kwargs)
+            output = io.StringIO()
+            pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(limit)
+            self.stats.profile = output.getvalue()
+        elif mode == "tracemalloc":
+            tracemalloc.start()
+            try:
+                result = run(*args, **kwargs)
+                snapshot = tracemalloc.take_snapshot()
+                _, self.stats.peak_bytes = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            self.stats.profile = "\n".join(str(line) for line in snapshot.statistics("lineno")[:limit])
+        else:
+            raise ValueError(f"unknown profiling mode '{mode}'")
+        return result
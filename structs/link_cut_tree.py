@@ -0,0 +1,154 @@
+from typing import List
+
+class LinkCutTree:
+    # Link-Cut-Baum (Sleator/Tarjan) über einem Wald mit Knoten 0..n-1. Jeder Knoten trägt einen Wert,
+    # path_max liefert den Knoten mit dem größten Wert auf dem Pfad zwischen zwei Knoten.
+    # Alle Operationen kosten amortisiert O(log n). Die bevorzugten Pfade werden als Splay-Bäume in
+    # Listen gespeichert (left, right, parent), parent eines Splay-Wurzelknotens ist der Path-Parent-Zeiger.
+    def __init__(self, n: int = 0) -> None:
+        self.left: List[int] = []
+        self.right: List[int] = []
+        self.parent: List[int] = []
+        # Gesetzt, wenn die Kinder des Teilbaums vertauscht werden müssen (für make_root).
+        self.reversed: List[bool] = []
+        self.value: List = []
+        # Knoten mit dem größten Wert im Splay-Teilbaum.
+        self.best: List[int] = []
+        for _ in range(n):
+            self.add_node()
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    # Fügt einen isolierten Knoten hinzu und gibt seine Id zurück.
+    def add_node(self, value=float('-inf')) -> int:
+        x: int = len(self.value)
+        self.left.append(-1)
+        self.right.append(-1)
+        self.parent.append(-1)
+        self.reversed.append(False)
+        self.value.append(value)
+        self.best.append(x)
+        return x
+
+    def _is_splay_root(self, x: int) -> bool:
+        p: int = self.parent[x]
+        return p == -1 or (self.left[p] != x and self.right[p] != x)
+
+    def _push(self, x: int) -> None:
+        if self.reversed[x]:
+            self.reversed[x] = False
+            left, right = self.left[x], self.right[x]
+            self.left[x], self.right[x] = right, left
+            if left != -1:
+                self.reversed[left] = not self.reversed[left]
+            if right != -1:
+                self.reversed[right] = not self.reversed[right]
+
+    def _update(self, x: int) -> None:
+        best: int = x
+        for child in (self.left[x], self.right[x]):
+            if child != -1 and self.value[self.best[child]] > self.value[best]:
+                best = self.best[child]
+        self.best[x] = best
+
+    def _rotate(self, x: int) -> None:
+        p: int = self.parent[x]
+        g: int = self.parent[p]
+        if not self._is_splay_root(p):
+            if self.left[g] == p:
+                self.left[g] = x
+            else:
+                self.right[g] = x
+        self.parent[x] = g
+        if self.left[p] == x:
+            child: int = self.right[x]
+            self.left[p] = child
+            self.right[x] = p
+        else:
+            child = self.left[x]
+            self.right[p] = child
+            self.left[x] = p
+        if child != -1:
+            self.parent[child] = p
+        self.parent[p] = x
+        self._update(p)
+        self._update(x)
+
+    def _splay(self, x: int) -> None:
+        # Schiebt ausstehende Vertauschungen von der Splay-Wurzel bis x nach unten.
+        path: List[int] = [x]
+        while not self._is_splay_root(path[-1]):
+            path.append(self.parent[path[-1]])
+        for y in reversed(path):
+            self._push(y)
+
+        while not self._is_splay_root(x):
+            p: int = self.parent[x]
+            if not self._is_splay_root(p):
+                g: int = self.parent[p]
+                # Zig-Zig rotiert zuerst den Elternknoten, Zig-Zag zweimal x.
+                if (self.left[g] == p) == (self.left[p] == x):
+                    self._rotate(p)
+                else:
+                    self._rotate(x)
+            self._rotate(x)
+
+    # Macht den Pfad von der Wurzel bis x zum bevorzugten Pfad, x ist danach Wurzel seines Splay-Baums.
+    def _access(self, x: int) -> None:
+        last: int = -1
+        y: int = x
+        while y != -1:
+            self._splay(y)
+            self.right[y] = last
+            self._update(y)
+            last = y
+            y = self.parent[y]
+        self._splay(x)
+
+    def make_root(self, x: int) -> None:
+        self._access(x)
+        self.reversed[x] = not self.reversed[x]
+
+    def find_root(self, x: int) -> int:
+        self._access(x)
+        self._push(x)
+        while self.left[x] != -1:
+            x = self.left[x]
+            self._push(x)
+        self._splay(x)
+        return x
+
+    def connected(self, x: int, y: int) -> bool:
+        return x == y or self.find_root(x) == self.find_root(y)
+
+    # Verbindet zwei Knoten aus verschiedenen Bäumen durch eine Kante.
+    def link(self, x: int, y: int) -> None:
+        if self.connected(x, y):
+            raise ValueError(f"nodes {x} and {y} are already connected")
+        self.make_root(x)
+        self.parent[x] = y
+
+    # Entfernt die Kante zwischen x und y.
+    def cut(self, x: int, y: int) -> None:
+        self.make_root(x)
+        self._access(y)
+        # Nach access(y) mit Wurzel x ist x genau dann Nachbar von y, wenn x der linke Teilbaum von y ohne
+        # rechtes Kind ist.
+        self._push(x)
+        if self.left[y] != x or self.right[x] != -1:
+            raise ValueError(f"nodes {x} and {y} are not adjacent")
+        self.left[y] = -1
+        self.parent[x] = -1
+        self._update(y)
+
+    # Gibt den Knoten mit dem größten Wert auf dem Pfad von x nach y zurück.
+    def path_max(self, x: int, y: int) -> int:
+        self.make_root(x)
+        self._access(y)
+        return self.best[y]
+
+    def set_value(self, x: int, value) -> None:
+        self._access(x)
+        self.value[x] = value
+        self._update(x)
@@ -1,8 +1,8 @@
 import networkx as nx
 
 from abc import ABC, abstractmethod
-from typing import Set, Tuple, List
-from structs.union_find import UnionFind
+from typing import Set, Tuple, List, Dict, Hashable
+from structs.union_find import RollbackUnionFind
 
 class Matroid(ABC):
     def __init__(self, groundset: Set) -> None:
@@ -20,49 +20,161 @@ class Matroid(ABC):
     def rank(self, U) -> int:
         pass
 
-class GraphMatroid(Matroid):
+    # Inkrementelles Orakel: Eine unabhängige Basismenge I wird einmal geladen, danach beziehen sich
+    # can_add, can_exchange und fundamental_circuit auf diese Menge. Die Standardimplementierungen
+    # greifen auf independent zurück, Unterklassen ersetzen sie durch günstige Anfragen.
+    def load(self, I: Set) -> None:
+        self.current: Set = set(I)
+
+    # Gibt zurück, ob I | {e} unabhängig ist.
+    def can_add(self, e) -> bool:
+        return self.independent(self.current | {e})
+
+    # Gibt zurück, ob I - {out} | {in} unabhängig ist.
+    def can_exchange(self, out, in_) -> bool:
+        return self.independent(self.current - {out} | {in_})
+
+    # Gibt den fundamentalen Kreis C(I, e) inklusive e zurück bzw. eine leere Menge, falls I | {e} unabhängig ist.
+    def fundamental_circuit(self, e) -> Set:
+        extended: Set = self.current | {e}
+        if self.independent(extended):
+            return set()
+        return {x for x in extended if self.independent(extended - {x})}
+
+class GraphicOracle:
+    # Inkrementelles Orakel für graphische Matroide. Die geladene Menge I ist ein Wald, der einmal
+    # per Tiefensuche indiziert wird (Elternkante, Tiefe, Ein-/Austrittszeit, Komponente).
+    # can_add und can_exchange kosten danach O(1), fundamental_circuit O(Länge des Baumpfades).
+    def load(self, I: Set) -> None:
+        self.current: Set = set(I)
+        adjacency: Dict[Hashable, List] = {}
+        for edge in self.current:
+            if isinstance(edge, tuple) and len(edge) == 2:
+                u, v = edge
+                adjacency.setdefault(u, []).append((v, edge))
+                adjacency.setdefault(v, []).append((u, edge))
+
+        self.parent: Dict = {}
+        self.parent_edge: Dict = {}
+        self.depth: Dict = {}
+        self.component: Dict = {}
+        self.tin: Dict = {}
+        self.tout: Dict = {}
+        clock: int = 0
+        for root in adjacency:
+            if root in self.component:
+                continue
+            self.depth[root] = 0
+            self.component[root] = root
+            self.tin[root] = clock
+            clock += 1
+            # Iterative Tiefensuche, der Stapel enthält (Knoten, Iterator über seine Nachbarn).
+            stack = [(root, iter(adjacency[root]))]
+            while stack:
+                node, neighbors = stack[-1]
+                for neighbor, edge in neighbors:
+                    if neighbor not in self.component:
+                        self.parent[neighbor] = node
+                        self.parent_edge[neighbor] = edge
+                        self.depth[neighbor] = self.depth[node] + 1
+                        self.component[neighbor] = root
+                        self.tin[neighbor] = clock
+                        clock += 1
+                        stack.append((neighbor, iter(adjacency[neighbor])))
+                        break
+                else:
+                    self.tout[node] = clock
+                    stack.pop()
+
+    def can_add(self, e) -> bool:
+        if e in self.current or not (isinstance(e, tuple) and len(e) == 2):
+            return True
+        u, v = e
+        if u == v:
+            return False
+        component_u = self.component.get(u)
+        # Knoten ohne Kante in I bilden eigene Komponenten.
+        return component_u is None or component_u != self.component.get(v)
+
+    def can_exchange(self, out, in_) -> bool:
+        if self.can_add(in_):
+            return True
+        if out not in self.current:
+            return False
+        # I - {out} | {in} ist genau dann unabhängig, wenn out auf dem Baumpfad zwischen den Endpunkten von in liegt,
+        # d.h. wenn genau ein Endpunkt im Teilbaum unter out liegt.
+        a, b = out
+        child = b if self.parent.get(b) == a else a
+        u, v = in_
+        return self._in_subtree(u, child) != self._in_subtree(v, child)
+
+    def fundamental_circuit(self, e) -> Set:
+        if self.can_add(e):
+            return set()
+        u, v = e
+        circuit: Set = {e}
+        # Beide Endpunkte laufen zum niedrigsten gemeinsamen Vorfahren hoch.
+        while u != v:
+            if self.depth[u] < self.depth[v]:
+                u, v = v, u
+            circuit.add(self.parent_edge[u])
+            u = self.parent[u]
+        return circuit
+
+    def _in_subtree(self, x, root) -> bool:
+        return x in self.tin and self.tin[root] <= self.tin[x] < self.tout[root]
+
+class GraphMatroid(GraphicOracle, Matroid):
     def __init__(self, graph: nx.Graph) -> None:
         self.graph = graph.copy()
         super().__init__({e: data['weight'] for e, data in graph.edges.items()})
-        self.union_find = UnionFind(list(graph.nodes()))
+        self.union_find = RollbackUnionFind(graph.nodes())
 
     def minarg(self, U: Set) -> Set:
         return min(U, key=lambda x: self.groundset[x])
 
     def independent(self, U: Set) -> bool:
-        temp_union_find = self.union_find.copy()
-        for u, v in U:
-            if temp_union_find.find(u) == temp_union_find.find(v):
-                return False
-            temp_union_find.union(u, v)
-        return True
+        # Statt die Union-Find-Struktur zu kopieren, werden die Vereinigungen nach dem Test zurückgenommen.
+        checkpoint: int = self.union_find.checkpoint()
+        try:
+            for u, v in U:
+                if self.union_find.find(u) == self.union_find.find(v):
+                    return False
+                self.union_find.union(u, v)
+            return True
+        finally:
+            self.union_find.rollback(checkpoint)
     
     def rank(self, U: Set) -> int:
         rank: int = 0
-        temp_union_find = self.union_find.copy()
+        checkpoint: int = self.union_find.checkpoint()
         for u, v in U:
-            if temp_union_find.find(u) != temp_union_find.find(v):
-                temp_union_find.union(u, v)
+            if self.union_find.find(u) != self.union_find.find(v):
+                self.union_find.union(u, v)
                 rank += 1
+        self.union_find.rollback(checkpoint)
         return rank
 
-class UnweightedGraphMatroid(Matroid):
+class UnweightedGraphMatroid(GraphicOracle, Matroid):
     def __init__(self, graph: nx.Graph) -> None:
         self.graph = graph.copy()
-        self.union_find = UnionFind(list(graph.nodes()))
+        self.union_find = RollbackUnionFind(graph.nodes())
 
     def minarg(self, U: Set) -> Tuple:
         return min(U, key=lambda edge: nx.shortest_path_length(self.graph, *edge))
 
     def independent(self, U: Set) -> bool:
-        temp_union_find = self.union_find.copy()
-        for edge in U:
-            if isinstance(edge, tuple) and len(edge) == 2:
-                u, v = edge
-                if temp_union_find.find(u) == temp_union_find.find(v):
-                    return False
-                temp_union_find.union(u, v)
-        return True
+        checkpoint: int = self.union_find.checkpoint()
+        try:
+            for edge in U:
+                if isinstance(edge, tuple) and len(edge) == 2:
+                    u, v = edge
+                    if self.union_find.find(u) == self.union_find.find(v):
+                        return False
+                    self.union_find.union(u, v)
+            return True
+        finally:
+            self.union_find.rollback(checkpoint)
 
     def rank(self, U: Set) -> int:
         return sum(1 for u, v in U if self.union_find.find(u) != self.union_find.find(v))
@@ -91,6 +203,30 @@ class PartitionMatroid(Matroid):
                     return False
         return True
 
+    # Zählt pro Block, wie viele Elemente der geladenen Menge I darin liegen.
+    def load(self, I: Set) -> None:
+        self.current: Set = set(I)
+        self.block_members: List[Set] = [set() for _ in self.partitions]
+        for element in self.current:
+            partition_index = self.element_to_partition.get(element)
+            if partition_index is not None:
+                self.block_members[partition_index].add(element)
+
+    def can_add(self, e) -> bool:
+        partition_index = self.element_to_partition.get(e)
+        return partition_index is None or e in self.current or not self.block_members[partition_index]
+
+    def can_exchange(self, out, in_) -> bool:
+        if self.can_add(in_):
+            return True
+        # Der Block von in ist bereits belegt, daher muss out genau dieses Element sein.
+        return out in self.current and self.element_to_partition.get(out) == self.element_to_partition[in_]
+
+    def fundamental_circuit(self, e) -> Set:
+        if self.can_add(e):
+            return set()
+        return self.block_members[self.element_to_partition[e]] | {e}
+
     def rank(self, U: Set) -> int:
         unique_partitions = set()
         for element in U:
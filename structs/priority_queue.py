@@ -1,34 +1,247 @@
-from typing import List, Tuple
+from numbers import Integral
+from typing import List, Tuple, Dict, Hashable, Iterable, Union
+
+# Größte Gewichtsschranke W, bis zu der create_priority_queue eine Bucket-Warteschlange wählt.
+BUCKET_QUEUE_LIMIT: int = 1 << 16
 
 class PriorityQueue:
+    # Indizierter binärer Min-Heap: Jedes Element ist höchstens einmal enthalten,
+    # seine Position im Heap wird mitgeführt, damit decrease_key in O(log n) möglich ist.
     def __init__(self) -> None:
-        self.heap: List[Tuple[int, int]] = []
+        self.heap: List[Tuple[int, Hashable]] = []
+        # Position jedes Elements im Heap.
+        self.position: Dict[Hashable, int] = {}
 
     # Fügt ein Element mit einer bestimmten Priorität zur Warteschlange hinzu.
-    def push(self, item: int, priotity: int) -> None:
+    # Ist das Element bereits enthalten, wird seine Priorität nur verringert, falls die neue kleiner ist.
+    def push(self, item: Hashable, priority: int) -> None:
+        if item in self.position:
+            if priority < self.heap[self.position[item]][0]:
+                self.decrease_key(item, priority)
+            return
         # Fügt das Element als Tupel (Priorität, Element) zum Heap hinzu.
-        self.heap.append((priotity, item))
+        self.heap.append((priority, item))
+        self.position[item] = len(self.heap) - 1
         # Stellt die Heap-Eigenschaft von unten nach oben wieder her.
         self._heapify_up(len(self.heap) - 1)
 
     # Entfernt und gibt das Element mit der höchsten Priorität (niedrigster Wert) zurück.
-    def pop(self) -> int:
-        # Entfernt das erste Element aus dem Heap und gibt es zurück.
-        return self.heap.pop(0)[1]
-    
+    def pop(self) -> Hashable:
+        # Tauscht die Wurzel mit dem letzten Element, entfernt sie und lässt das neue Wurzelelement absinken.
+        self._swap(0, len(self.heap) - 1)
+        _, item = self.heap.pop()
+        del self.position[item]
+        if self.heap:
+            self._heapify_down(0)
+        return item
+
+    # Verringert die Priorität eines enthaltenen Elements.
+    def decrease_key(self, item: Hashable, priority: int) -> None:
+        i: int = self.position[item]
+        if priority > self.heap[i][0]:
+            raise ValueError("decrease_key: new priority is larger than the current one")
+        self.heap[i] = (priority, item)
+        self._heapify_up(i)
+
+    # Baut den Heap aus (Element, Priorität)-Paaren in O(n) auf und ersetzt den bisherigen Inhalt.
+    def heapify(self, items: Iterable[Tuple[Hashable, int]]) -> None:
+        self.heap = [(priority, item) for item, priority in items]
+        self.position = {item: i for i, (_, item) in enumerate(self.heap)}
+        if len(self.position) != len(self.heap):
+            raise ValueError("heapify: items must be unique")
+        # Lässt alle inneren Knoten von unten nach oben absinken.
+        for i in range(len(self.heap) // 2 - 1, -1, -1):
+            self._heapify_down(i)
+
     def empty(self) -> bool:
         return len(self.heap) == 0
-    
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self.position
+
     # Stellt die Heap-Eigenschaft von einem gegebenen Index aus nach oben wieder her.
     def _heapify_up(self, i: int) -> None:
-        # Berechnet den Index des Elternelements.
-        parent: int = (i - 1) // 2
-        # Überprüft, ob das aktuelle Element eine höhere Priorität als sein Elternteil hat.
-        if parent >= 0 and self.heap[i][0] < self.heap[parent][0]:
+        heap = self.heap
+        while i > 0:
+            # Berechnet den Index des Elternelements.
+            parent: int = (i - 1) // 2
+            # Abbruch, sobald das Elternteil keine niedrigere Priorität als das aktuelle Element hat.
+            if heap[i][0] >= heap[parent][0]:
+                break
             # Tauscht das aktuelle Element mit seinem Elternteil.
             self._swap(i, parent)
-            # Wiederholt den Prozess rekursiv für das Elternteil.
-            self._heapify_up(parent)
+            i = parent
+
+    # Stellt die Heap-Eigenschaft von einem gegebenen Index aus nach unten wieder her.
+    def _heapify_down(self, i: int) -> None:
+        heap = self.heap
+        size: int = len(heap)
+        while True:
+            # Bestimmt das Kind mit der niedrigsten Priorität.
+            smallest: int = i
+            left: int = 2 * i + 1
+            right: int = left + 1
+            if left < size and heap[left][0] < heap[smallest][0]:
+                smallest = left
+            if right < size and heap[right][0] < heap[smallest][0]:
+                smallest = right
+            if smallest == i:
+                break
+            self._swap(i, smallest)
+            i = smallest
 
     def _swap(self, i: int, j: int):
         self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
+        self.position[self.heap[i][1]] = i
+        self.position[self.heap[j][1]] = j
+
+class BucketQueue:
+    # Bucket-Warteschlange (Dial) für ganzzahlige, nicht-negative Prioritäten. Die Buckets werden zyklisch
+    # über Priorität mod (max_priority + 1) adressiert. Voraussetzung ist, dass alle gleichzeitig enthaltenen
+    # Prioritäten in einem Fenster der Breite max_priority liegen. Das gilt bei Prim (Schlüssel sind Kantengewichte
+    # aus 0..W) ebenso wie bei Dijkstra (Distanzen liegen monoton in [d, d + W]).
+    # Veraltete Einträge nach decrease_key werden beim Entnehmen übersprungen.
+    def __init__(self, max_priority: int) -> None:
+        self.size: int = max_priority + 1
+        self.buckets: List[List] = [[] for _ in range(self.size)]
+        # Aktueller Eintrag [Priorität, Element] jedes enthaltenen Elements.
+        self.entry: Dict[Hashable, List] = {}
+        # Kleinste Priorität, deren Bucket noch nicht leer sein könnte.
+        self.cursor: int = 0
+
+    def push(self, item: Hashable, priority: int) -> None:
+        # Ein enthaltenes Element erhält nur eine kleinere Priorität, wie bei decrease_key.
+        current = self.entry.get(item)
+        if current is None or priority < current[0]:
+            self._insert(item, priority)
+
+    def pop(self) -> Hashable:
+        if not self.entry:
+            raise IndexError("pop from empty BucketQueue")
+        buckets, size, entry = self.buckets, self.size, self.entry
+        while True:
+            bucket = buckets[self.cursor % size]
+            while bucket:
+                current = bucket.pop()
+                # Nur der aktuelle Eintrag eines Elements ist gültig.
+                if entry.get(current[1]) is current:
+                    del entry[current[1]]
+                    return current[1]
+            self.cursor += 1
+
+    def decrease_key(self, item: Hashable, priority: int) -> None:
+        if priority > self.entry[item][0]:
+            raise ValueError("decrease_key: new priority is larger than the current one")
+        self._insert(item, priority)
+
+    def empty(self) -> bool:
+        return not self.entry
+
+    def __len__(self) -> int:
+        return len(self.entry)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self.entry
+
+    def _insert(self, item: Hashable, priority: int) -> None:
+        if priority < 0:
+            raise ValueError("BucketQueue only supports non-negative priorities")
+        # Der Cursor springt zurück, falls die neue Priorität kleiner ist oder die Warteschlange leer war.
+        if priority < self.cursor or not self.entry:
+            self.cursor = priority
+        current: List = [priority, item]
+        self.entry[item] = current
+        self.buckets[priority % self.size].append(current)
+
+class RadixHeap:
+    # Radix-Heap für monotone Warteschlangen (z.B. Dijkstra) mit ganzzahligen, nicht-negativen Prioritäten:
+    # Neue Prioritäten dürfen nicht kleiner als die zuletzt entnommene sein. Bucket i enthält die Einträge,
+    # deren Priorität sich von der zuletzt entnommenen zuerst im Bit i-1 unterscheidet.
+    # Jeder Eintrag wandert höchstens O(log C) Mal in einen kleineren Bucket.
+    def __init__(self) -> None:
+        self.buckets: List[List] = [[] for _ in range(65)]
+        self.entry: Dict[Hashable, List] = {}
+        # Zuletzt entnommene Priorität.
+        self.last: int = 0
+
+    def push(self, item: Hashable, priority: int) -> None:
+        # Ein enthaltenes Element erhält nur eine kleinere Priorität, wie bei decrease_key.
+        current = self.entry.get(item)
+        if current is None or priority < current[0]:
+            self._insert(item, priority)
+
+    def pop(self) -> Hashable:
+        if not self.entry:
+            raise IndexError("pop from empty RadixHeap")
+        buckets, entry = self.buckets, self.entry
+        while True:
+            if not buckets[0]:
+                # Sucht den ersten nicht-leeren Bucket und verteilt seine gültigen Einträge neu.
+                i: int = 1
+                while not buckets[i]:
+                    i += 1
+                valid: List = [current for current in buckets[i] if entry.get(current[1]) is current]
+                buckets[i] = []
+                if not valid:
+                    continue
+                self.last = min(current[0] for current in valid)
+                for current in valid:
+                    buckets[self._bucket(current[0])].append(current)
+            current = buckets[0].pop()
+            if entry.get(current[1]) is current:
+                del entry[current[1]]
+                return current[1]
+
+    def decrease_key(self, item: Hashable, priority: int) -> None:
+        if priority > self.entry[item][0]:
+            raise ValueError("decrease_key: new priority is larger than the current one")
+        self._insert(item, priority)
+
+    def empty(self) -> bool:
+        return not self.entry
+
+    def __len__(self) -> int:
+        return len(self.entry)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self.entry
+
+    def _bucket(self, priority: int) -> int:
+        return (priority ^ self.last).bit_length()
+
+    def _insert(self, item: Hashable, priority: int) -> None:
+        if priority < self.last:
+            raise ValueError("RadixHeap is monotone: priority is smaller than the last popped one")
+        current: List = [priority, item]
+        self.entry[item] = current
+        i: int = self._bucket(priority)
+        # Sehr große Prioritäten benötigen zusätzliche Buckets.
+        while i >= len(self.buckets):
+            self.buckets.append([])
+        self.buckets[i].append(current)
+
+# Wählt anhand der Kantengewichte eine passende Warteschlange: Sind alle Gewichte ganzzahlig und nicht-negativ,
+# wird bis zur Schranke BUCKET_QUEUE_LIMIT eine BucketQueue verwendet, bei monotonen Anwendungen (Dijkstra)
+# darüber hinaus ein RadixHeap. Ansonsten wird der binäre Heap verwendet.
+def create_priority_queue(weights: Iterable, monotone: bool = False) -> Union[PriorityQueue, BucketQueue, RadixHeap]:
+    max_weight: int = 0
+    if hasattr(weights, "dtype"):
+        # Schneller Pfad für NumPy-Arrays.
+        if weights.dtype.kind not in "iu" or (len(weights) and weights.min() < 0):
+            return PriorityQueue()
+        max_weight = int(weights.max()) if len(weights) else 0
+    else:
+        for weight in weights:
+            if not isinstance(weight, Integral) or weight < 0:
+                return PriorityQueue()
+            if weight > max_weight:
+                max_weight = weight
+
+    if max_weight <= BUCKET_QUEUE_LIMIT:
+        return BucketQueue(int(max_weight))
+    if monotone:
+        return RadixHeap()
+    return PriorityQueue()
@@ -1,21 +1,45 @@
 import random
+import numpy as np
 import networkx as nx
 
 from itertools import combinations 
+from typing import Optional, Tuple
+from structs.random_graph_generator import sample_pairs, edge_probability
+from structs.csr_graph import CSRGraph
 
 class GenerateRandomDigraph: 
-    def __init__(self, n: int, p: int) -> None: 
+    def __init__(self, n: int, p: int, seed: Optional[int] = None) -> None: 
         self.n: int = n 
         self.p: int = p 
+        self.seed: Optional[int] = seed
         self.graph: nx.DiGraph = None 
  
     def generate(self) -> nx.DiGraph: 
         self.graph = nx.DiGraph() 
+        rng = random.Random(self.seed)
  
         if self.p > 100 or self.p < 0: 
             return self.graph 
  
         for node1, node2 in combinations(range(self.n), 2): 
-            if random.randint(0, 100) < self.p: 
-                self.graph.add_edge(node1, node2, capacity=random.randint(4,20)) 
+            if rng.randint(0, 100) < self.p: 
+                self.graph.add_edge(node1, node2, capacity=rng.randint(4,20)) 
         return self.graph 
+
+    # Vektorisierte Variante von generate, gibt die Kanten als Arrays (src, dst, capacity) zurück.
+    def generate_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self.p > 100 or self.p < 0:
+            return sample_pairs(0, 0, None) + (np.empty(0, dtype=np.int64),)
+        rng = np.random.default_rng(self.seed)
+        src, dst = sample_pairs(self.n, edge_probability(self.p), rng)
+        capacity: np.ndarray = rng.integers(4, 21, size=len(src))
+        return src, dst, capacity
+
+    def generate_fast(self) -> nx.DiGraph:
+        src, dst, capacity = self.generate_arrays()
+        self.graph = nx.DiGraph()
+        self.graph.add_weighted_edges_from(zip(src.tolist(), dst.tolist(), capacity.tolist()), weight='capacity')
+        return self.graph
+
+    def generate_csr(self) -> CSRGraph:
+        return CSRGraph.from_edges(self.n, *self.generate_arrays(), directed=True)
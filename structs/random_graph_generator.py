@@ -1,18 +1,24 @@
 import random
+import numpy as np
 import networkx as nx
 
 from itertools import combinations
+from typing import Optional, Tuple
+from structs.csr_graph import CSRGraph
 
 class GenerateRandomGraph:
-    def __init__(self, n: int, p: int) -> None:
+    def __init__(self, n: int, p: int, seed: Optional[int] = None) -> None:
         # Anzahl der Knoten im Graphen
         self.n: int = n
         # Wahrscheinlichkeit (in Prozent) einer Kante zwischen zwei Knoten
         self.p: int = p
+        # Startwert des Zufallsgenerators für reproduzierbare Graphen
+        self.seed: Optional[int] = seed
         self.graph: nx.Graph = None
 
     def generate(self) -> nx.Graph:
         self.graph = nx.empty_graph(self.n)
+        rng = random.Random(self.seed)
 
         # Überprüfung, ob die Wahrscheinlichkeit p im gültigen Bereich liegt
         if self.p > 100 or self.p < 0:
@@ -22,7 +28,66 @@ class GenerateRandomGraph:
         # Iteration über alle möglichen Kombinationen von zwei Knoten im Graphen
         for node1, node2 in combinations(range(self.n), 2):
             # Entscheidung, ob eine Kante zwischen node1 und node2 basierend auf der Wahrscheinlichkeit p hinzugefügt wird
-            if random.randint(0, 100) < self.p:
+            if rng.randint(0, 100) < self.p:
                 # Hinzufügen einer Kante mit zufälligem Gewicht zwischen 1 und 10
-                self.graph.add_edge(node1, node2, weight=random.randint(1,10))
+                self.graph.add_edge(node1, node2, weight=rng.randint(1,10))
         return self.graph
+
+    # Erzeugt denselben Zufallsgraphen vektorisiert als Kanten-Arrays (src, dst, weight) ohne Schleife über alle Knotenpaare.
+    def generate_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self.p > 100 or self.p < 0:
+            return sample_pairs(0, 0, None) + (np.empty(0, dtype=np.int64),)
+        rng = np.random.default_rng(self.seed)
+        src, dst = sample_pairs(self.n, edge_probability(self.p), rng)
+        # Gewichte werden in einem Aufruf gezogen, gleichverteilt zwischen 1 und 10
+        weight: np.ndarray = rng.integers(1, 11, size=len(src))
+        return src, dst, weight
+
+    # Baut den networkx-Graphen in einem Aufruf aus den Kanten-Arrays auf.
+    def generate_fast(self) -> nx.Graph:
+        src, dst, weight = self.generate_arrays()
+        self.graph = nx.empty_graph(self.n)
+        self.graph.add_weighted_edges_from(zip(src.tolist(), dst.tolist(), weight.tolist()))
+        return self.graph
+
+    # Erzeugt den Zufallsgraphen direkt in CSR-Darstellung, z.B. zum Speichern mit structs.graph_file.
+    def generate_csr(self) -> CSRGraph:
+        return CSRGraph.from_edges(self.n, *self.generate_arrays())
+
+# generate() fügt eine Kante ein, falls randint(0, 100) < p gilt. Da randint beide Grenzen einschließt,
+# entspricht das einer Kantenwahrscheinlichkeit von p / 101, die hier für die vektorisierte Variante übernommen wird.
+def edge_probability(p: int) -> float:
+    return min(max(p, 0), 101) / 101
+
+# Zieht die Knotenpaare (i, j) mit i < j eines G(n, p)-Graphen mit geometrischen Sprüngen (Batagelj–Brandes):
+# Die Abstände zwischen zwei gezogenen Paaren im linearen Index der oberen Dreiecksmatrix sind geometrisch verteilt,
+# sodass der Aufwand proportional zur Anzahl der Kanten statt zur Anzahl der Knotenpaare ist.
+def sample_pairs(n: int, probability: float, rng: Optional[np.random.Generator]) -> Tuple[np.ndarray, np.ndarray]:
+    total: int = n * (n - 1) // 2
+    if total == 0 or probability <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    if probability >= 1:
+        index: np.ndarray = np.arange(total, dtype=np.int64)
+    else:
+        # Die Sprünge werden blockweise gezogen, ein Block reicht in aller Regel für alle Kanten aus.
+        expected: float = total * probability
+        chunk: int = int(expected + 5 * np.sqrt(expected) + 16)
+        parts = []
+        position: int = -1
+        while True:
+            gaps: np.ndarray = rng.geometric(probability, size=chunk)
+            part: np.ndarray = position + np.cumsum(gaps)
+            part = part[part < total]
+            parts.append(part)
+            if len(part) < chunk:
+                break
+            position = int(part[-1])
+        index = np.concatenate(parts)
+
+    # Rückrechnung des linearen Index in (Zeile, Spalte) über die Startindizes der Zeilen.
+    rows = np.arange(n, dtype=np.int64)
+    starts: np.ndarray = rows * (2 * n - rows - 1) // 2
+    src: np.ndarray = np.searchsorted(starts, index, side='right') - 1
+    dst: np.ndarray = index - starts[src] + src + 1
+    return src, dst
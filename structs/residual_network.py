@@ -0,0 +1,108 @@
+import numpy as np
+
+from typing import Dict, Hashable, List, Set, Tuple
+from structs.csr_graph import CSRGraph
+
+class ResidualNetwork:
+    # Residualnetzwerk für Flussalgorithmen als flache Bogen-Arrays. Kante i des Graphen (Kanten-Id aus CSRGraph)
+    # erhält den Vorwärtsbogen 2 * i und den Rückwärtsbogen 2 * i + 1, der Gegenbogen von a ist also a ^ 1.
+    # Eine Augmentierung ändert nur residual[a] und residual[a ^ 1] an Ort und Stelle, es werden keine Bögen
+    # eingefügt oder gelöscht. Bei ungerichteten Graphen haben beide Bögen die Kapazität der Kante.
+    #
+    # Die Arrays liegen als Python-Listen vor, da die Flussalgorithmen in Python-Schleifen elementweise darauf
+    # zugreifen und einzelne Zugriffe auf numpy-Arrays dort deutlich langsamer sind.
+    def __init__(self, graph: CSRGraph) -> None:
+        self.graph: CSRGraph = graph
+        n: int = graph.number_of_nodes()
+        src, dst, capacity = graph.edges()
+        m: int = len(src)
+        capacity = np.asarray(capacity)
+
+        tail = np.empty(2 * m, dtype=np.int64)
+        head = np.empty(2 * m, dtype=np.int64)
+        tail[0::2], tail[1::2] = src, dst
+        head[0::2], head[1::2] = dst, src
+        arc_capacity = np.zeros(2 * m, dtype=capacity.dtype if m else np.int64)
+        arc_capacity[0::2] = capacity
+        if not graph.is_directed():
+            arc_capacity[1::2] = capacity
+
+        # Ausgehende Bögen jedes Knotens im CSR-Format: arcs[first[u]:first[u + 1]].
+        order: np.ndarray = np.argsort(tail, kind='stable')
+        first = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(tail, minlength=n), out=first[1:])
+
+        self.n: int = n
+        self.m: int = m
+        self.head: List[int] = head.tolist()
+        self.capacity: List = arc_capacity.tolist()
+        self.residual: List = list(self.capacity)
+        self.first: List[int] = first.tolist()
+        self.arcs: List[int] = order.tolist()
+
+    # Setzt den Fluss auf 0 zurück.
+    def reset(self) -> None:
+        self.residual = list(self.capacity)
+
+    def tail(self, arc: int) -> int:
+        return self.head[arc ^ 1]
+
+    # Schickt amount Einheiten über Bogen arc, der Gegenbogen erhält die Kapazität zurück.
+    def push(self, arc: int, amount) -> None:
+        self.residual[arc] -= amount
+        self.residual[arc ^ 1] += amount
+
+    # Fluss auf Kante i. Bei ungerichteten Kanten ist ein negativer Wert ein Fluss von v nach u.
+    def flow(self, edge: int):
+        return self.capacity[2 * edge] - self.residual[2 * edge]
+
+    def flows(self) -> np.ndarray:
+        return np.array(self.capacity[0::2]) - np.array(self.residual[0::2])
+
+    # Wert des Flusses als Nettozufluss in t.
+    def value(self, t: int):
+        residual, capacity = self.residual, self.capacity
+        return sum(capacity[a ^ 1] - residual[a ^ 1] for a in self.arcs[self.first[t]:self.first[t + 1]])
+
+    # Breitensuche im Residualnetzwerk ab s über Bögen mit positiver Restkapazität.
+    # Gibt den Abstand jedes Knotens zurück, -1 für nicht erreichbare Knoten.
+    def levels(self, s: int) -> List[int]:
+        first, arcs, head, residual = self.first, self.arcs, self.head, self.residual
+        level: List[int] = [-1] * self.n
+        level[s] = 0
+        queue: List[int] = [s]
+        for u in queue:
+            next_level: int = level[u] + 1
+            for i in range(first[u], first[u + 1]):
+                a: int = arcs[i]
+                v: int = head[a]
+                if level[v] == -1 and residual[a] > 0:
+                    level[v] = next_level
+                    queue.append(v)
+        return level
+
+    # s-Seite eines minimalen Schnitts nach einem maximalen Fluss: alle von s im Residualnetzwerk erreichbaren
+    # Knoten, als boolesches Array über die dichten Ids.
+    def source_side(self, s: int) -> np.ndarray:
+        return np.array(self.levels(s)) >= 0
+
+    # Minimaler s-t-Schnitt nach einem maximalen Fluss als Partition der Bezeichner wie bei nx.minimum_cut.
+    def min_cut(self, s: int) -> Tuple[Set[Hashable], Set[Hashable]]:
+        labels: List[Hashable] = self.graph.to_labels(range(self.n))
+        side: List[bool] = self.source_side(s).tolist()
+        return {label for label, inside in zip(labels, side) if inside}, {label for label, inside in zip(labels, side) if not inside}
+
+    # Fluss als Dictionary von Dictionaries mit den ursprünglichen Bezeichnern wie bei nx.maximum_flow.
+    # Parallele Kanten werden zusammengefasst, bei ungerichteten Graphen wird der Nettofluss je Richtung angegeben.
+    def flow_dict(self) -> Dict[Hashable, Dict[Hashable, int]]:
+        graph: CSRGraph = self.graph
+        labels: List[Hashable] = graph.to_labels(range(self.n))
+        result: Dict[Hashable, Dict[Hashable, int]] = {label: {} for label in labels}
+        head = self.head
+        for edge, flow in enumerate(self.flows().tolist()):
+            u, v = labels[head[2 * edge + 1]], labels[head[2 * edge]]
+            if not graph.is_directed():
+                result[v][u] = result[v].get(u, 0) + max(-flow, 0)
+                flow = max(flow, 0)
+            result[u][v] = result[u].get(v, 0) + flow
+        return result
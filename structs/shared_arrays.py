@@ -0,0 +1,57 @@
+import numpy as np
+
+from multiprocessing import shared_memory
+from typing import Dict, List, Tuple
+
+# NumPy-Arrays in Shared Memory, damit Worker-Prozesse große Graphen ohne Kopie und ohne Pickling lesen können.
+# Der Elternprozess legt die Arrays mit SharedArrays an und übergibt spec() an die Worker,
+# die sie mit attach() als Sichten auf denselben Speicher einblenden.
+
+# Beschreibung eines Arrays: (Name, Name des Shared-Memory-Blocks, dtype, Form).
+Spec = List[Tuple[str, str, str, Tuple[int, ...]]]
+
+class SharedArrays:
+    def __init__(self, arrays: Dict[str, np.ndarray]) -> None:
+        self.blocks: List[shared_memory.SharedMemory] = []
+        self.arrays: Dict[str, np.ndarray] = {}
+        self._spec: Spec = []
+        for name, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            # Shared-Memory-Blöcke dürfen nicht leer sein.
+            block = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+            view: np.ndarray = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+            view[...] = array
+            self.blocks.append(block)
+            self.arrays[name] = view
+            self._spec.append((name, block.name, array.dtype.str, array.shape))
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.arrays[name]
+
+    def spec(self) -> Spec:
+        return self._spec
+
+    # Gibt die Blöcke frei. Sichten aus self.arrays dürfen danach nicht mehr verwendet werden.
+    def close(self) -> None:
+        self.arrays = {}
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = []
+
+    def __enter__(self) -> "SharedArrays":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+# Blendet die Arrays eines spec() im Worker ein. Die Blöcke werden mit zurückgegeben und müssen so lange
+# referenziert bleiben, wie die Arrays verwendet werden.
+def attach(spec: Spec) -> Tuple[Dict[str, np.ndarray], List[shared_memory.SharedMemory]]:
+    arrays: Dict[str, np.ndarray] = {}
+    blocks: List[shared_memory.SharedMemory] = []
+    for name, block_name, dtype, shape in spec:
+        block = shared_memory.SharedMemory(name=block_name)
+        arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        blocks.append(block)
+    return arrays, blocks
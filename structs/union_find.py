@@ -1,4 +1,7 @@
-from typing import List, Dict
+import numpy as np
+
+from array import array
+from typing import List, Dict, Iterable, Hashable, Union
 
 class UnionFind:
     def __init__(self, elements: List) -> None:
@@ -13,7 +16,7 @@ class UnionFind:
             # Pfadkompression:  Verbinde x direkt mit seinem Wurzelknoten.
             self.parent[x] = self.find(self.parent[x])
         return self.parent[x]
-    
+
     # Vereinigt zwei Mengen basierend auf den Rängen ihrer Wurzeln.
     def union(self, x: int, y: int) -> None:
         # Findet die Wurzelknoten von x und y.
@@ -38,4 +41,179 @@ class UnionFind:
         new_instance = UnionFind(list(self.parent.keys()))
         new_instance.parent = self.parent.copy()
         new_instance.rank = self.rank.copy()
-        return new_instance
\ No newline at end of file
+        return new_instance
+
+class ArrayUnionFind:
+    # Kompakte Variante von UnionFind: Eltern und Ränge liegen in zusammenhängenden Integer-Arrays,
+    # beliebige Knotenbezeichner werden einmalig auf dichte Ids 0..n-1 abgebildet.
+    # Wird eine ganze Zahl n übergeben, sind die Elemente bereits die dichten Ids 0..n-1.
+    def __init__(self, elements: Union[Iterable[Hashable], int]) -> None:
+        if isinstance(elements, int):
+            self.labels: List = None
+            self.index: Dict = None
+            n: int = elements
+        else:
+            self.labels = list(elements)
+            self.index = {label: i for i, label in enumerate(self.labels)}
+            n = len(self.labels)
+        self.parent: array = array('l', range(n))
+        # Ränge sind durch log2(n) beschränkt, ein Byte pro Knoten reicht daher aus.
+        self.rank: array = array('B', bytes(n))
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    # Findet die Wurzel einer dichten Id iterativ mit Pfadhalbierung.
+    def _find(self, i: int) -> int:
+        parent = self.parent
+        while parent[i] != i:
+            # Pfadhalbierung: Jeder zweite Knoten auf dem Pfad zeigt danach auf seinen Großelternteil.
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # Vereinigt die Mengen zweier dichter Ids und gibt zurück, ob tatsächlich vereinigt wurde.
+    def _union(self, i: int, j: int) -> bool:
+        root_i: int = self._find(i)
+        root_j: int = self._find(j)
+        if root_i == root_j:
+            return False
+        rank = self.rank
+        if rank[root_i] < rank[root_j]:
+            root_i, root_j = root_j, root_i
+        self.parent[root_j] = root_i
+        if rank[root_i] == rank[root_j]:
+            rank[root_i] += 1
+        return True
+
+    def find(self, x: Hashable) -> Hashable:
+        if self.index is None:
+            return self._find(x)
+        return self.labels[self._find(self.index[x])]
+
+    def union(self, x: Hashable, y: Hashable) -> None:
+        if self.index is None:
+            self._union(x, y)
+        else:
+            self._union(self.index[x], self.index[y])
+
+    # Findet die Wurzeln mehrerer Elemente in einem Aufruf. Die Elemente werden auf dichte Ids abgebildet und
+    # ihre Wurzeln mit NumPy per Pointer Jumping auf einer Sicht des Eltern-Arrays bestimmt.
+    def find_many(self, elements: Iterable[Hashable]) -> List:
+        if self.index is None:
+            ids: np.ndarray = np.fromiter(elements, dtype=np.int64)
+            return self._find_ids(ids).tolist()
+        index, labels = self.index, self.labels
+        ids = np.fromiter((index[x] for x in elements), dtype=np.int64)
+        return [labels[i] for i in self._find_ids(ids).tolist()]
+
+    # Wurzeln eines Arrays dichter Ids: Alle Ids rücken gleichzeitig zu ihrem Elternteil vor, bis sich keine mehr
+    # ändert. Danach zeigen die angefragten Ids direkt auf ihre Wurzel (Pfadkompression nur für diese Ids).
+    def _find_ids(self, ids: np.ndarray) -> np.ndarray:
+        parent: np.ndarray = np.frombuffer(self.parent, dtype=np.dtype('l'))
+        current: np.ndarray = parent[ids]
+        while True:
+            grandparent: np.ndarray = parent[current]
+            if np.array_equal(grandparent, current):
+                break
+            current = grandparent
+        parent[ids] = current
+        return current
+
+    # Vereinigt die Paare (xs[k], ys[k]) und gibt für jedes Paar zurück, ob dabei zwei Mengen vereinigt wurden.
+    # Damit lässt sich z.B. bei Kruskal direkt ablesen, welche Kanten in den Wald aufgenommen werden.
+    # Die Vereinigungen hängen voneinander ab und werden daher nacheinander in Python ausgeführt, gespart wird
+    # nur der Aufruf pro Paar.
+    def union_many(self, xs: Iterable[Hashable], ys: Iterable[Hashable]) -> List[bool]:
+        union = self._union
+        if self.index is None:
+            return [union(i, j) for i, j in zip(xs, ys)]
+        index = self.index
+        return [union(index[x], index[y]) for x, y in zip(xs, ys)]
+
+    # Gibt die Wurzeln aller dichten Ids als NumPy-Array zurück. Per Pointer Jumping auf einer Sicht des
+    # Eltern-Arrays werden dabei alle Pfade vollständig komprimiert.
+    def roots(self) -> np.ndarray:
+        parent: np.ndarray = np.frombuffer(self.parent, dtype=np.dtype('l'))
+        while True:
+            grandparent: np.ndarray = parent[parent]
+            if np.array_equal(grandparent, parent):
+                return grandparent
+            parent[:] = grandparent
+
+    def copy(self) -> "ArrayUnionFind":
+        new_instance = self.__class__.__new__(self.__class__)
+        # Die Abbildung der Bezeichner ist unveränderlich und kann geteilt werden.
+        new_instance.labels = self.labels
+        new_instance.index = self.index
+        new_instance.parent = array('l', self.parent)
+        new_instance.rank = array('B', self.rank)
+        return new_instance
+
+class RollbackUnionFind(ArrayUnionFind):
+    # Union-by-Rank ohne Pfadkompression mit Undo-Log. Ohne Pfadkompression ändert find nichts,
+    # sodass jede Vereinigung durch genau einen Log-Eintrag rückgängig gemacht werden kann.
+    # Ein Aufruf kostet O(log n), ein Zurücksetzen O(Anzahl der rückgängig gemachten Vereinigungen).
+    def __init__(self, elements: Union[Iterable[Hashable], int]) -> None:
+        super().__init__(elements)
+        # Einträge (angehängte Wurzel, ob der Rang der neuen Wurzel erhöht wurde).
+        self.log: List = []
+
+    def _find(self, i: int) -> int:
+        parent = self.parent
+        while parent[i] != i:
+            i = parent[i]
+        return i
+
+    def _union(self, i: int, j: int) -> bool:
+        root_i: int = self._find(i)
+        root_j: int = self._find(j)
+        if root_i == root_j:
+            return False
+        rank = self.rank
+        if rank[root_i] < rank[root_j]:
+            root_i, root_j = root_j, root_i
+        self.parent[root_j] = root_i
+        increased: bool = rank[root_i] == rank[root_j]
+        if increased:
+            rank[root_i] += 1
+        self.log.append((root_j, increased))
+        return True
+
+    # Wie ArrayUnionFind.roots, aber ohne das Eltern-Array zu verändern, da das Undo-Log sonst ungültig würde.
+    def roots(self) -> np.ndarray:
+        parent: np.ndarray = np.array(self.parent, dtype=np.int64)
+        while True:
+            grandparent: np.ndarray = parent[parent]
+            if np.array_equal(grandparent, parent):
+                return grandparent
+            parent = grandparent
+
+    # Wie ArrayUnionFind._find_ids, aber ohne die Ids an ihre Wurzeln zu hängen.
+    def _find_ids(self, ids: np.ndarray) -> np.ndarray:
+        parent: np.ndarray = np.frombuffer(self.parent, dtype=np.dtype('l'))
+        current: np.ndarray = parent[ids]
+        while True:
+            grandparent: np.ndarray = parent[current]
+            if np.array_equal(grandparent, current):
+                return current
+            current = grandparent
+
+    # Gibt einen Zeitpunkt zurück, auf den später mit rollback zurückgesetzt werden kann.
+    def checkpoint(self) -> int:
+        return len(self.log)
+
+    # Macht alle Vereinigungen seit dem gegebenen Zeitpunkt in umgekehrter Reihenfolge rückgängig.
+    def rollback(self, checkpoint: int = 0) -> None:
+        log, parent, rank = self.log, self.parent, self.rank
+        while len(log) > checkpoint:
+            root_j, increased = log.pop()
+            root_i = parent[root_j]
+            parent[root_j] = root_j
+            if increased:
+                rank[root_i] -= 1
+
+    def copy(self) -> "RollbackUnionFind":
+        new_instance = super().copy()
+        new_instance.log = list(self.log)
+        return new_instance
@@ -0,0 +1,187 @@
+import random
+import networkx as nx
+
+from abc import ABC, abstractmethod
+from networkx.algorithms import bipartite
+from typing import Dict, Optional, Type
+
+# Reproduzierbare Benchmark-Workloads. Jede Familie ist eine Klasse mit generate() wie GenerateRandomGraph,
+# die Größenstufen S/M/L/XL sind als Konstruktorparameter in PRESETS hinterlegt.
+# Alle Graphen haben ganzzahlige Knoten 0..n-1, ungerichtete Graphen tragen 'weight', Flussnetzwerke 'capacity'.
+
+SIZES = ("S", "M", "L", "XL")
+
+class Workload(ABC):
+    PRESETS: Dict[str, Dict] = {}
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        self.seed: Optional[int] = seed
+        self.random = random.Random(seed)
+        self.graph: nx.Graph = None
+
+    @classmethod
+    def preset(cls, size: str, seed: Optional[int] = None) -> "Workload":
+        return cls(**cls.PRESETS[size], seed=seed)
+
+    @abstractmethod
+    def generate(self) -> nx.Graph:
+        pass
+
+    # Weist allen Kanten zufällige ganzzahlige Gewichte aus [low, high] zu.
+    def assign_weights(self, graph: nx.Graph, low: int, high: int, name: str = 'weight') -> None:
+        for u, v in graph.edges():
+            graph[u][v][name] = self.random.randint(low, high)
+
+class GridWorkload(Workload):
+    # Straßenähnliches Gitter: rows x cols Knoten mit Nachbarkanten, ein Teil der Kanten fällt weg (Baustellen),
+    # vereinzelte Diagonalen bilden Abkürzungen.
+    PRESETS = {
+        "S": {"rows": 30, "cols": 30},
+        "M": {"rows": 100, "cols": 100},
+        "L": {"rows": 300, "cols": 300},
+        "XL": {"rows": 1000, "cols": 1000},
+    }
+
+    def __init__(self, rows: int, cols: int, drop: float = 0.05, diagonals: float = 0.02, seed: Optional[int] = None) -> None:
+        super().__init__(seed)
+        self.rows: int = rows
+        self.cols: int = cols
+        self.drop: float = drop
+        self.diagonals: float = diagonals
+
+    def generate(self) -> nx.Graph:
+        graph: nx.Graph = nx.empty_graph(self.rows * self.cols)
+        for r in range(self.rows):
+            for c in range(self.cols):
+                node: int = r * self.cols + c
+                if c + 1 < self.cols and self.random.random() >= self.drop:
+                    graph.add_edge(node, node + 1)
+                if r + 1 < self.rows and self.random.random() >= self.drop:
+                    graph.add_edge(node, node + self.cols)
+                if r + 1 < self.rows and c + 1 < self.cols and self.random.random() < self.diagonals:
+                    graph.add_edge(node, node + self.cols + 1)
+        self.assign_weights(graph, 1, 10)
+        self.graph = graph
+        return graph
+
+class GeometricWorkload(Workload):
+    # Zufälliger geometrischer Graph im Einheitsquadrat, Kantengewichte sind die auf ganze Zahlen skalierten Abstände.
+    PRESETS = {
+        "S": {"n": 1000, "radius": 0.06},
+        "M": {"n": 10000, "radius": 0.02},
+        "L": {"n": 100000, "radius": 0.006},
+        "XL": {"n": 1000000, "radius": 0.002},
+    }
+
+    def __init__(self, n: int, radius: float, scale: int = 1000, seed: Optional[int] = None) -> None:
+        super().__init__(seed)
+        self.n: int = n
+        self.radius: float = radius
+        self.scale: int = scale
+
+    def generate(self) -> nx.Graph:
+        graph: nx.Graph = nx.random_geometric_graph(self.n, self.radius, seed=self.seed)
+        pos: Dict = nx.get_node_attributes(graph, 'pos')
+        for u, v in graph.edges():
+            distance: float = sum((a - b) ** 2 for a, b in zip(pos[u], pos[v])) ** 0.5
+            graph[u][v]['weight'] = max(1, round(distance * self.scale))
+        self.graph = graph
+        return graph
+
+class PowerLawWorkload(Workload):
+    # Barabási–Albert-Graph mit stark schiefer Gradverteilung (wenige Knoten mit sehr hohem Grad).
+    PRESETS = {
+        "S": {"n": 1000, "m": 3},
+        "M": {"n": 10000, "m": 4},
+        "L": {"n": 100000, "m": 5},
+        "XL": {"n": 1000000, "m": 5},
+    }
+
+    def __init__(self, n: int, m: int, seed: Optional[int] = None) -> None:
+        super().__init__(seed)
+        self.n: int = n
+        self.m: int = m
+
+    def generate(self) -> nx.Graph:
+        graph: nx.Graph = nx.barabasi_albert_graph(self.n, self.m, seed=self.seed)
+        self.assign_weights(graph, 1, 10)
+        self.graph = graph
+        return graph
+
+class BipartiteWorkload(Workload):
+    # Gewichteter bipartiter Graph mit n Knoten je Seite wie in hungarian.py, Knotenattribut 'bipartite' ist 0 oder 1.
+    PRESETS = {
+        "S": {"n": 20, "p": 0.5},
+        "M": {"n": 100, "p": 0.2},
+        "L": {"n": 500, "p": 0.05},
+        "XL": {"n": 2000, "p": 0.02},
+    }
+
+    def __init__(self, n: int, p: float, seed: Optional[int] = None) -> None:
+        super().__init__(seed)
+        self.n: int = n
+        self.p: float = p
+
+    def generate(self) -> nx.Graph:
+        graph: nx.Graph = bipartite.random_graph(self.n, self.n, self.p, seed=self.seed)
+        self.assign_weights(graph, 1, 15)
+        self.graph = graph
+        return graph
+
+class LayeredFlowWorkload(Workload):
+    # Geschichtetes s-t-Netzwerk: Quelle 0, `layers` Schichten mit je `width` Knoten, Senke n-1.
+    # Zwischen benachbarten Schichten liegen Kanten mit zufälliger Kapazität, schwache Rückkanten zur
+    # vorherigen Schicht erzeugen lange, verschachtelte augmentierende Pfade.
+    # Quelle und Senke stehen in graph.graph['source'] bzw. graph.graph['sink'].
+    PRESETS = {
+        "S": {"layers": 5, "width": 10},
+        "M": {"layers": 20, "width": 50},
+        "L": {"layers": 50, "width": 200},
+        "XL": {"layers": 100, "width": 1000},
+    }
+
+    def __init__(self, layers: int, width: int, degree: int = 3, back_arcs: float = 0.1, max_capacity: int = 100, seed: Optional[int] = None) -> None:
+        super().__init__(seed)
+        self.layers: int = layers
+        self.width: int = width
+        self.degree: int = degree
+        self.back_arcs: float = back_arcs
+        self.max_capacity: int = max_capacity
+
+    def generate(self) -> nx.DiGraph:
+        graph = nx.DiGraph()
+        source: int = 0
+        sink: int = self.layers * self.width + 1
+        graph.add_nodes_from(range(sink + 1))
+
+        def layer(i: int) -> range:
+            return range(1 + i * self.width, 1 + (i + 1) * self.width)
+
+        for v in layer(0):
+            graph.add_edge(source, v, capacity=self.random.randint(1, self.max_capacity) * self.degree)
+        for i in range(self.layers - 1):
+            current, following = layer(i), layer(i + 1)
+            for u in current:
+                for v in self.random.sample(following, min(self.degree, self.width)):
+                    graph.add_edge(u, v, capacity=self.random.randint(1, self.max_capacity))
+                    if self.random.random() < self.back_arcs:
+                        graph.add_edge(v, u, capacity=self.random.randint(1, max(1, self.max_capacity // 10)))
+        for u in layer(self.layers - 1):
+            graph.add_edge(u, sink, capacity=self.random.randint(1, self.max_capacity) * self.degree)
+
+        graph.graph['source'] = source
+        graph.graph['sink'] = sink
+        self.graph = graph
+        return graph
+
+WORKLOADS: Dict[str, Type[Workload]] = {
+    "grid": GridWorkload,
+    "geometric": GeometricWorkload,
+    "power_law": PowerLawWorkload,
+    "bipartite": BipartiteWorkload,
+    "layered_flow": LayeredFlowWorkload,
+}
+
+# Erzeugt die Workload einer Familie in einer Größenstufe, gleicher Seed ergibt denselben Graphen.
+def generate_workload(family: str, size: str = "S", seed: int = 0) -> nx.Graph:
+    return WORKLOADS[family].preset(size, seed=seed).generate()